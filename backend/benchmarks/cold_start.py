@@ -0,0 +1,135 @@
+"""
+Cold-start benchmark for the Lambda entry point.
+
+Runs `python -X importtime -c "import lambda_function"` in fresh interpreters from src/ and
+reports the median cumulative import time and the slowest modules. It then times importing the
+handler and answering a first health-check invocation in fresh interpreters. Deferring imports
+only moves FastAPI, Mangum and the app onto the first invocation, so the cold start a client sees
+is the import plus that first invocation. Exits non-zero when either the import time or that
+total exceeds its budget.
+
+    python benchmarks/cold_start.py --runs 10 --budget-ms 500 --import-budget-ms 50 --output cold_start.json
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+SRC_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src")
+
+# Cumulative import time allowed for `import lambda_function`, in milliseconds
+IMPORT_BUDGET_MS = 50.0
+
+# Import plus first invocation allowed, in milliseconds
+COLD_START_BUDGET_MS = 500.0
+
+# Time a first invocation of the handler on a health-check event, in a fresh interpreter
+INVOKE_SNIPPET = """
+import json, time
+started = time.perf_counter()
+from lambda_function import lambda_handler
+imported = time.perf_counter()
+event = {
+    "version": "2.0", "routeKey": "GET /", "rawPath": "/", "rawQueryString": "", "headers": {},
+    "requestContext": {"http": {"method": "GET", "path": "/", "protocol": "HTTP/1.1", "sourceIp": "127.0.0.1",
+                       "userAgent": "benchmark"}, "stage": "$default"},
+    "isBase64Encoded": False,
+}
+response = lambda_handler(event, None)
+finished = time.perf_counter()
+print(json.dumps({"status": response["statusCode"], "import_ms": (imported - started) * 1000,
+                  "first_invoke_ms": (finished - imported) * 1000}))
+"""
+
+
+def parse_importtime(stderr):
+    """Parse -X importtime output into {module: (self_us, cumulative_us)}"""
+    modules = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:") :].split("|")
+        modules[name.strip()] = (int(self_us), int(cumulative_us))
+    return modules
+
+
+def measure_imports(module):
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=SRC_DIR,
+        capture_output=True,
+        text=True,
+        check=True,
+        env={**os.environ, "PYTHONDONTWRITEBYTECODE": "1"},
+    )
+    return parse_importtime(result.stderr)
+
+
+def measure_invoke():
+    result = subprocess.run(
+        [sys.executable, "-c", INVOKE_SNIPPET], cwd=SRC_DIR, capture_output=True, text=True, check=True
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--module", default="lambda_function", help="module to import (default: lambda_function)")
+    parser.add_argument("--runs", type=int, default=5, help="fresh interpreters to measure (default: 5)")
+    parser.add_argument(
+        "--budget-ms", type=float, default=COLD_START_BUDGET_MS, help="import plus first invocation budget in ms"
+    )
+    parser.add_argument("--import-budget-ms", type=float, default=IMPORT_BUDGET_MS, help="import time budget in ms")
+    parser.add_argument("--top", type=int, default=10, help="number of slowest modules to report")
+    parser.add_argument("--output", help="write results as JSON to this file")
+    args = parser.parse_args()
+
+    runs = [measure_imports(args.module) for _ in range(args.runs)]
+    totals_ms = [run[args.module][1] / 1000 for run in runs]
+    median_ms = statistics.median(totals_ms)
+
+    # Slowest modules by self time, from the median run
+    median_run = runs[totals_ms.index(sorted(totals_ms)[len(totals_ms) // 2])]
+    slowest = sorted(median_run.items(), key=lambda item: item[1][0], reverse=True)[: args.top]
+
+    invocations = [measure_invoke() for _ in range(args.runs)]
+    first_invoke_ms = statistics.median(run["first_invoke_ms"] for run in invocations)
+    cold_start_ms = statistics.median(run["import_ms"] + run["first_invoke_ms"] for run in invocations)
+
+    results = {
+        "module": args.module,
+        "python": sys.version.split()[0],
+        "runs": args.runs,
+        "import_ms": {"median": median_ms, "min": min(totals_ms), "max": max(totals_ms)},
+        "first_invoke_ms": first_invoke_ms,
+        "cold_start_ms": cold_start_ms,
+        "import_budget_ms": args.import_budget_ms,
+        "budget_ms": args.budget_ms,
+        "within_budget": median_ms <= args.import_budget_ms and cold_start_ms <= args.budget_ms,
+        "slowest_modules": [
+            {"module": name, "self_ms": s / 1000, "cumulative_ms": c / 1000} for name, (s, c) in slowest
+        ],
+    }
+
+    print(
+        f"import {args.module}: median {median_ms:.1f} ms over {args.runs} runs (budget {args.import_budget_ms:.1f} ms)"
+    )
+    for module in results["slowest_modules"]:
+        print(f"  {module['self_ms']:8.2f} ms  {module['module']}")
+    print(f"first invocation: median {first_invoke_ms:.1f} ms")
+    print(f"import + first invocation: median {cold_start_ms:.1f} ms (budget {args.budget_ms:.1f} ms)")
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+
+    if not results["within_budget"]:
+        print("Cold start is over budget", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
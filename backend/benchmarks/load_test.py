@@ -0,0 +1,257 @@
+"""
+End-to-end load test through the Lambda entry point and the uvicorn-served app.
+
+Starts the stub LinkedIn upstream (tests/stub_linkedin.py) on localhost serving the recorded
+GraphQL response, with --latency seconds per upstream call and a random --error-rate share of 503s,
+and points the app at it through LINKEDIN_BASE_URL. Then, for each --target:
+
+    lambda   --concurrency worker processes, each standing in for a warm Lambda container: it
+             imports lambda_function and calls lambda_handler with the event from --event
+             (misc/examples/lambda-test-event.json), one invocation at a time as Lambda does
+    uvicorn  src/main.py served by uvicorn in a subprocess, with --concurrency requests in flight
+
+Each target runs for --duration seconds after one unmeasured warm-up request per worker, and
+reports requests per second, p50/p99 latency, response statuses, upstream calls and the median of
+each stage in the responses' Server-Timing headers. --cold drops the held game and the solution
+cache before every request, so each one goes upstream and solves again.
+
+    python benchmarks/load_test.py --target lambda uvicorn --concurrency 4 --duration 10
+    python benchmarks/load_test.py --target lambda --cold --latency 0.05 --error-rate 0.1 --output load.json
+"""
+
+import argparse
+import asyncio
+import json
+import multiprocessing
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import time
+from collections import Counter
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SRC_DIR = os.path.join(BACKEND_DIR, "src")
+EXAMPLES_DIR = os.path.join(os.path.dirname(BACKEND_DIR), "misc", "examples")
+sys.path.insert(0, BACKEND_DIR)
+
+from tests.stub_linkedin import GRAPHQL_PATH, StubLinkedIn  # noqa: E402
+
+# Seconds allowed for every worker (or the server) to start before the measured run begins
+STARTUP_SECONDS = 5.0
+
+# Serve the app with uvicorn, optionally dropping the held game and cached solutions before each request
+SERVE_SNIPPET = """
+import sys
+import uvicorn
+from main import app
+
+if sys.argv[2] == "cold":
+    from services.cache_service import get_cache
+    from services.game_service import latest_game
+
+    served = app
+
+    async def app(scope, receive, send):
+        if scope["type"] == "http":
+            latest_game.invalidate()
+            get_cache().clear()
+        await served(scope, receive, send)
+
+uvicorn.run(app, host="127.0.0.1", port=int(sys.argv[1]), log_level="warning")
+"""
+
+
+def percentile(values, fraction):
+    """Nearest-rank percentile of a non-empty list"""
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+def parse_server_timing(header):
+    """Parse a Server-Timing header into {stage: ms}, skipping entries without a duration"""
+    stages = {}
+    for entry in (header or "").split(","):
+        name, *params = entry.strip().split(";")
+        for param in params:
+            key, _, value = param.partition("=")
+            if key.strip() == "dur":
+                stages[name] = float(value)
+    return stages
+
+
+def run_lambda_worker(event, start_at, stop_at, cold):
+    """
+    One warm container: import the handler, answer a warm-up invocation, then invoke it back to back
+    from start_at until stop_at. Returns a (seconds, status, Server-Timing header) per invocation.
+    """
+    os.chdir(SRC_DIR)
+    sys.path.insert(0, SRC_DIR)
+    from lambda_function import lambda_handler
+    from services.cache_service import get_cache
+    from services.game_service import latest_game
+
+    lambda_handler(json.loads(json.dumps(event)), None)
+    time.sleep(max(0.0, start_at - time.time()))
+
+    results = []
+    while time.time() < stop_at:
+        if cold:
+            latest_game.invalidate()
+            get_cache().clear()
+        started = time.perf_counter()
+        response = lambda_handler(json.loads(json.dumps(event)), None)
+        elapsed = time.perf_counter() - started
+        headers = {name.lower(): value for name, value in (response.get("headers") or {}).items()}
+        results.append((elapsed, response["statusCode"], headers.get("server-timing")))
+    return results
+
+
+def run_lambda(event, concurrency, duration, cold):
+    start_at = time.time() + STARTUP_SECONDS
+    stop_at = start_at + duration
+    # Spawned, so every worker starts from a fresh interpreter like a new container
+    with multiprocessing.get_context("spawn").Pool(concurrency) as pool:
+        runs = pool.starmap(run_lambda_worker, [(event, start_at, stop_at, cold)] * concurrency)
+    return [result for run in runs for result in run]
+
+
+def free_port():
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+async def drive_server(base_url, path, concurrency, duration):
+    """Keep concurrency requests in flight for duration seconds, after a warm-up request per client"""
+    import httpx
+
+    async def client_loop(client, stop_at, results):
+        while time.perf_counter() < stop_at:
+            started = time.perf_counter()
+            response = await client.get(path)
+            results.append((time.perf_counter() - started, response.status_code, response.headers.get("server-timing")))
+
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=60) as client:
+        await asyncio.gather(*(client.get(path) for _ in range(concurrency)))
+        results = []
+        stop_at = time.perf_counter() + duration
+        await asyncio.gather(*(client_loop(client, stop_at, results) for _ in range(concurrency)))
+    return results
+
+
+def run_uvicorn(event, concurrency, duration, cold):
+    import httpx
+
+    port = free_port()
+    server = subprocess.Popen([sys.executable, "-c", SERVE_SNIPPET, str(port), "cold" if cold else "warm"], cwd=SRC_DIR)
+    try:
+        base_url = f"http://127.0.0.1:{port}"
+        deadline = time.time() + STARTUP_SECONDS
+        while True:
+            try:
+                httpx.get(base_url + "/", timeout=1)
+                break
+            except httpx.TransportError:
+                if time.time() > deadline or server.poll() is not None:
+                    raise RuntimeError("uvicorn didn't start")
+                time.sleep(0.1)
+
+        path = event["rawPath"] + (f"?{event['rawQueryString']}" if event.get("rawQueryString") else "")
+        return asyncio.run(drive_server(base_url, path, concurrency, duration))
+    finally:
+        server.terminate()
+        server.wait()
+
+
+TARGETS = {"lambda": run_lambda, "uvicorn": run_uvicorn}
+
+
+def summarise(target, results, duration, upstream_calls):
+    latencies = [elapsed * 1000 for elapsed, _, _ in results]
+    stages = {}
+    for _, _, header in results:
+        for stage, ms in parse_server_timing(header).items():
+            stages.setdefault(stage, []).append(ms)
+
+    return {
+        "target": target,
+        "requests": len(results),
+        "rps": len(results) / duration,
+        "latency_ms": {
+            "p50": percentile(latencies, 0.5),
+            "p99": percentile(latencies, 0.99),
+            "max": max(latencies),
+        },
+        "statuses": dict(Counter(str(status) for _, status, _ in results)),
+        "upstream_graphql_calls": upstream_calls,
+        "stages_p50_ms": {stage: statistics.median(values) for stage, values in stages.items()},
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--target", nargs="+", choices=sorted(TARGETS), default=sorted(TARGETS), help="what to drive")
+    parser.add_argument("--concurrency", type=int, default=4, help="workers (lambda) or requests in flight (uvicorn)")
+    parser.add_argument("--duration", type=float, default=10.0, help="measured seconds per target")
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds the stub upstream takes per request")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="share of upstream requests failing with 503")
+    parser.add_argument("--cold", action="store_true", help="drop the held game and cache before every request")
+    parser.add_argument("--event", default=os.path.join(EXAMPLES_DIR, "lambda-test-event.json"), help="Lambda event")
+    parser.add_argument(
+        "--response",
+        default=os.path.join(EXAMPLES_DIR, "linkedin-graphql-response.json"),
+        help="GraphQL response the stub upstream serves",
+    )
+    parser.add_argument("--output", help="write results as JSON to this file")
+    args = parser.parse_args()
+
+    with open(args.event) as f:
+        event = json.load(f)
+    with open(args.response) as f:
+        game_response = json.load(f)
+
+    stub = StubLinkedIn(game_response, latency=args.latency, error_rate=args.error_rate, seed=0).start()
+    # Read by config when the workers and the server import it; logging every request would dominate the timings
+    os.environ.update(LINKEDIN_BASE_URL=stub.base_url, LOG_LEVEL=os.environ.get("LOG_LEVEL", "WARNING"))
+
+    summaries = []
+    try:
+        for target in args.target:
+            calls_before = stub.requests[GRAPHQL_PATH]
+            results = TARGETS[target](event, args.concurrency, args.duration, args.cold)
+            summary = summarise(target, results, args.duration, stub.requests[GRAPHQL_PATH] - calls_before)
+            summaries.append(summary)
+
+            latency = summary["latency_ms"]
+            print(
+                f"{target:8} {summary['requests']:7} requests  {summary['rps']:8.1f} req/s"
+                f"  p50 {latency['p50']:7.2f} ms  p99 {latency['p99']:7.2f} ms  max {latency['max']:7.2f} ms"
+                f"  statuses {summary['statuses']}  upstream calls {summary['upstream_graphql_calls']}"
+            )
+            print(
+                "         stages (p50): " + "  ".join(f"{s} {ms:.2f} ms" for s, ms in summary["stages_p50_ms"].items())
+            )
+    finally:
+        stub.stop()
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(
+                {
+                    "concurrency": args.concurrency,
+                    "duration": args.duration,
+                    "latency": args.latency,
+                    "error_rate": args.error_rate,
+                    "cold": args.cold,
+                    "results": summaries,
+                },
+                f,
+                indent=2,
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+"""
+Game parser benchmark on large GraphQL responses.
+
+Pads the recorded LinkedIn response with extra schema metadata (the bulk of a real response) up to
+each --payload-kb size, optionally swapping in a larger board, and times three ways of getting from
+the response to a validated Board:
+
+    legacy  json.loads on the raw bytes, then the previous parse_game lookups and board copy
+    bytes   parse_game_payload on the raw bytes (only the puzzle and its id are decoded)
+    dict    parse_game_payload on an already decoded response (json.loads not included)
+
+    python benchmarks/parser_benchmark.py --payload-kb 32 256 1024 --grid-size 8 20
+"""
+
+import argparse
+import copy
+import json
+import os
+import statistics
+import sys
+import time
+
+SRC_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src")
+sys.path.insert(0, SRC_DIR)
+
+from utils.board import Board  # noqa: E402
+from utils.game_parser import parse_game_payload  # noqa: E402
+
+EXAMPLE_RESPONSE = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
+    "misc",
+    "examples",
+    "linkedin-graphql-response.json",
+)
+
+
+def legacy_parse(raw):
+    """The parse path before the game parser: decode everything, look the fields up three times"""
+    api_response = json.loads(raw)
+    grid = api_response["data"]["identityDashGamesByTodaysGame"]["elements"][0]["gamePuzzle"]["queensGamePuzzle"][
+        "colorGrid"
+    ]
+    puzzle_id = api_response["data"]["identityDashGamesByTodaysGame"]["elements"][0]["puzzleId"]
+    grid_size = api_response["data"]["identityDashGamesByTodaysGame"]["elements"][0]["gamePuzzle"]["queensGamePuzzle"][
+        "gridSize"
+    ]
+
+    board = [[0 for _ in range(grid_size)] for _ in range(grid_size)]
+    for i, row in enumerate(grid):
+        if "colors" in row:
+            board[i] = row["colors"]
+        else:
+            raise ValueError(f"'colors' not found in row {i} of 'colorGrid'")
+    return puzzle_id, grid_size, Board.from_rows(board)
+
+
+def build_response(response, payload_kb, grid_size):
+    """Pad the response with schema-like metadata to roughly payload_kb KiB, with a grid_size board"""
+    response = copy.deepcopy(response)
+    if grid_size:
+        puzzle = response["data"]["identityDashGamesByTodaysGame"]["elements"][0]["gamePuzzle"]["queensGamePuzzle"]
+        # One region per row keeps the board valid; the parser doesn't solve it
+        puzzle["gridSize"] = grid_size
+        puzzle["colorGrid"] = [{"colors": [row] * grid_size} for row in range(grid_size)]
+
+    filler = response.setdefault("extensions", {}).setdefault("padding", [])
+    index = 0
+    while len(json.dumps(response, indent=2)) < payload_kb * 1024:
+        for _ in range(100):
+            filler.append({"name": f"com.linkedin.field{index}", "type": {"string": {}}, "puzzleId": {"type": "long"}})
+            index += 1
+    return json.dumps(response, indent=2).encode()
+
+
+def time_calls(function, argument, repeats):
+    """Median seconds per call, over repeats batches sized to take a few milliseconds each"""
+    started = time.perf_counter()
+    function(argument)
+    batch = max(1, int(0.005 / max(time.perf_counter() - started, 1e-7)))
+
+    runs = []
+    for _ in range(repeats):
+        started = time.perf_counter()
+        for _ in range(batch):
+            function(argument)
+        runs.append((time.perf_counter() - started) / batch)
+    return statistics.median(runs)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--payload-kb", type=int, nargs="+", default=[32, 256, 1024], help="response sizes in KiB")
+    parser.add_argument("--grid-size", type=int, nargs="+", default=[0], help="board sizes (0 keeps the recorded 8x8)")
+    parser.add_argument("--repeats", type=int, default=7, help="timed batches per case, median is kept")
+    args = parser.parse_args()
+
+    with open(EXAMPLE_RESPONSE) as f:
+        recorded = json.load(f)
+
+    for grid_size in args.grid_size:
+        for payload_kb in args.payload_kb:
+            raw = build_response(recorded, payload_kb, grid_size)
+            decoded = json.loads(raw)
+            assert legacy_parse(raw) == tuple(parse_game_payload(raw)) == tuple(parse_game_payload(decoded))
+
+            legacy = time_calls(legacy_parse, raw, args.repeats)
+            from_bytes = time_calls(parse_game_payload, raw, args.repeats)
+            from_dict = time_calls(parse_game_payload, decoded, args.repeats)
+            size = parse_game_payload(decoded).grid_size
+            print(
+                f"{len(raw) / 1024:7.0f} KiB {size:>3}x{size:<3} legacy {legacy * 1e6:9.1f} us"
+                f"  bytes {from_bytes * 1e6:9.1f} us ({legacy / from_bytes:5.1f}x)  dict {from_dict * 1e6:7.1f} us"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,224 @@
+"""
+Solver benchmark over synthetic Queens boards.
+
+Generates boards with a unique solution at each size (seeded, so every run sees the same boards),
+solves each one with every engine in SOLVER_ENGINES and reports p50/p95 solve time, nodes expanded
+and peak memory per engine and size. Generating a large board takes minutes, so generated boards are
+kept in --boards-file (benchmarks/fixtures/generated_boards.json, committed for the default
+settings at sizes 6-20) and only boards missing from it are generated and added. Solves that run past --timeout are recorded as timeouts
+rather than holding up the run. Results can be written as JSON and compared against an earlier run.
+
+    python benchmarks/solver_benchmark.py --sizes 6-14 --boards 5 --output bench.json
+    python benchmarks/solver_benchmark.py --engines propagate dlx --compare bench.json
+"""
+
+import argparse
+import json
+import os
+import signal
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+
+SRC_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src")
+sys.path.insert(0, SRC_DIR)
+
+# Boards generated by earlier runs, keyed by difficulty and seed
+BOARDS_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures", "generated_boards.json")
+
+from utils.board import Board  # noqa: E402
+from utils.board_generator import generate_board  # noqa: E402
+from utils.board_solver import SOLVER_ENGINES, new_solver_stats, solve_board  # noqa: E402
+
+
+class SolveTimeout(Exception):
+    pass
+
+
+def raise_timeout(signum, frame):
+    raise SolveTimeout()
+
+
+def parse_sizes(value):
+    """Parse "8", "6-14" or "6,8,10" into a list of board sizes"""
+    sizes = []
+    for part in value.split(","):
+        start, _, end = part.partition("-")
+        sizes.extend(range(int(start), int(end or start) + 1))
+    return sizes
+
+
+def load_boards(path):
+    """Read the generated boards kept in path, keyed by "difficulty/seed" (empty if there is no file)"""
+    if not path or not os.path.exists(path):
+        return {}
+    with open(path) as f:
+        return json.load(f)
+
+
+def save_boards(path, boards):
+    """Write generated boards to path, one board per line, smallest first"""
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    ordered = sorted(boards.items(), key=lambda item: (len(item[1]), item[0]))
+    with open(path, "w") as f:
+        f.write("{\n" + ",\n".join(f"  {json.dumps(key)}: {json.dumps(board)}" for key, board in ordered) + "\n}\n")
+
+
+def generated_board(boards, size, difficulty, seed):
+    """Return the board generated for these settings, generating it only if boards doesn't hold it yet"""
+    key = f"{difficulty}/{seed}"
+    if key not in boards:
+        boards[key] = generate_board(size, difficulty, seed=seed)[0]
+    return boards[key]
+
+
+def percentile(values, fraction):
+    """Nearest-rank percentile of a non-empty list"""
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+def timed_solve(board, engine, timeout):
+    """Solve once, returning (seconds, stats), or None if the solve ran past the timeout"""
+    stats = new_solver_stats(engine)
+    signal.setitimer(signal.ITIMER_REAL, timeout)
+    try:
+        started = time.perf_counter()
+        solve_board(board, engine=engine, stats=stats)
+        return time.perf_counter() - started, stats
+    except SolveTimeout:
+        return None
+    finally:
+        signal.setitimer(signal.ITIMER_REAL, 0)
+
+
+def peak_memory(board, engine):
+    """Peak memory allocated during a solve, in bytes (measured separately, as tracing slows solves down)"""
+    tracemalloc.start()
+    try:
+        solve_board(board, engine=engine)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def benchmark_engine(boards, engine, repeats, timeout):
+    times, nodes, memory, timeouts = [], [], [], 0
+    for board in boards:
+        runs = []
+        for _ in range(repeats):
+            result = timed_solve(board, engine, timeout)
+            if result is None:
+                break
+            runs.append(result)
+
+        if len(runs) < repeats:
+            timeouts += 1
+            continue
+        times.append(statistics.median(seconds for seconds, _ in runs))
+        nodes.append(runs[0][1]["nodes"])
+        memory.append(peak_memory(board, engine))
+
+    result = {"boards": len(boards), "timeouts": timeouts}
+    if times:
+        result.update(
+            {
+                "p50_ms": percentile(times, 0.5) * 1000,
+                "p95_ms": percentile(times, 0.95) * 1000,
+                "p50_nodes": percentile(nodes, 0.5),
+                "p95_nodes": percentile(nodes, 0.95),
+                "peak_memory_kb": max(memory) / 1024,
+            }
+        )
+    return result
+
+
+def git_commit():
+    try:
+        result = subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True)
+        return result.stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(results, baseline):
+    """Print the change in p50 time per engine and size against an earlier run"""
+    print(f"\nChange in p50 against {baseline.get('commit') or 'baseline'}:")
+    for size, engines in results["results"].items():
+        for engine, current in engines.items():
+            previous = baseline["results"].get(size, {}).get(engine)
+            if not previous or "p50_ms" not in previous or "p50_ms" not in current:
+                continue
+            change = (current["p50_ms"] - previous["p50_ms"]) / previous["p50_ms"] * 100
+            print(
+                f"  {size:>3}x{size:<3} {engine:<10} {previous['p50_ms']:9.2f} -> {current['p50_ms']:9.2f} ms"
+                f" ({change:+.0f}%)"
+            )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=parse_sizes, default=parse_sizes("6-12"), help="e.g. 8, 6-14 or 6,10,14")
+    parser.add_argument("--boards", type=int, default=5, help="boards generated per size (default: 5)")
+    parser.add_argument("--difficulty", type=float, default=0.5, help="region shape difficulty from 0 to 1")
+    parser.add_argument("--seed", type=int, default=0, help="seed for board generation (default: 0)")
+    parser.add_argument("--engines", nargs="+", choices=sorted(SOLVER_ENGINES), default=sorted(SOLVER_ENGINES))
+    parser.add_argument("--repeats", type=int, default=3, help="timed solves per board, median is kept")
+    parser.add_argument("--timeout", type=float, default=5.0, help="seconds allowed per solve (default: 5)")
+    parser.add_argument("--boards-file", default=BOARDS_FILE, help="generated boards kept between runs ('' for none)")
+    parser.add_argument("--output", help="write results as JSON to this file")
+    parser.add_argument("--compare", help="JSON file from an earlier run to compare p50 times against")
+    args = parser.parse_args()
+
+    signal.signal(signal.SIGALRM, raise_timeout)
+    results = {
+        "commit": git_commit(),
+        "python": sys.version.split()[0],
+        "settings": {
+            "sizes": args.sizes,
+            "boards": args.boards,
+            "difficulty": args.difficulty,
+            "seed": args.seed,
+            "repeats": args.repeats,
+            "timeout": args.timeout,
+        },
+        "results": {},
+    }
+
+    generated = load_boards(args.boards_file)
+    for size in args.sizes:
+        known = len(generated)
+        # Converted up front, as the parser hands solvers a Board
+        boards = [
+            Board.from_rows(generated_board(generated, size, args.difficulty, f"{args.seed}-{size}-{index}"))
+            for index in range(args.boards)
+        ]
+        if args.boards_file and len(generated) > known:
+            save_boards(args.boards_file, generated)
+
+        results["results"][str(size)] = {}
+        for engine in args.engines:
+            result = benchmark_engine(boards, engine, args.repeats, args.timeout)
+            results["results"][str(size)][engine] = result
+            if "p50_ms" in result:
+                print(
+                    f"{size:>3}x{size:<3} {engine:<10} p50 {result['p50_ms']:9.2f} ms  p95 {result['p95_ms']:9.2f} ms"
+                    f"  nodes p50 {result['p50_nodes']:>8}  peak {result['peak_memory_kb']:8.1f} KiB"
+                    f"  timeouts {result['timeouts']}/{result['boards']}"
+                )
+            else:
+                print(f"{size:>3}x{size:<3} {engine:<10} all {result['boards']} solves timed out")
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+
+    if args.compare:
+        with open(args.compare) as f:
+            compare(results, json.load(f))
+
+
+if __name__ == "__main__":
+    main()
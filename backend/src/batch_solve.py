@@ -0,0 +1,110 @@
+"""
+Solve boards in bulk from JSON Lines input, fanned out across a process pool.
+
+Each input line is a {"colorGrid": [...]} payload (as accepted by POST /boards/solve, optionally
+with gridSize and puzzleId) or a whole LinkedIn API response. Each output line is the solved game,
+or {"error": ...}, tagged with the input line number. Output follows input order unless
+--unordered is given, which writes each result as soon as it is ready.
+
+Each worker keeps every solution it finds, keyed on the canonical board, so repeats, rotations,
+reflections and recolourings of a board already seen by that worker are not solved again.
+
+    python batch_solve.py archive.jsonl --output solved.jsonl
+    cat boards.jsonl | python batch_solve.py --workers 4 --unordered
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from contextlib import redirect_stdout
+from multiprocessing import Pool
+
+from config import CACHE_BACKEND
+from services.cache_service import MemoryCache, set_cache
+from services.game_service import solve_payload
+
+# Solutions held per worker - enough for a large archive or generated corpus
+BATCH_CACHE_ENTRIES = 100_000
+
+
+def init_worker(cache_entries):
+    """Size the worker's in-memory solution cache for a whole batch rather than a Lambda's traffic"""
+    if CACHE_BACKEND == "memory":
+        set_cache(MemoryCache(max_entries=cache_entries))
+
+
+def solve_line(numbered_line):
+    """
+    Solve one input line, returning (serialised result, whether it failed).
+    Results are serialised in the worker so the parent process only has to write them out.
+    """
+    line_number, line = numbered_line
+    try:
+        # parse_game prints its errors, which mustn't end up in the JSON Lines output
+        with redirect_stdout(sys.stderr):
+            result = solve_payload(json.loads(line))
+    except json.JSONDecodeError as e:
+        result = {"error": f"Invalid JSON: {e}"}
+    return json.dumps({"line": line_number, **result}), "error" in result
+
+
+def read_lines(lines):
+    """Number the non-blank input lines (1-based, matching the input file)"""
+    for line_number, line in enumerate(lines, 1):
+        if line.strip():
+            yield line_number, line
+
+
+def solve_lines(lines, workers=None, ordered=True, chunksize=16, cache_entries=BATCH_CACHE_ENTRIES):
+    """Yield (serialised result, failed) per input line, using a pool of worker processes when workers > 1"""
+    numbered = read_lines(lines)
+    if workers == 1:
+        init_worker(cache_entries)
+        yield from map(solve_line, numbered)
+        return
+
+    with Pool(workers, init_worker, (cache_entries,)) as pool:
+        # Chunks amortise the inter-process round trip, which otherwise costs more than a small solve
+        results = pool.imap if ordered else pool.imap_unordered
+        yield from results(solve_line, numbered, chunksize)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("input", nargs="?", help="JSON Lines file of boards (default: stdin)")
+    parser.add_argument("--output", help="write results to this file (default: stdout)")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(), help="worker processes (default: all cores)")
+    parser.add_argument("--unordered", action="store_true", help="write results as they finish, not in input order")
+    parser.add_argument("--chunksize", type=int, default=16, help="boards sent to a worker at a time (default: 16)")
+    parser.add_argument(
+        "--cache-entries", type=int, default=BATCH_CACHE_ENTRIES, help="solutions each worker keeps for reuse"
+    )
+    args = parser.parse_args()
+
+    source = open(args.input) if args.input else sys.stdin
+    sink = open(args.output, "w") if args.output else sys.stdout
+    started = time.perf_counter()
+    count = errors = 0
+
+    try:
+        for result, failed in solve_lines(source, args.workers, not args.unordered, args.chunksize, args.cache_entries):
+            sink.write(result + "\n")
+            count += 1
+            errors += failed
+    finally:
+        if args.input:
+            source.close()
+        if args.output:
+            sink.close()
+
+    elapsed = time.perf_counter() - started
+    print(
+        f"Solved {count - errors} of {count} boards in {elapsed:.2f}s ({count / elapsed if elapsed else 0:.0f}/s)",
+        file=sys.stderr,
+    )
+
+
+if __name__ == "__main__":
+    main()
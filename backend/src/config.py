@@ -9,25 +9,83 @@ API_STAGE = os.getenv("API_STAGE", "dev")
 DEFAULT_ORIGINS = "http://localhost:5173" if ENVIRONMENT == "development" else ""
 ALLOWED_ORIGINS = [origin.strip() for origin in os.getenv("ALLOWED_ORIGINS", DEFAULT_ORIGINS).split(",") if origin.strip()]
 
-# Base URLs
-GAME_BASE_URL = "https://www.linkedin.com/games/view/queens/desktop/"
-API_BASE_URL = "https://www.linkedin.com/voyager/api/graphql"
+# Base URLs (LINKEDIN_BASE_URL can point at a local stub for testing)
+LINKEDIN_BASE_URL = os.getenv("LINKEDIN_BASE_URL", "https://www.linkedin.com").rstrip("/")
+GAME_BASE_URL = f"{LINKEDIN_BASE_URL}/games/view/queens/desktop/"
+API_BASE_URL = f"{LINKEDIN_BASE_URL}/voyager/api/graphql"
 
 # LinkedIn API Query
 QUERY_STRING = "?includeWebMetadata=true&variables=(gameTypeId:3)&queryId=voyagerIdentityDashGames.3f8521c6cb0e550ebd391b373caa11fb"
 
+# Upstream HTTP client: per-call timeouts, connection pool size and retry budget
+UPSTREAM_TIMEOUT_SECONDS = float(os.getenv("UPSTREAM_TIMEOUT_SECONDS", "5"))
+UPSTREAM_CONNECT_TIMEOUT_SECONDS = float(os.getenv("UPSTREAM_CONNECT_TIMEOUT_SECONDS", "2"))
+UPSTREAM_MAX_CONNECTIONS = int(os.getenv("UPSTREAM_MAX_CONNECTIONS", "10"))
+UPSTREAM_MAX_RETRIES = int(os.getenv("UPSTREAM_MAX_RETRIES", "2"))
+UPSTREAM_RETRY_BASE_DELAY = float(os.getenv("UPSTREAM_RETRY_BASE_DELAY", "0.2"))
+UPSTREAM_RETRY_BUDGET_SECONDS = float(os.getenv("UPSTREAM_RETRY_BUDGET_SECONDS", "10"))
+
+# How long a JSESSIONID/CSRF token is reused across warm invocations before refetching
+CSRF_TOKEN_TTL_SECONDS = int(os.getenv("CSRF_TOKEN_TTL_SECONDS", "3600"))
+
+# Solved puzzle cache - "memory" (in-process LRU), "sqlite" (local file) or "none"
+CACHE_BACKEND = os.getenv("CACHE_BACKEND", "memory")
+CACHE_PATH = os.getenv("CACHE_PATH", "/tmp/queens-solver-cache.sqlite3")
+CACHE_MAX_ENTRIES = int(os.getenv("CACHE_MAX_ENTRIES", "128"))
+CACHE_TTL_SECONDS = int(os.getenv("CACHE_TTL_SECONDS", "86400"))
+
+# Local archive of every fetched puzzle, served by GET /boards/{puzzleId} and GET /boards?date= (off if empty)
+ARCHIVE_PATH = os.getenv("ARCHIVE_PATH", "/tmp/queens-solver-archive.sqlite3")
+
+# Solver engine for API and batch solves (see SOLVER_ENGINES), e.g. "portfolio" to race several engines
+SOLVER_ENGINE = os.getenv("SOLVER_ENGINE", "propagate")
+
+# Search budget per solve, so a bad board gives up well inside the Lambda timeout
+SOLVER_MAX_NODES = int(os.getenv("SOLVER_MAX_NODES", "1000000"))
+SOLVER_MAX_SECONDS = float(os.getenv("SOLVER_MAX_SECONDS", "10"))
+
+# Most boards accepted by one POST /boards/solve request
+MAX_BATCH_BOARDS = int(os.getenv("MAX_BATCH_BOARDS", "100"))
+
+# Per-request timings are emitted as CloudWatch metrics (Embedded Metric Format log lines)
+METRICS_ENABLED = os.getenv("METRICS_ENABLED", "false" if ENVIRONMENT == "development" else "true").lower() == "true"
+METRICS_NAMESPACE = os.getenv("METRICS_NAMESPACE", "QueensSolver")
+
+# Directory for cProfile dumps of solves, requested per request with an "X-Profile-Solve: 1" header (off if unset)
+PROFILE_DIR = os.getenv("PROFILE_DIR", "")
+
+# LinkedIn publishes a new puzzle at midnight in this timezone
+PUZZLE_ROLLOVER_TIMEZONE = os.getenv("PUZZLE_ROLLOVER_TIMEZONE", "America/Los_Angeles")
+
+# LinkedIn can keep serving yesterday's puzzle for a while after the rollover. A latest game not yet known to be
+# today's is only held for LATEST_GAME_RECHECK_SECONDS, until this long after the rollover
+PUZZLE_ROLLOVER_GRACE_SECONDS = float(os.getenv("PUZZLE_ROLLOVER_GRACE_SECONDS", "1800"))
+LATEST_GAME_RECHECK_SECONDS = float(os.getenv("LATEST_GAME_RECHECK_SECONDS", "60"))
+
+# Scheduled warm-up at the rollover: how long one run polls for the new puzzle, with backoff between polls
+WARMUP_MAX_SECONDS = float(os.getenv("WARMUP_MAX_SECONDS", "20"))
+WARMUP_POLL_DELAY = float(os.getenv("WARMUP_POLL_DELAY", "1"))
+WARMUP_POLL_MAX_DELAY = float(os.getenv("WARMUP_POLL_MAX_DELAY", "8"))
+
 # Logging configuration
 LOG_FORMAT = "%(asctime)s - %(levelname)s - %(message)s"
 LOG_LEVEL = os.getenv("LOG_LEVEL", "DEBUG")
 
-# Configure logging
-logging.basicConfig(
-    level=getattr(logging, LOG_LEVEL),
-    format=LOG_FORMAT
-)
 logger = logging.getLogger(__name__)
 
-# Log environment information at startup
-logger.info(f"Starting application in {ENVIRONMENT} environment")
-logger.info(f"API Stage: {API_STAGE}")
-logger.info(f"Allowed origins: {ALLOWED_ORIGINS}")
+_logging_configured = False
+
+
+def configure_logging():
+    """Configure logging on first use rather than at import, keeping cold starts free of I/O"""
+    global _logging_configured
+    if _logging_configured:
+        return
+    _logging_configured = True
+
+    logging.basicConfig(level=getattr(logging, LOG_LEVEL), format=LOG_FORMAT)
+
+    # Log environment information at startup
+    logger.info(f"Starting application in {ENVIRONMENT} environment")
+    logger.info(f"API Stage: {API_STAGE}")
+    logger.info(f"Allowed origins: {ALLOWED_ORIGINS}")
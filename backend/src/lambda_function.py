@@ -1,18 +1,64 @@
-import json
-import os
-from main import app
-from mangum import Mangum
-from config import logger, ENVIRONMENT, API_STAGE
-
-# Create Mangum handler with appropriate configuration
-lambda_handler = Mangum(
-    app,
-    lifespan="off",
-    api_gateway_base_path=API_STAGE if ENVIRONMENT != "development" else None
-)
-
-# Log Lambda function initialization
-logger.info(f"Lambda function initialized in {ENVIRONMENT} environment, API stage: {API_STAGE}")
-
-# Export the handler for AWS Lambda
-__all__ = ['lambda_handler']
+from config import ENVIRONMENT, API_STAGE
+
+# Built on the first invocation so importing this module stays cheap; reused while the container is warm
+_handler = None
+
+
+def get_handler():
+    """Create the Mangum handler, importing FastAPI and the app only when first needed"""
+    global _handler
+    if _handler is None:
+        from mangum import Mangum
+
+        from config import logger
+        from main import app
+
+        # Create Mangum handler with appropriate configuration
+        _handler = Mangum(
+            app,
+            lifespan="off",
+            api_gateway_base_path=API_STAGE if ENVIRONMENT != "development" else None,
+        )
+
+        # Log Lambda function initialization
+        logger.info(f"Lambda function initialized in {ENVIRONMENT} environment, API stage: {API_STAGE}")
+
+    return _handler
+
+
+def lambda_handler(event, context):
+    """AWS Lambda entry point"""
+    if isinstance(event, dict) and event.get("warmup"):
+        return warmup_handler(event, context)
+    return get_handler()(event, context)
+
+
+def warmup_handler(event, context):
+    """Scheduled entry point: poll for the new puzzle around the rollover and warm the cache with it"""
+    import asyncio
+
+    from config import configure_logging, logger
+    from services.api_service import close_client
+    from services.game_service import error_result
+    from services.warmup_service import warm_up
+
+    async def run():
+        try:
+            return await warm_up(previous_id=(event or {}).get("previousPuzzleId"))
+        finally:
+            # The loop outlives the invocation, so its client (and pooled connections) go with it
+            await close_client()
+
+    # The app isn't imported here, so logging isn't configured by main
+    configure_logging()
+    try:
+        # Run on the loop Mangum serves requests on: asyncio.run would close it and leave none behind
+        result = asyncio.get_event_loop().run_until_complete(run())
+    except Exception as e:
+        result = error_result(e)
+    logger.info(f"Warm-up finished: {result}")
+    return result
+
+
+# Export the handlers for AWS Lambda
+__all__ = ["lambda_handler", "warmup_handler"]
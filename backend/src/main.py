@@ -1,10 +1,15 @@
-import logging
-from fastapi import FastAPI, Request
+import json
+from typing import Any
+
+from fastapi import Body, FastAPI, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
-from mangum import Mangum
 
-from config import ALLOWED_ORIGINS, ENVIRONMENT, API_STAGE, logger
-from services.game_service import get_latest_game
+from config import ALLOWED_ORIGINS, ENVIRONMENT, API_STAGE, configure_logging, logger
+from services.game_service import get_archived_game, get_latest_game, hint_payload, latest_game, solve_payloads
+from services.response_service import game_response
+from services.timing_service import emit_metrics, profile_enabled, request_timings
+
+configure_logging()
 
 # Configure FastAPI app with environment-specific settings
 app = FastAPI(
@@ -21,14 +26,20 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["Server-Timing"],
 )
 
-# Add request logging middleware
+# Add request logging middleware, reporting per-stage timings in a Server-Timing header and as metrics
 @app.middleware("http")
 async def log_requests(request: Request, call_next):
     logger.info(f"Request: {request.method} {request.url.path}")
-    response = await call_next(request)
-    logger.info(f"Response status: {response.status_code}")
+    profile = profile_enabled() and request.headers.get("X-Profile-Solve") == "1"
+    with request_timings(profile=profile) as timings:
+        response = await call_next(request)
+    route = getattr(request.scope.get("route"), "path", request.url.path)
+    response.headers["Server-Timing"] = timings.server_timing()
+    logger.info(f"Response status: {response.status_code}, timings: {json.dumps(timings.as_dict())}")
+    emit_metrics(timings, route, response.status_code)
     return response
 
 @app.get("/")
@@ -37,10 +48,50 @@ def health_check():
     return {"status": "healthy", "environment": ENVIRONMENT, "stage": API_STAGE}
 
 @app.get("/boards/latest")
-def get_game():
-    """API endpoint to return the latest game"""
+async def get_game(request: Request, response: Response, verify: bool = False):
+    """API endpoint to return the latest game. Pass verify=true to check the solution is unique."""
     logger.info("Fetching latest game")
-    return get_latest_game()
+    game = await get_latest_game(verify=verify)
+    if "error" in game:
+        response.headers["Cache-Control"] = "no-store"
+        return game
+
+    # Served as pre-encoded bytes with an ETag, so a client that already holds the puzzle gets a 304.
+    # Clients may keep it for as long as the held game is kept, so an unconfirmed puzzle isn't pinned
+    status_code, headers, body = game_response(
+        game,
+        request.headers.get("If-None-Match"),
+        request.headers.get("Accept-Encoding"),
+        expires_at=latest_game.expiry(),
+    )
+    return Response(content=body, status_code=status_code, headers=headers, media_type="application/json")
+
+# Declared after /boards/latest, so "latest" is never taken for a puzzle id
+@app.get("/boards/{puzzle_id}")
+def get_archived_board(puzzle_id: int, response: Response):
+    """API endpoint to return a past game from the archive by its puzzle id"""
+    logger.info(f"Fetching archived game {puzzle_id}")
+    return archive_response(get_archived_game(puzzle_id=puzzle_id), response)
+
+@app.get("/boards")
+def get_archived_board_by_date(date: str, response: Response):
+    """API endpoint to return the game published on a date (YYYY-MM-DD) from the archive"""
+    logger.info(f"Fetching archived game for {date}")
+    return archive_response(get_archived_game(date=date), response)
+
+def archive_response(game, response):
+    if "error" in game:
+        response.status_code = 404 if game.get("status") == "notFound" else 400
+    return game
+
+@app.post("/boards/solve")
+def solve_boards(payload: Any = Body(...)):
+    """API endpoint to solve a posted {"colorGrid": [...]} board, or a list of them (solved in order)"""
+    logger.info("Solving posted boards")
+    return solve_payloads(payload)
 
-# Wrap FastAPI app for AWS Lambda compatibility
-handler = Mangum(app)
+@app.post("/boards/hint")
+def hint_board(payload: Any = Body(...)):
+    """API endpoint to hint the next move (or the rest of the solution) for a partially played board"""
+    logger.info("Hinting posted board")
+    return hint_payload(payload)
@@ -1,35 +1,152 @@
+import asyncio
 import logging
-import requests
-from config import GAME_BASE_URL, API_BASE_URL, LOG_FORMAT, LOG_LEVEL, QUERY_STRING
+import random
+import time
+import weakref
 
-# Set up logging
-logging.basicConfig(level=getattr(logging, LOG_LEVEL), format=LOG_FORMAT)
+from config import (
+    API_BASE_URL,
+    CSRF_TOKEN_TTL_SECONDS,
+    GAME_BASE_URL,
+    QUERY_STRING,
+    UPSTREAM_CONNECT_TIMEOUT_SECONDS,
+    UPSTREAM_MAX_CONNECTIONS,
+    UPSTREAM_MAX_RETRIES,
+    UPSTREAM_RETRY_BASE_DELAY,
+    UPSTREAM_RETRY_BUDGET_SECONDS,
+    UPSTREAM_TIMEOUT_SECONDS,
+)
+from services.single_flight import SingleFlight
+from services.timing_service import timed
+from services.warm_state import AsyncWarmValue
 
-# Initialize a session to persist cookies
-session = requests.Session()
+# Statuses worth retrying - LinkedIn throttling us or having a bad moment
+RETRY_STATUS_CODES = {429, 500, 502, 503, 504}
 
+# Statuses meaning LinkedIn rejected our CSRF token
+REJECTED_TOKEN_STATUS_CODES = {401, 403}
 
-def fetch_csrf_token():
+# One pooled keep-alive client, persisting cookies, per event loop. A client's connections belong
+# to the loop it was created on, so each loop keeps its own rather than replacing another's, and
+# whoever runs a loop closes its client before the loop ends (see close_client)
+_clients = weakref.WeakKeyDictionary()
+
+
+def current_client():
+    """Return the running event loop's client, or None if it has none yet"""
+    try:
+        return _clients.get(asyncio.get_running_loop())
+    except RuntimeError:
+        return None
+
+
+def get_client():
+    """Return the shared upstream client, creating it for the running event loop if needed"""
+    # httpx is imported on first use so it stays off the cold start path
+    import httpx
+
+    loop = asyncio.get_running_loop()
+    client = _clients.get(loop)
+
+    if client is None or client.is_closed:
+        client = httpx.AsyncClient(
+            timeout=httpx.Timeout(UPSTREAM_TIMEOUT_SECONDS, connect=UPSTREAM_CONNECT_TIMEOUT_SECONDS),
+            limits=httpx.Limits(
+                max_connections=UPSTREAM_MAX_CONNECTIONS, max_keepalive_connections=UPSTREAM_MAX_CONNECTIONS
+            ),
+            follow_redirects=True,
+        )
+        _clients[loop] = client
+
+    return client
+
+
+async def close_client():
+    """Close the running event loop's shared client and its pooled connections"""
+    client = _clients.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.aclose()
+
+
+def retry_delay(attempt):
+    """Exponential backoff with full jitter"""
+    return random.uniform(0, UPSTREAM_RETRY_BASE_DELAY * 2**attempt)
+
+
+async def request_with_retries(method, url, **kwargs):
+    """Send a request, retrying transport errors and retryable statuses within the retry budget"""
+    import httpx
+
+    started = time.monotonic()
+    attempt = 0
+
+    while True:
+        try:
+            response = await get_client().request(method, url, **kwargs)
+            if response.status_code not in RETRY_STATUS_CODES:
+                return response
+            error = f"status {response.status_code}"
+        except httpx.TransportError as e:
+            response = None
+            error = repr(e)
+
+        delay = retry_delay(attempt)
+        out_of_budget = time.monotonic() - started + delay > UPSTREAM_RETRY_BUDGET_SECONDS
+        if attempt >= UPSTREAM_MAX_RETRIES or out_of_budget:
+            if response is not None:
+                return response
+            raise httpx.TransportError(f"{method} {url} failed after {attempt + 1} attempts: {error}")
+
+        logging.warning(f"{method} {url} failed with {error}, retrying in {delay:.2f}s")
+        await asyncio.sleep(delay)
+        attempt += 1
+
+
+async def fetch_csrf_token():
     """Fetch CSRF token from the initial request"""
     logging.debug(f"Making GET request to {GAME_BASE_URL}...")
 
-    response = session.get(GAME_BASE_URL)
+    with timed("csrf"):
+        response = await request_with_retries("GET", GAME_BASE_URL)
     response.raise_for_status()
 
     logging.debug(f"Response status code: {response.status_code}")
     logging.debug(f"Response headers: {response.headers}")
     logging.debug(f"Response body: {response.text[:500]}")  # Limit to 500 characters
 
-    csrf_token = session.cookies.get("JSESSIONID")
+    csrf_token = get_client().cookies.get("JSESSIONID")
     if not csrf_token:
         raise ValueError("JSESSIONID token not found in cookies")
 
-    print(f"csrf_token Token: {csrf_token}")
+    logging.debug(f"csrf_token Token: {csrf_token}")
     return csrf_token
 
 
-def make_api_request(csrf_token):
-    """Make GraphQL request using CSRF token"""
+def is_current_token(token):
+    """Check the token still matches the JSESSIONID cookie held by the client"""
+    client = current_client()
+    return client is not None and not client.is_closed and client.cookies.get("JSESSIONID") == token
+
+
+# Concurrent requests needing a new token share one fetch
+token_flight = SingleFlight()
+
+
+async def fetch_csrf_token_once():
+    return await token_flight.run("csrf", fetch_csrf_token)
+
+
+# Reuse the token across requests and warm invocations until it expires or is rejected
+csrf_token_state = AsyncWarmValue(fetch_csrf_token_once, ttl=CSRF_TOKEN_TTL_SECONDS, validate=is_current_token)
+
+
+async def get_csrf_token():
+    """Return the current CSRF token, fetching a new one only when needed"""
+    return await csrf_token_state.get()
+
+
+async def make_api_request(csrf_token):
+    """Make GraphQL request using CSRF token, returning the raw response body for the game parser"""
     headers = {
         "Content-Type": "application/json",
         "csrf-token": csrf_token,
@@ -37,7 +154,25 @@ def make_api_request(csrf_token):
 
     url = f"{API_BASE_URL}{QUERY_STRING}"
 
-    response = session.get(url, headers=headers)
+    with timed("graphql"):
+        response = await request_with_retries("GET", url, headers=headers)
+    if response.status_code in REJECTED_TOKEN_STATUS_CODES:
+        # LinkedIn rejected the token, so fetch a fresh one next time
+        csrf_token_state.invalidate()
     response.raise_for_status()
 
-    return response.json()
+    return response.content
+
+
+async def fetch_game_data():
+    """Fetch today's game, retrying once with a fresh token if the held token is rejected"""
+    import httpx
+
+    for attempt in range(2):
+        csrf_token = await get_csrf_token()
+        try:
+            return await make_api_request(csrf_token)
+        except httpx.HTTPStatusError as e:
+            if attempt or e.response.status_code not in REJECTED_TOKEN_STATUS_CODES:
+                raise
+            logging.info("CSRF token rejected, fetching a new one")
@@ -0,0 +1,99 @@
+import json
+import threading
+from datetime import date
+
+from config import ARCHIVE_PATH
+
+
+class PuzzleArchive:
+    """
+    Every puzzle fetched from LinkedIn, kept in a local SQLite file so past puzzles can be served
+    without going upstream. Puzzles are looked up by id (the primary key) or by date (indexed).
+    Boards are stored as their colour bytes and solutions as one column byte per row.
+    """
+
+    def __init__(self, path=ARCHIVE_PATH):
+        self._lock = threading.Lock()
+
+        import sqlite3
+
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        with self._connection:
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS puzzles ("
+                "puzzle_id INTEGER PRIMARY KEY, date TEXT NOT NULL, grid_size INTEGER NOT NULL,"
+                "cells BLOB NOT NULL, solution BLOB NOT NULL, solver_stats TEXT NOT NULL)"
+            )
+            self._connection.execute("CREATE INDEX IF NOT EXISTS puzzles_by_date ON puzzles (date)")
+
+    def add(self, game, puzzle_date):
+        """Store a solved game under the date it was published, keeping the first copy of each puzzle"""
+        size = game["gridSize"]
+        cells = bytes(colour for row in game["board"] for colour in row)
+        columns = bytearray(size)
+        for queen in game["solution"]:
+            columns[queen["row"]] = queen["col"]
+
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT OR IGNORE INTO puzzles (puzzle_id, date, grid_size, cells, solution, solver_stats)"
+                " VALUES (?, ?, ?, ?, ?, ?)",
+                (game["puzzleId"], puzzle_date, size, cells, bytes(columns), json.dumps(game.get("solverStats", {}))),
+            )
+
+    def get(self, puzzle_id):
+        """Return the archived game with this id, or None"""
+        return self._find("puzzle_id = ?", puzzle_id)
+
+    def get_by_date(self, puzzle_date):
+        """Return the game published on this date (YYYY-MM-DD), or None"""
+        # Only one puzzle is published a day; should two share a date, the later one wins
+        return self._find("date = ? ORDER BY puzzle_id DESC LIMIT 1", puzzle_date)
+
+    def _find(self, where, value):
+        with self._lock:
+            row = self._connection.execute(
+                f"SELECT puzzle_id, date, grid_size, cells, solution, solver_stats FROM puzzles WHERE {where}",
+                (value,),
+            ).fetchone()
+        if row is None:
+            return None
+
+        puzzle_id, puzzle_date, size, cells, columns, solver_stats = row
+        return {
+            "puzzleId": puzzle_id,
+            "date": puzzle_date,
+            "gridSize": size,
+            "board": [list(cells[row * size : (row + 1) * size]) for row in range(size)],
+            "solution": [{"row": row, "col": col} for row, col in enumerate(columns)],
+            "solverStats": json.loads(solver_stats),
+        }
+
+    def clear(self):
+        with self._lock, self._connection:
+            self._connection.execute("DELETE FROM puzzles")
+
+
+def parse_date(value):
+    """Check a YYYY-MM-DD date, returning it in canonical form"""
+    try:
+        return date.fromisoformat(value).isoformat()
+    except (TypeError, ValueError):
+        raise ValueError(f"Expected a date like 2025-03-01, got {value!r}") from None
+
+
+_archive = None
+
+
+def get_archive():
+    """Return the process-wide archive, opening ARCHIVE_PATH on first use (None if archiving is off)"""
+    global _archive
+    if _archive is None and ARCHIVE_PATH:
+        _archive = PuzzleArchive()
+    return _archive
+
+
+def set_archive(archive):
+    """Replace the process-wide archive (used by tests and alternative deployments)"""
+    global _archive
+    _archive = archive
@@ -0,0 +1,180 @@
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime, timedelta, timezone
+
+from config import (
+    CACHE_BACKEND,
+    CACHE_MAX_ENTRIES,
+    CACHE_PATH,
+    CACHE_TTL_SECONDS,
+    PUZZLE_ROLLOVER_TIMEZONE,
+    logger,
+)
+from utils.board import Board
+
+# Cache keys
+LATEST_GAME_KEY = "latest"
+
+
+def puzzle_key(puzzle_id):
+    return f"puzzle:{puzzle_id}"
+
+
+def board_key(board):
+    return f"board:{board_hash(board)}"
+
+
+def board_hash(board):
+    """Return a stable content hash of a board's colour grid"""
+    board = Board.from_rows(board)
+    return hashlib.sha256(board.size.to_bytes(2, "big") + board.cells).hexdigest()
+
+
+def rollover_timezone():
+    """Return the timezone LinkedIn's daily puzzle rolls over in"""
+    try:
+        from zoneinfo import ZoneInfo
+
+        return ZoneInfo(PUZZLE_ROLLOVER_TIMEZONE)
+    except Exception:
+        logger.warning(f"Unknown timezone {PUZZLE_ROLLOVER_TIMEZONE}, using UTC for puzzle rollover")
+        return timezone.utc
+
+
+def next_rollover(now):
+    """Return the epoch time of the next daily puzzle rollover after now (epoch seconds)"""
+    tz = rollover_timezone()
+    local_now = datetime.fromtimestamp(now, tz)
+    next_day = (local_now + timedelta(days=1)).date()
+    return datetime(next_day.year, next_day.month, next_day.day, tzinfo=tz).timestamp()
+
+
+def last_rollover(now):
+    """Return the epoch time of the latest daily puzzle rollover at or before now (epoch seconds)"""
+    tz = rollover_timezone()
+    today = datetime.fromtimestamp(now, tz).date()
+    return datetime(today.year, today.month, today.day, tzinfo=tz).timestamp()
+
+
+def puzzle_date(now):
+    """Return the date (YYYY-MM-DD) of the puzzle published as of now (epoch seconds)"""
+    return datetime.fromtimestamp(now, rollover_timezone()).date().isoformat()
+
+
+class MemoryCache:
+    """In-process LRU cache with per-entry expiry"""
+
+    def __init__(self, max_entries=CACHE_MAX_ENTRIES, ttl=CACHE_TTL_SECONDS, clock=time.time):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.clock = clock
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+
+            value, expires_at = entry
+            if expires_at <= self.clock():
+                del self._entries[key]
+                return None
+
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key, value, expires_at=None):
+        now = self.clock()
+        expires_at = min(expires_at or now + self.ttl, now + self.ttl)
+        with self._lock:
+            self._entries[key] = (value, expires_at)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+class SQLiteCache:
+    """Cache persisted to a local SQLite file, so it survives process restarts"""
+
+    def __init__(self, path=CACHE_PATH, ttl=CACHE_TTL_SECONDS, clock=time.time):
+        self.ttl = ttl
+        self.clock = clock
+        self._lock = threading.Lock()
+
+        import sqlite3
+
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        with self._connection:
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS cache (key TEXT PRIMARY KEY, value TEXT NOT NULL, expires_at REAL NOT NULL)"
+            )
+
+    def get(self, key):
+        with self._lock:
+            row = self._connection.execute("SELECT value, expires_at FROM cache WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                return None
+
+            value, expires_at = row
+            if expires_at <= self.clock():
+                with self._connection:
+                    self._connection.execute("DELETE FROM cache WHERE key = ?", (key,))
+                return None
+
+            return json.loads(value)
+
+    def set(self, key, value, expires_at=None):
+        now = self.clock()
+        expires_at = min(expires_at or now + self.ttl, now + self.ttl)
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO cache (key, value, expires_at) VALUES (?, ?, ?)",
+                (key, json.dumps(value), expires_at),
+            )
+
+    def clear(self):
+        with self._lock, self._connection:
+            self._connection.execute("DELETE FROM cache")
+
+
+class NullCache:
+    """Cache that stores nothing, for disabling caching"""
+
+    def get(self, key):
+        return None
+
+    def set(self, key, value, expires_at=None):
+        pass
+
+    def clear(self):
+        pass
+
+
+CACHE_BACKENDS = {"memory": MemoryCache, "sqlite": SQLiteCache, "none": NullCache}
+
+_cache = None
+
+
+def get_cache():
+    """Return the process-wide cache, creating the configured backend on first use"""
+    global _cache
+    if _cache is None:
+        if CACHE_BACKEND not in CACHE_BACKENDS:
+            raise ValueError(f"Unknown cache backend '{CACHE_BACKEND}', expected one of {sorted(CACHE_BACKENDS)}")
+        _cache = CACHE_BACKENDS[CACHE_BACKEND]()
+    return _cache
+
+
+def set_cache(cache):
+    """Replace the process-wide cache (used by tests and alternative deployments)"""
+    global _cache
+    _cache = cache
@@ -1,52 +1,316 @@
-from utils.board_solver import solve_board
-from services.api_service import fetch_csrf_token, make_api_request
+import asyncio
+import time
 
+from config import (
+    LATEST_GAME_RECHECK_SECONDS,
+    MAX_BATCH_BOARDS,
+    PUZZLE_ROLLOVER_GRACE_SECONDS,
+    SOLVER_ENGINE,
+    SOLVER_MAX_NODES,
+    SOLVER_MAX_SECONDS,
+)
+from utils.board import Board
+from utils.board_solver import UnsolvableBoard, count_solutions, solve_board
+from utils.canonical import canonical_form, from_canonical
+from utils.game_parser import build_board, parse_game_payload, validate_board
+from utils.hint_solver import get_hint
+from services.api_service import fetch_game_data
+from services.archive_service import get_archive, parse_date
+from services.cache_service import (
+    LATEST_GAME_KEY,
+    board_key,
+    get_cache,
+    last_rollover,
+    next_rollover,
+    puzzle_date,
+    puzzle_key,
+)
+from services.single_flight import SingleFlight
+from services.timing_service import current_timings, profile_call, record_solver_stats, timed
+from services.warm_state import AsyncWarmValue
 
-def parse_game(api_response):
-    """Extract game board from API response"""
-    try:
-        # "colorGrid" in the API response is the game board
-        grid = api_response["data"]["identityDashGamesByTodaysGame"]["elements"][0]["gamePuzzle"]["queensGamePuzzle"][
-            "colorGrid"
-        ]
-        puzzle_id = api_response["data"]["identityDashGamesByTodaysGame"]["elements"][0]["puzzleId"]
-        grid_size = api_response["data"]["identityDashGamesByTodaysGame"]["elements"][0]["gamePuzzle"][
-            "queensGamePuzzle"
-        ]["gridSize"]
-
-        if not grid:
-            raise ValueError("'colorGrid' list is empty or missing in the response")
-        if not puzzle_id:
-            raise ValueError("'puzzle_id' list is empty or missing in the response")
-        if not grid_size:
-            raise ValueError("'grid_size' list is empty or missing in the response")
-
-        # Initialise our own game board 2D array in preparation to copy
-        board = [[0 for _ in range(grid_size)] for _ in range(grid_size)]
-
-        # Iterate through the game board in the API response to create a local game board
-        for i, row in enumerate(grid):
-            if "colors" in row:
-                board[i] = row["colors"]
-            else:
-                raise ValueError(f"'colors' not found in row {i} of 'colorGrid'")
-
-        # solve the board
-        solution = solve_board(board)
-
-        return {"puzzleId": puzzle_id, "gridSize": grid_size, "board": board, "solution": solution}
 
+def parse_game(api_response, verify=False):
+    """Extract game board from API response (raw bytes or a decoded dict)"""
+    try:
+        return load_game(api_response, verify)
     except Exception as e:
         print(f"An error occurred while extracting game board from API response: {e}")
-        return {"error": str(e)}
+        return error_result(e)
+
+
+def load_game(api_response, verify=False):
+    """Parse and solve the game in an API response, raising if the board is malformed or can't be solved"""
+    # "colorGrid" in the API response is the game board, validated before it reaches the solver
+    with timed("parse"):
+        puzzle_id, grid_size, board = parse_game_payload(api_response)
+
+    # solve the board, unless an identical board has been solved before
+    solved = solve_cached(board)
+
+    game = {
+        "puzzleId": puzzle_id,
+        "gridSize": grid_size,
+        "board": board.rows(),
+        "solution": solved["solution"],
+        "solverStats": solved["solverStats"],
+    }
+
+    if verify:
+        game["verification"] = verify_board(board)
+
+    return game
+
+
+def error_result(e):
+    """Report an error as {"error": ...}, with a "status" when the solver gave up on the board"""
+    result = {"error": str(e)}
+    if getattr(e, "status", None):
+        result["status"] = e.status
+    return result
+
+
+@timed("parse")
+def parse_color_grid(grid, grid_size=None):
+    """Copy a 'colorGrid' list of {"colors": [...]} rows straight into a compact, validated Board"""
+    return build_board(grid, grid_size)
+
+
+def solve_payload(payload):
+    """
+    Solve one board given as a {"colorGrid": [...]} payload (optionally with gridSize and puzzleId),
+    or as a whole LinkedIn API response, which is handed to parse_game
+    """
+    if isinstance(payload, dict) and "data" in payload:
+        return parse_game(payload)
+
+    try:
+        if not isinstance(payload, dict):
+            raise ValueError("Expected a JSON object with a 'colorGrid' list")
+        board = parse_color_grid(payload.get("colorGrid"), payload.get("gridSize"))
+        solved = solve_cached(board)
+
+        game = {"gridSize": board.size, "board": board.rows(), **solved}
+        if payload.get("puzzleId") is not None:
+            game = {"puzzleId": payload["puzzleId"], **game}
+        return game
+
+    except Exception as e:
+        return error_result(e)
+
+
+def solve_payloads(payloads):
+    """Solve a single payload, or a list of payloads in order (errors are reported per board)"""
+    if not isinstance(payloads, list):
+        return solve_payload(payloads)
+    if len(payloads) > MAX_BATCH_BOARDS:
+        return {"error": f"Too many boards in one request ({len(payloads)}), the limit is {MAX_BATCH_BOARDS}"}
+
+    return [solve_payload(payload) for payload in payloads]
+
+
+def hint_payload(payload):
+    """
+    Hint the next move for a partially played board. The payload gives the board (as "board" rows
+    or a "colorGrid"), the player's "queens" and optionally "marks" (X-marked cells) as lists of
+    {"row", "col"} cells, and "complete": true to get the whole solution instead of one move.
+    """
+    try:
+        if not isinstance(payload, dict):
+            raise ValueError("Expected a JSON object with a 'board' or 'colorGrid' and 'queens'")
+        if "board" in payload:
+            board = Board.from_rows(payload["board"])
+            validate_board(board)
+        else:
+            board = parse_color_grid(payload.get("colorGrid"), payload.get("gridSize"))
+
+        queens, marks = payload.get("queens") or [], payload.get("marks") or []
+        if not isinstance(queens, list) or not isinstance(marks, list):
+            raise ValueError("'queens' and 'marks' must be lists of cells")
+
+        solver_stats = {}
+        with timed("solve"):
+            hint = get_hint(board, queens, marks, complete=bool(payload.get("complete")), stats=solver_stats)
+        record_solver_stats(solver_stats)
+        return hint
+
+    except Exception as e:
+        return error_result(e)
+
+
+def solve_cached(board):
+    """
+    Solve a board, reusing the cached solution for identical boards and for any rotation, reflection
+    or colour relabelling of them. Solutions are cached for the canonical board and mapped back.
+    """
+    cache = get_cache()
+    with timed("canonical"):
+        canonical, symmetry = canonical_form(board)
+    # Canonical boards are a subset of all boards, so keys never collide with entries from before
+    key = board_key(canonical)
+
+    # A request asking for a profile wants to see a real solve, not a cache hit
+    timings = current_timings()
+    solved = None if timings is not None and timings.profile else cache.get(key)
+    if solved is None:
+        # keep the search counters so the response shows how hard the board was
+        solver_stats = {}
+        try:
+            with timed("solve"):
+                solution = profile_call(
+                    solve_board,
+                    canonical,
+                    engine=SOLVER_ENGINE,
+                    stats=solver_stats,
+                    max_nodes=SOLVER_MAX_NODES,
+                    max_seconds=SOLVER_MAX_SECONDS,
+                )
+        finally:
+            record_solver_stats(solver_stats)
+        if not solution:
+            raise UnsolvableBoard(solver_stats.get("reason") or "Board has no solution")
+        solved = {"solution": solution, "solverStats": solver_stats}
+        cache.set(key, solved)
+
+    return {**solved, "solution": from_canonical(solved["solution"], canonical.size, symmetry)}
 
 
-def get_latest_game():
-    """Get the latest game from LinkedIn"""
+def verify_board(board):
+    """Confirm the puzzle is well-formed, i.e. has exactly one solution"""
+    solution_count = count_solutions(board, limit=2)
+    return {"solutionCount": solution_count, "unique": solution_count == 1}
+
+
+def is_valid_game(game):
+    """Check a held game is complete before serving it again"""
+    return (
+        isinstance(game, dict)
+        and game.get("puzzleId") is not None
+        and len(game.get("board") or []) == game.get("gridSize")
+        and len(game.get("solution") or []) == game.get("gridSize")
+    )
+
+
+async def load_latest_game():
+    """Fetch, parse and solve today's game, going to LinkedIn only if it isn't cached"""
+    cache = get_cache()
+    game = cache.get(LATEST_GAME_KEY)
+
+    if game is None:
+        api_response = await fetch_game_data()
+        # Raises on a bad board, so a failed load is never kept as warm state. Parsing and solving are
+        # CPU-bound, so they run off the event loop and other requests carry on meanwhile
+        game = await asyncio.to_thread(load_game, api_response)
+        # Archived first, so the archive can tell the cache the puzzle is today's
+        archive_game(game)
+        store_latest_game(game)
+
+    return game
+
+
+def puzzle_freshness(puzzle_id, now, previous_id=None):
+    """
+    Tell whether a fetched puzzle is the one published at the latest rollover: True if it is, False
+    if it is an earlier day's, None if that can't be told yet. It is today's if it isn't previous_id
+    (when given) or if the archive has it under today's date or after yesterday's puzzle. Otherwise it
+    is only assumed to be today's once LinkedIn has had PUZZLE_ROLLOVER_GRACE_SECONDS to publish it.
+    """
+    if previous_id is not None:
+        return puzzle_id != previous_id
+
+    archive = get_archive()
+    if archive is not None:
+        archived = archive.get(puzzle_id)
+        if archived:
+            return archived["date"] >= puzzle_date(now)
+        # Puzzle ids go up by one a day
+        yesterdays = archive.get_by_date(puzzle_date(last_rollover(now) - 1))
+        if yesterdays and puzzle_id > yesterdays["puzzleId"]:
+            return True
+
+    if now - last_rollover(now) >= PUZZLE_ROLLOVER_GRACE_SECONDS:
+        return True
+    return None
+
+
+def latest_game_expiry(now, game):
+    """
+    When to look for a newer latest game: at the next rollover once the game is known to be today's,
+    otherwise after LATEST_GAME_RECHECK_SECONDS so yesterday's puzzle isn't kept for a whole day
+    """
+    rollover = next_rollover(now)
+    if puzzle_freshness(game["puzzleId"], now):
+        return rollover
+    return min(now + LATEST_GAME_RECHECK_SECONDS, rollover)
+
+
+def store_latest_game(game, now=None):
+    # The latest puzzle is replaced at the daily rollover; a given puzzle never changes
+    now = time.time() if now is None else now
+    cache = get_cache()
+    cache.set(LATEST_GAME_KEY, game, expires_at=latest_game_expiry(now, game))
+    cache.set(puzzle_key(game["puzzleId"]), game)
+
+
+def archive_game(game, now=None, fresh=None):
+    """
+    Add a freshly fetched game to the archive under today's date, unless it may still be yesterday's
+    puzzle (fresh overrides the check). A failure here never fails the request.
+    """
+    archive = get_archive()
+    if archive is None:
+        return
+    now = time.time() if now is None else now
     try:
-        csrf_token = fetch_csrf_token()
-        api_response = make_api_request(csrf_token)
-        return parse_game(api_response)
+        if fresh is None:
+            fresh = puzzle_freshness(game["puzzleId"], now)
+        if fresh:
+            archive.add(game, puzzle_date(now))
+    except Exception as e:
+        print(f"An error occurred while archiving puzzle {game['puzzleId']}: {e}")
+
+
+def get_archived_game(puzzle_id=None, date=None):
+    """Look a past game up in the archive by puzzle id or by date, without going upstream"""
+    try:
+        archive = get_archive()
+        if date is not None:
+            date = parse_date(date)
+            game = archive and archive.get_by_date(date)
+            missing = f"No archived puzzle for {date}"
+        else:
+            game = archive and archive.get(puzzle_id)
+            missing = f"No archived puzzle with id {puzzle_id}"
+        return game or {"error": missing, "status": "notFound"}
+    except Exception as e:
+        print(f"An error occurred: {e}")
+        return error_result(e)
+
+
+# Concurrent requests that miss the warm game (e.g. the burst at rollover) share one fetch+solve
+in_flight = SingleFlight()
+
+
+async def load_latest_game_once():
+    return await in_flight.run(LATEST_GAME_KEY, load_latest_game)
+
+
+# Today's solved game, held in module scope for warm invocations until the daily rollover (or briefly, until
+# it is known to be today's)
+latest_game = AsyncWarmValue(load_latest_game_once, expires_at=latest_game_expiry, validate=is_valid_game)
+
+
+async def get_latest_game(verify=False):
+    """Get the latest game, reusing today's solved game when it is already held"""
+    try:
+        game = await latest_game.get()
+
+        if verify and "verification" not in game:
+            game = {**game, "verification": await asyncio.to_thread(verify_board, game["board"])}
+            latest_game.set(game)
+            store_latest_game(game)
+
+        return game
     except Exception as e:
         print(f"An error occurred: {e}")
-        return {"error": str(e)}
+        return error_result(e)
@@ -0,0 +1,110 @@
+import gzip
+import hashlib
+import json
+import threading
+import time
+
+from services.cache_service import next_rollover
+
+try:
+    import brotli
+except ImportError:  # Brotli isn't in every Lambda layer; gzip is always there
+    brotli = None
+
+# Content encodings in order of preference, with how to produce each
+ENCODERS = {"identity": None, "gzip": lambda body: gzip.compress(body, compresslevel=9, mtime=0)}
+if brotli is not None:
+    ENCODERS = {"br": lambda body: brotli.compress(body, quality=11), **ENCODERS}
+
+
+class EncodedGame:
+    """
+    A solved game encoded once: its JSON bytes, a compressed copy per content encoding and a weak
+    ETag. Built on first use and reused for every later request for the puzzle.
+    """
+
+    def __init__(self, game):
+        self.body = json.dumps(game, ensure_ascii=False, separators=(",", ":")).encode()
+        # Derived from the puzzle rather than the bytes, so every container gives the same ETag for a
+        # puzzle. The bytes also hold each container's solver stats and differ by encoding, so it is
+        # weak: it promises the same puzzle, not the same bytes
+        puzzle = [game["puzzleId"], game["board"], game["solution"], game.get("verification")]
+        self.tag = '"' + hashlib.sha256(json.dumps(puzzle, separators=(",", ":")).encode()).hexdigest()[:32] + '"'
+        self.etag = f"W/{self.tag}"
+
+        self.bodies = {encoding: encode(self.body) if encode else self.body for encoding, encode in ENCODERS.items()}
+
+    def matches(self, if_none_match):
+        """Check an If-None-Match header names this game (by weak comparison, as for GET)"""
+        if not if_none_match:
+            return False
+        tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+        return "*" in tags or self.tag in tags
+
+
+# Encoded games for the current puzzle, keyed by (puzzleId, verified)
+_encoded = {}
+_encoded_lock = threading.Lock()
+
+
+def encode_game(game):
+    """Return the EncodedGame for a solved game, encoding it only the first time the puzzle is seen"""
+    key = (game["puzzleId"], "verification" in game)
+    encoded = _encoded.get(key)
+    if encoded is None:
+        encoded = EncodedGame(game)
+        with _encoded_lock:
+            # Only the latest puzzle is served this way, so older ones are dropped
+            for stale in [other for other in _encoded if other[0] != key[0]]:
+                del _encoded[stale]
+            _encoded[key] = encoded
+    return encoded
+
+
+def choose_encoding(accept_encoding):
+    """Pick the preferred content encoding the client accepts (by Accept-Encoding), else identity"""
+    accepted = {}
+    for part in (accept_encoding or "").lower().split(","):
+        name, _, params = part.partition(";")
+        quality = 1.0
+        for param in params.split(";"):
+            key, _, value = param.strip().partition("=")
+            if key == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        accepted[name.strip()] = quality
+
+    for encoding in ENCODERS:
+        if accepted.get(encoding, accepted.get("*", 0.0)) > 0 and encoding != "identity":
+            return encoding
+    return "identity"
+
+
+def cache_headers(now=None, expires_at=None):
+    """
+    Cache-Control letting browsers and the API Gateway cache keep the response until expires_at,
+    by default the rollover
+    """
+    now = time.time() if now is None else now
+    expires_at = next_rollover(now) if expires_at is None else expires_at
+    return {"Cache-Control": f"public, max-age={max(0, int(expires_at - now))}", "Vary": "Accept-Encoding"}
+
+
+def game_response(game, if_none_match=None, accept_encoding=None, now=None, expires_at=None):
+    """
+    Return (status code, headers, body) for a solved game: 304 with no body if the client already
+    holds it, otherwise the pre-encoded bytes in the best encoding the client accepts. Pass the time
+    the server stops holding the game as expires_at, so clients don't keep it any longer.
+    """
+    encoded = encode_game(game)
+    encoding = choose_encoding(accept_encoding)
+    headers = {"ETag": encoded.etag, **cache_headers(now, expires_at)}
+
+    if encoded.matches(if_none_match):
+        return 304, headers, b""
+
+    if encoding != "identity":
+        headers["Content-Encoding"] = encoding
+    return 200, headers, encoded.bodies[encoding]
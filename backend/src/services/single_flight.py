@@ -0,0 +1,48 @@
+import asyncio
+
+
+class SingleFlight:
+    """
+    Coalesce concurrent calls for the same key into one in-flight task. Every caller waiting on a
+    key gets the same result or exception. A caller being cancelled doesn't cancel the shared
+    task unless it was the last one waiting.
+    """
+
+    def __init__(self):
+        self._calls = {}
+
+    def in_flight(self, key):
+        """Check if a call for key is currently running"""
+        call = self._calls.get(key)
+        return call is not None and not call[0].done()
+
+    async def run(self, key, fn):
+        """Await fn() for key, joining the in-flight call if there is one"""
+        loop = asyncio.get_running_loop()
+        call = self._calls.get(key)
+
+        if call is None or call[0].done() or call[0].get_loop() is not loop:
+            task = loop.create_task(fn())
+            call = [task, 0]
+            self._calls[key] = call
+            task.add_done_callback(lambda done: self._finish(key, done))
+
+        task = call[0]
+        call[1] += 1
+        try:
+            return await asyncio.shield(task)
+        except asyncio.CancelledError:
+            if not task.done() and call[1] == 1:
+                # Nobody else is waiting for the result, so stop the work too
+                task.cancel()
+            raise
+        finally:
+            call[1] -= 1
+
+    def _finish(self, key, task):
+        call = self._calls.get(key)
+        if call is not None and call[0] is task:
+            del self._calls[key]
+        if not task.cancelled():
+            # Mark the exception as retrieved even if every waiter was cancelled
+            task.exception()
@@ -0,0 +1,145 @@
+import json
+import os
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from config import ENVIRONMENT, METRICS_ENABLED, METRICS_NAMESPACE, PROFILE_DIR
+
+# Solver counters reported per request
+SOLVER_COUNTERS = ("nodes", "backtracks", "branchPoints")
+
+# Timings for the request being handled; tasks and threadpool calls inherit it from the middleware
+_current = ContextVar("request_timings", default=None)
+
+
+class RequestTimings:
+    """Per-stage timings and solver counters collected over one request"""
+
+    def __init__(self, profile=False):
+        self.started = time.perf_counter()
+        self.stages = {}
+        self.counters = {}
+        self.profile = profile
+        self.profile_path = None
+
+    def add(self, stage, seconds):
+        # A stage can run more than once (e.g. a GraphQL retry with a fresh token), so durations add up
+        self.stages[stage] = self.stages.get(stage, 0.0) + seconds * 1000
+
+    def count(self, name, value):
+        self.counters[name] = self.counters.get(name, 0) + value
+
+    def total_ms(self):
+        return (time.perf_counter() - self.started) * 1000
+
+    def server_timing(self):
+        """Format the timings as a Server-Timing header value"""
+        entries = [f"{stage};dur={ms:.1f}" for stage, ms in self.stages.items()]
+        if self.counters:
+            counters = " ".join(f"{name}={value}" for name, value in self.counters.items())
+            entries.append(f'solver;desc="{counters}"')
+        if self.profile_path:
+            entries.append(f'profile;desc="{os.path.basename(self.profile_path)}"')
+        entries.append(f"total;dur={self.total_ms():.1f}")
+        return ", ".join(entries)
+
+    def as_dict(self):
+        return {
+            "totalMs": round(self.total_ms(), 3),
+            "stagesMs": {stage: round(ms, 3) for stage, ms in self.stages.items()},
+            "solver": self.counters,
+        }
+
+
+def current_timings():
+    """Return the timings for the request being handled, or None outside a request"""
+    return _current.get()
+
+
+@contextmanager
+def request_timings(profile=False):
+    """Collect timings for everything run inside the block"""
+    timings = RequestTimings(profile=profile)
+    token = _current.set(timings)
+    try:
+        yield timings
+    finally:
+        _current.reset(token)
+
+
+@contextmanager
+def timed(stage):
+    """Add the time spent in the block to the current request's timings, if there is one"""
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        timings = _current.get()
+        if timings is not None:
+            timings.add(stage, time.perf_counter() - started)
+
+
+def record_solver_stats(stats):
+    timings = _current.get()
+    if timings is not None:
+        for name in SOLVER_COUNTERS:
+            timings.count(name, stats.get(name, 0))
+
+
+def profile_enabled():
+    return bool(PROFILE_DIR)
+
+
+def profile_call(function, *args, **kwargs):
+    """
+    Call the function, under cProfile if the current request asked for profiling. Only the first
+    call in a request is profiled, and its stats are dumped to a .prof file in PROFILE_DIR.
+    """
+    timings = _current.get()
+    if timings is None or not timings.profile or not profile_enabled():
+        return function(*args, **kwargs)
+
+    import cProfile
+
+    timings.profile = False
+    profiler = cProfile.Profile()
+    try:
+        return profiler.runcall(function, *args, **kwargs)
+    finally:
+        os.makedirs(PROFILE_DIR, exist_ok=True)
+        timings.profile_path = os.path.join(PROFILE_DIR, f"{function.__name__}-{time.time_ns()}.prof")
+        profiler.dump_stats(timings.profile_path)
+
+
+def emit_metrics(timings, route, status_code):
+    """Print the timings in CloudWatch Embedded Metric Format, which Lambda turns into metrics"""
+    if not METRICS_ENABLED:
+        return
+
+    values = {"totalMs": timings.total_ms()}
+    values.update({f"{stage}Ms": ms for stage, ms in timings.stages.items()})
+    values.update({f"solver{name[0].upper()}{name[1:]}": value for name, value in timings.counters.items()})
+    units = {name: "Milliseconds" if name.endswith("Ms") else "Count" for name in values}
+
+    print(
+        json.dumps(
+            {
+                "_aws": {
+                    "Timestamp": int(time.time() * 1000),
+                    "CloudWatchMetrics": [
+                        {
+                            "Namespace": METRICS_NAMESPACE,
+                            "Dimensions": [["Environment", "Route"]],
+                            "Metrics": [{"Name": name, "Unit": unit} for name, unit in units.items()],
+                        }
+                    ],
+                },
+                "Environment": ENVIRONMENT,
+                "Route": route,
+                "statusCode": status_code,
+                **values,
+            }
+        ),
+        flush=True,
+    )
@@ -0,0 +1,68 @@
+import threading
+import time
+
+
+class WarmValue:
+    """
+    A value kept in module scope so warm Lambda invocations can reuse it. It is loaded lazily on
+    first use and reloaded once it expires or fails validation.
+    """
+
+    def __init__(self, loader, ttl=None, expires_at=None, validate=None, clock=time.time):
+        # Either a fixed ttl in seconds, or expires_at(now, value) returning an absolute expiry time
+        self.loader = loader
+        self.ttl = ttl
+        self.expires_at = expires_at
+        self.validate = validate
+        self.clock = clock
+        self._value = None
+        self._expires = 0.0
+        self._lock = threading.Lock()
+
+    def _expiry(self, now, value):
+        if self.expires_at is not None:
+            return self.expires_at(now, value)
+        return now + self.ttl
+
+    def is_fresh(self):
+        """Check if the held value can be served without reloading"""
+        if self._value is None or self.clock() >= self._expires:
+            return False
+        return self.validate is None or self.validate(self._value)
+
+    def get(self):
+        # Fast path for warm invocations: no locking when the value is fresh
+        if self.is_fresh():
+            return self._value
+
+        with self._lock:
+            # Another thread may have reloaded while we waited for the lock
+            if not self.is_fresh():
+                self.set(self.loader())
+            return self._value
+
+    def set(self, value):
+        self._value = value
+        self._expires = self._expiry(self.clock(), value)
+
+    def expiry(self):
+        """Return the epoch time the held value expires at"""
+        return self._expires
+
+    def peek(self):
+        """Return the held value without loading, even if it has expired (None if nothing is held)"""
+        return self._value
+
+    def invalidate(self):
+        self._value = None
+
+
+class AsyncWarmValue(WarmValue):
+    """WarmValue whose loader is a coroutine function"""
+
+    async def get(self):
+        if self.is_fresh():
+            return self._value
+
+        self.set(await self.loader())
+        return self._value
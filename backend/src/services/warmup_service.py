@@ -0,0 +1,55 @@
+import asyncio
+import time
+
+from config import WARMUP_MAX_SECONDS, WARMUP_POLL_DELAY, WARMUP_POLL_MAX_DELAY, logger
+from utils.game_parser import parse_game_payload
+from services.api_service import fetch_game_data
+from services.game_service import archive_game, latest_game, load_game, puzzle_freshness, store_latest_game
+
+
+async def warm_up(previous_id=None, clock=time.time, sleep=asyncio.sleep, max_seconds=WARMUP_MAX_SECONDS):
+    """
+    Poll LinkedIn for the puzzle published at the rollover and, once it is out, solve and verify it
+    and fill the serving cache before traffic arrives. LinkedIn can lag the rollover, so a response
+    still carrying the previous puzzle is retried with a doubling delay for up to max_seconds.
+    A puzzle is new if it isn't previous_id (when given) or the archive places it after yesterday's.
+    With neither to go on, the first puzzle polled is taken to be the previous one and polling waits
+    for the id to change, so yesterday's puzzle is never warmed as today's.
+    """
+    held = latest_game.peek()
+    if latest_game.is_fresh() and puzzle_freshness(held["puzzleId"], clock(), previous_id):
+        return {"status": "alreadyWarm", "puzzleId": held["puzzleId"], "attempts": 0}
+
+    deadline = clock() + max_seconds
+    delay = WARMUP_POLL_DELAY
+    attempts = 0
+    first_id = None
+    while True:
+        attempts += 1
+        try:
+            api_response = await fetch_game_data()
+            puzzle_id = parse_game_payload(api_response).puzzle_id
+        except Exception as e:
+            logger.warning(f"Warm-up poll {attempts} failed: {e}")
+            puzzle_id = None
+        else:
+            fresh = puzzle_freshness(puzzle_id, clock(), previous_id)
+            if fresh is None:
+                fresh = first_id is not None and puzzle_id != first_id
+                first_id = puzzle_id if first_id is None else first_id
+            if fresh:
+                break
+
+        if clock() + delay > deadline:
+            return {"status": "unchanged", "puzzleId": puzzle_id, "attempts": attempts}
+        await sleep(delay)
+        delay = min(delay * 2, WARMUP_POLL_MAX_DELAY)
+
+    # Raises on a bad board, leaving the serving cache as it was
+    game = await asyncio.to_thread(load_game, api_response, True)
+    now = clock()
+    archive_game(game, now, fresh=True)
+    store_latest_game(game, now)
+    latest_game.set(game)
+    logger.info(f"Warmed puzzle {puzzle_id} after {attempts} poll(s)")
+    return {"status": "warmed", "puzzleId": puzzle_id, "attempts": attempts}
@@ -0,0 +1,69 @@
+from functools import lru_cache
+
+
+# Depends only on the board size, and rebuilt for every solve otherwise (the board generator runs
+# thousands of solves on one size)
+@lru_cache(maxsize=32)
+def build_adjacent_masks(size):
+    """Return, for every cell index, a mask of the cell and all cells touching it"""
+    # Columns col-1..col+1 within a single row, clipped to the board edges
+    col_spans = [((1 << min(col + 2, size)) - 1) & ~((1 << max(col - 1, 0)) - 1) for col in range(size)]
+    adjacent_masks = []
+
+    for row in range(size):
+        first_row, last_row = max(row - 1, 0), min(row + 1, size - 1)
+        for col in range(size):
+            adjacent = 0
+            for r in range(first_row, last_row + 1):
+                adjacent |= col_spans[col] << (r * size)
+            adjacent_masks.append(adjacent)
+
+    return tuple(adjacent_masks)
+
+
+def build_region_cells(board):
+    """Return colour regions as lists of precomputed cell masks, smallest region first"""
+    size = board.size
+    adjacent_masks = build_adjacent_masks(size)
+    regions = []
+
+    # Same ordering as the list-scan solver - by colour, then smallest regions first
+    for region in board.regions:
+        cells = []
+        for index in region:
+            row, col = divmod(index, size)
+            cells.append((row, col, 1 << row, 1 << col, 1 << index, adjacent_masks[index]))
+        regions.append(cells)
+
+    return sorted(regions, key=len)
+
+
+def solve_bitmask(board, stats):
+    """Solve the board using backtracking over integer bitmasks"""
+    regions = build_region_cells(board)
+    queens = []
+
+    def backtrack(region_index, used_rows, used_cols, blocked):
+        stats["nodes"] += 1
+
+        # Base case: if we've placed queens in all regions, we're done
+        if region_index >= len(regions):
+            return True
+
+        for row, col, row_bit, col_bit, cell_bit, adjacent in regions[region_index]:
+            # A single AND per constraint replaces the scan over placed queens
+            if used_rows & row_bit or used_cols & col_bit or blocked & cell_bit:
+                continue
+
+            queens.append({"row": row, "col": col})
+            if backtrack(region_index + 1, used_rows | row_bit, used_cols | col_bit, blocked | adjacent):
+                return True
+            queens.pop()
+            stats["backtracks"] += 1
+
+        return False
+
+    if backtrack(0, 0, 0, 0):
+        return queens
+    else:
+        return []  # No solution found
@@ -0,0 +1,83 @@
+from array import array
+
+# Colour byte for a cell that belongs to no region (used for partially coloured boards)
+UNCOLOURED = 255
+
+
+class Board:
+    """
+    A square Queens board stored compactly: one colour byte per cell in a flat, row-major buffer
+    (cell index = row * size + col), plus region tables built once and shared by every solver engine.
+    Boards are immutable, hashable and pickle as just their size and colour bytes.
+    """
+
+    __slots__ = ("size", "cells", "regions", "cell_regions")
+
+    def __init__(self, size, cells):
+        if len(cells) != size * size:
+            raise ValueError(f"A {size}x{size} board needs {size * size} cells, got {len(cells)}")
+        self.size = size
+        self.cells = bytes(cells)
+
+        # Cell indices of each colour region, ordered by colour value
+        by_colour = {}
+        for index, colour in enumerate(self.cells):
+            if colour != UNCOLOURED:
+                by_colour.setdefault(colour, []).append(index)
+        self.regions = tuple(tuple(by_colour[colour]) for colour in sorted(by_colour))
+
+        # Position in regions of each cell's region, or -1 for uncoloured cells
+        self.cell_regions = array("h", [-1]) * (size * size)
+        for region_index, region in enumerate(self.regions):
+            for index in region:
+                self.cell_regions[index] = region_index
+
+    @classmethod
+    def from_rows(cls, rows):
+        """Build a board from a list of colour rows (None marks an uncoloured cell); Boards pass through"""
+        if isinstance(rows, cls):
+            return rows
+
+        size = len(rows)
+        cells = bytearray(size * size)
+        for row_index, row in enumerate(rows):
+            if len(row) != size:
+                raise ValueError(f"Row {row_index} has {len(row)} cells, expected {size}")
+            try:
+                cells[row_index * size : (row_index + 1) * size] = [
+                    UNCOLOURED if colour is None else colour for colour in row
+                ]
+            except (TypeError, ValueError):
+                raise ValueError(f"Row {row_index} has colours outside 0-{UNCOLOURED - 1}") from None
+        return cls(size, cells)
+
+    def colour(self, row, col):
+        return self.cells[row * self.size + col]
+
+    def rows(self):
+        """Return the colours as a list of lists, e.g. for JSON responses"""
+        size = self.size
+        return [list(self.cells[row * size : (row + 1) * size]) for row in range(size)]
+
+    def __len__(self):
+        return self.size
+
+    def __getitem__(self, row):
+        # board[row][col] keeps working, but engines should index cells directly
+        return self.cells[row * self.size : (row + 1) * self.size]
+
+    def __iter__(self):
+        return (self[row] for row in range(self.size))
+
+    def __eq__(self, other):
+        return isinstance(other, Board) and self.size == other.size and self.cells == other.cells
+
+    def __hash__(self):
+        return hash((self.size, self.cells))
+
+    def __reduce__(self):
+        # The region tables are rebuilt on unpickling, so only the colour bytes cross process boundaries
+        return Board, (self.size, self.cells)
+
+    def __repr__(self):
+        return f"Board({self.size}, {self.cells!r})"
@@ -0,0 +1,232 @@
+import random
+
+from utils.board_solver import new_solver_stats
+from utils.constraint_solver import CandidateState, build_board_masks, search
+
+NEIGHBOUR_OFFSETS = ((-1, 0), (1, 0), (0, -1), (0, 1))
+
+
+def random_queen_columns(size, rng):
+    """Return a random placement of one queen per row and column with no two queens touching"""
+    cols = []
+    used = set()
+
+    def place(row):
+        if row == size:
+            return True
+        options = [col for col in range(size) if col not in used and (not cols or abs(col - cols[-1]) > 1)]
+        rng.shuffle(options)
+        for col in options:
+            cols.append(col)
+            used.add(col)
+            if place(row + 1):
+                return True
+            cols.pop()
+            used.remove(col)
+        return False
+
+    if not place(0):
+        raise ValueError(f"No queen placement exists for a {size}x{size} board")
+    return cols
+
+
+def neighbours(size, row, col):
+    for dr, dc in NEIGHBOUR_OFFSETS:
+        r, c = row + dr, col + dc
+        if 0 <= r < size and 0 <= c < size:
+            yield r, c
+
+
+def queen_solution(board, row, col):
+    """Return a solution of a (partially coloured) board with a queen on (row, col), or None"""
+    size = len(board)
+    state = CandidateState(build_board_masks(board), new_solver_stats("propagate"))
+    state.place(row * size + col)
+    solved = search(state, propagate=True)
+    return solved.solution() if solved else None
+
+
+def grow_regions(size, queen_cols, difficulty, rng):
+    """
+    Grow one colour region outward from each queen. A cell only joins a region if that can't
+    create a second solution, so the board stays unique as it fills up. Low difficulty grows
+    compact regions of similar size, high difficulty grows sprawling, uneven regions.
+    Cells that can't join any neighbouring region this way are left as None.
+    """
+    board = [[None] * size for _ in range(size)]
+    sizes = [1] * size
+    for row, col in enumerate(queen_cols):
+        board[row][col] = row
+    rejected = set()
+
+    while True:
+        # (cell, region) pairs that could still be joined, grouped by region
+        frontiers = [[] for _ in range(size)]
+        for row in range(size):
+            for col in range(size):
+                if board[row][col] is not None:
+                    continue
+                for r, c in neighbours(size, row, col):
+                    region = board[r][c]
+                    if region is not None and (row, col, region) not in rejected:
+                        frontiers[region].append((row, col))
+
+        growable = [region for region in range(size) if frontiers[region]]
+        if not growable:
+            return board
+
+        if rng.random() < difficulty:
+            region = rng.choice(growable)
+        else:
+            region = min(growable, key=lambda region: (sizes[region], rng.random()))
+
+        if rng.random() < difficulty:
+            row, col = rng.choice(frontiers[region])
+        else:
+            # Prefer the cell touching the region most, which keeps regions blob-shaped
+            row, col = max(frontiers[region], key=lambda cell: (frontiers[region].count(cell), rng.random()))
+
+        # Adding a cell can only add solutions - ones with this region's queen on the new cell
+        board[row][col] = region
+        if queen_solution(board, row, col) is not None:
+            board[row][col] = None
+            rejected.add((row, col, region))
+        else:
+            sizes[region] += 1
+
+
+def is_connected(board, region, skip=None):
+    """Check the region's cells (ignoring skip) form one orthogonally connected group"""
+    size = len(board)
+    cells = {(r, c) for r in range(size) for c in range(size) if board[r][c] == region and (r, c) != skip}
+    if not cells:
+        return False
+
+    stack = [next(iter(cells))]
+    seen = {stack[0]}
+    while stack:
+        for cell in neighbours(size, *stack.pop()):
+            if cell in cells and cell not in seen:
+                seen.add(cell)
+                stack.append(cell)
+    return len(seen) == len(cells)
+
+
+def safe_move(board, cells, rng):
+    """
+    Move one of the given cells into a neighbouring region without adding any solution.
+    Moving a queen cell of a solution into a region that already holds one of its queens rules
+    that solution out, and taking a cell away from a region never creates a new one, so the move
+    is safe as long as no solution puts the target region's queen on the moved cell.
+    """
+    size = len(board)
+    cells = list(cells)
+    rng.shuffle(cells)
+
+    for row, col in cells:
+        region = board[row][col]
+        if not is_connected(board, region, skip=(row, col)):
+            continue
+        targets = list({board[r][c] for r, c in neighbours(size, row, col)} - {region, None})
+        rng.shuffle(targets)
+        for target in targets:
+            board[row][col] = target
+            if queen_solution(board, row, col) is None:
+                return True
+            board[row][col] = region
+
+    return False
+
+
+def uncolour(board, row, col, queens):
+    """
+    Take a cell out of its region along with any part of the region that gets cut off from
+    the region's queen. Removing cells can only ever remove solutions.
+    """
+    size = len(board)
+    region = board[row][col]
+    board[row][col] = None
+
+    stack = [next(queen for queen in queens if board[queen[0]][queen[1]] == region)]
+    seen = {stack[0]}
+    while stack:
+        for cell in neighbours(size, *stack.pop()):
+            if cell not in seen and board[cell[0]][cell[1]] == region:
+                seen.add(cell)
+                stack.append(cell)
+
+    for r in range(size):
+        for c in range(size):
+            if board[r][c] == region and (r, c) not in seen:
+                board[r][c] = None
+
+
+def settle_cell(board, row, col, queens, rng, destructive=False):
+    """
+    Colour a cell that no neighbouring region could take without a second solution appearing.
+    After joining a region, any solution with a queen on it is ruled out again by moving one of
+    its other queen cells elsewhere - or, if destructive, uncolouring one when nothing can move.
+    Returns False (leaving the cell uncoloured) if that doesn't work out.
+    """
+    size = len(board)
+    targets = list({board[r][c] for r, c in neighbours(size, row, col)} - {None})
+    rng.shuffle(targets)
+
+    for target in targets[:1] if destructive else targets:
+        board[row][col] = target
+        for _ in range(size * size):
+            solution = queen_solution(board, row, col)
+            if solution is None:
+                return True
+            cells = {(queen["row"], queen["col"]) for queen in solution} - queens - {(row, col)}
+            if safe_move(board, cells, rng):
+                continue
+            if not destructive:
+                break
+            uncolour(board, *rng.choice(sorted(cells)), queens)
+        board[row][col] = None
+
+    return False
+
+
+def generate_board(size, difficulty=0.5, seed=None):
+    """
+    Generate a valid Queens board with exactly one solution and contiguous colour regions.
+    difficulty (0-1) controls region shape, from compact and even to sprawling and uneven.
+    Returns (board, solution) where solution is the list of queen positions.
+    """
+    if not 0 <= difficulty <= 1:
+        raise ValueError("difficulty must be between 0 and 1")
+    if size < 4:
+        raise ValueError("Queens boards need to be at least 4x4")
+
+    rng = random.Random(seed)
+    while True:
+        queen_cols = random_queen_columns(size, rng)
+        board = grow_regions(size, queen_cols, difficulty, rng)
+        queens = set(enumerate(queen_cols))
+        if fill_remaining(board, queens, rng):
+            return board, [{"row": row, "col": col} for row, col in enumerate(queen_cols)]
+
+
+def fill_remaining(board, queens, rng):
+    """Settle every cell the regions couldn't grow into, returning False if that doesn't finish"""
+    size = len(board)
+    for _ in range(size):
+        stuck = [
+            (row, col)
+            for row in range(size)
+            for col in range(size)
+            if board[row][col] is None and any(board[r][c] is not None for r, c in neighbours(size, row, col))
+        ]
+        if not stuck:
+            return True
+
+        # Only uncolour other cells (which then need settling too) when nothing else works
+        rng.shuffle(stuck)
+        while stuck and settle_cell(board, *stuck[-1], queens, rng):
+            stuck.pop()
+        if stuck:
+            settle_cell(board, *stuck[-1], queens, rng, destructive=True)
+
+    return False
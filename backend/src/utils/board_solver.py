@@ -1,18 +1,69 @@
+import time
+from importlib import import_module
+from itertools import islice
+
+from utils.bitmask_solver import build_region_cells
+from utils.board import Board
+from utils.feasibility import find_infeasibility
+
+# Solver engines selectable by name, imported on first use
+SOLVER_ENGINES = {
+    "backtrack": "utils.board_solver:solve_backtrack",
+    "iterative": "utils.board_solver:solve_iterative",
+    "bitmask": "utils.bitmask_solver:solve_bitmask",
+    "mrv": "utils.constraint_solver:solve_mrv",
+    "propagate": "utils.constraint_solver:solve_propagate",
+    "dlx": "utils.dlx_solver:solve_dlx",
+    # Needs NumPy, falling back to "propagate" without it
+    "numpy": "utils.numpy_solver:solve_numpy",
+    # Races several of the above in separate processes, taking the first answer
+    "portfolio": "utils.portfolio_solver:solve_portfolio",
+}
+DEFAULT_ENGINE = "propagate"
+
+# How often (in nodes) a budgeted solve checks the clock
+BUDGET_CLOCK_INTERVAL = 64
+
+
+class UnsolvableBoard(ValueError):
+    """The board has no solution"""
+
+    status = "unsolvable"
+
+
+class SolveBudgetExceeded(RuntimeError):
+    """The solve expanded more nodes or ran longer than its budget allowed"""
+
+    status = "budgetExceeded"
+
+
+class BudgetedStats(dict):
+    """
+    Solver counters that stop the search once the node count or elapsed time passes its budget.
+    Every engine counts nodes in its stats, so the budget applies to all of them without changes.
+    """
+
+    def __init__(self, stats, max_nodes=None, max_seconds=None):
+        super().__init__(stats)
+        self.max_nodes = max_nodes
+        self.deadline = None if max_seconds is None else time.perf_counter() + max_seconds
+
+    def __setitem__(self, name, value):
+        super().__setitem__(name, value)
+        if name != "nodes":
+            return
+        if self.max_nodes is not None and value > self.max_nodes:
+            raise SolveBudgetExceeded(f"Solve gave up after {self.max_nodes} nodes")
+        if self.deadline is not None and not value % BUDGET_CLOCK_INTERVAL and time.perf_counter() > self.deadline:
+            raise SolveBudgetExceeded(f"Solve gave up after {value} nodes, out of time")
+
+
 def get_sorted_colour_regions(board):
-    """Return a list of unique colours in the board"""
-    # Find max colour value in board by flattening 2D array and getting max
-    max_colour = max(max(row) for row in board)
-    regions = [[] for _ in range(max_colour + 1)]
-
-    # Iterate through board to find all instances of each colour
-    for row in range(len(board)):
-        for col in range(len(board)):
-            colour = board[row][col]
-            # Store every instance of each colour
-            regions[colour].append([row, col])
-
-    # Filter out empty arrays first, then sort by length
-    regions = [coords for coords in regions if coords]
+    """Return the board's colour regions as lists of (row, col) cells, smallest region first"""
+    size = board.size
+    regions = [[divmod(index, size) for index in region] for region in board.regions]
+
+    # Regions come ordered by colour, so ties in size keep colour order
     regions.sort(key=len)
 
     return regions
@@ -35,21 +86,130 @@ def is_safe(board, queens, row, col):
     return True
 
 
-def has_queen_in_region(queens, region):
-    """Check if a colour region already has a queen"""
-    for queen_pos in queens:
-        if queen_pos in region:
-            return True
-    return False
+def get_solver_engine(engine):
+    """Return the solve function registered under the given engine name"""
+    if engine not in SOLVER_ENGINES:
+        raise ValueError(f"Unknown solver engine '{engine}', expected one of {sorted(SOLVER_ENGINES)}")
+
+    module_name, function_name = SOLVER_ENGINES[engine].split(":")
+    return getattr(import_module(module_name), function_name)
+
+
+def new_solver_stats(engine):
+    """Return zeroed search counters for a solve"""
+    return {"engine": engine, "nodes": 0, "backtracks": 0, "propagationRounds": 0, "branchPoints": 0}
+
+
+def solve_board(board, engine=DEFAULT_ENGINE, stats=None, max_nodes=None, max_seconds=None):
+    """
+    Solve the board with the selected engine, returning a list of queen positions (empty if the
+    board has no solution). Pass a dict as stats to have it filled with the engine's search counters
+    and a "status" of "solved", "unsolvable" (with a "reason" when caught before search) or
+    "budgetExceeded". With max_nodes or max_seconds set, a solve that runs past either raises
+    SolveBudgetExceeded.
+
+    Most engines, including the default "propagate", search recursively, so Python stack use grows
+    with the board. Only engine="iterative" (iter_solutions) keeps its own stack.
+    """
+    solver = get_solver_engine(engine)
+    board = Board.from_rows(board)
+    if stats is None:
+        stats = {}
+    stats.update(new_solver_stats(engine))
 
+    reason = find_infeasibility(board)
+    if reason:
+        stats.update(status="unsolvable", reason=reason)
+        return []
 
-def solve_board(board):
+    if max_nodes is None and max_seconds is None:
+        solution = solver(board, stats)
+    else:
+        budgeted = BudgetedStats(stats, max_nodes, max_seconds)
+        try:
+            solution = solver(board, budgeted)
+        except SolveBudgetExceeded:
+            stats.update(budgeted, status="budgetExceeded")
+            raise
+        stats.update(budgeted)
+
+    stats["status"] = "solved" if solution else "unsolvable"
+    return solution
+
+
+def count_solutions(board, limit=2):
+    """
+    Count the board's solutions, stopping as soon as limit is reached. With the default limit of 2
+    this is a uniqueness check that costs at most about two solves. Solutions come from the Dancing
+    Links search, which recurses (it is faster than iter_solutions at proving uniqueness).
+    """
+    from utils.dlx_solver import iter_dlx_solutions
+
+    board = Board.from_rows(board)
+    if find_infeasibility(board):
+        return 0
+    return sum(1 for _ in islice(iter_dlx_solutions(board), limit))
+
+
+def iter_solutions(board, stats=None):
+    """
+    Lazily yield every solution of the board as a list of queen positions, in the order the
+    backtracking engine finds them (one region at a time, smallest region first). The search keeps
+    its own stack rather than recursing, so Python stack use doesn't grow with the board, and a
+    consumer can take as many solutions as it needs and stop.
+    """
+    board = Board.from_rows(board)
+    if stats is None:
+        stats = new_solver_stats("iterative")
+    regions = build_region_cells(board)
+    queens = []
+
+    stats["nodes"] += 1
+    if not regions:
+        yield []
+        return
+
+    # One frame per region being filled: the next of its cells to try, then the rows, columns and
+    # cells ruled out by the queens placed in earlier regions
+    stack = [[0, 0, 0, 0]]
+    while stack:
+        frame = stack[-1]
+        cells = regions[len(stack) - 1]
+        position, used_rows, used_cols, blocked = frame
+        while position < len(cells):
+            row, col, row_bit, col_bit, cell_bit, adjacent = cells[position]
+            position += 1
+            if not (used_rows & row_bit or used_cols & col_bit or blocked & cell_bit):
+                break
+        else:
+            # No cell of this region is left, so undo the queen in the region before
+            stack.pop()
+            if queens:
+                queens.pop()
+                stats["backtracks"] += 1
+            continue
+
+        frame[0] = position
+        queens.append({"row": row, "col": col})
+        stats["nodes"] += 1
+        if len(stack) == len(regions):
+            yield list(queens)
+            # Resumed for another solution: carry on from the next cell of the last region
+            queens.pop()
+            stats["backtracks"] += 1
+        else:
+            stack.append([0, used_rows | row_bit, used_cols | col_bit, blocked | adjacent])
+
+
+def solve_backtrack(board, stats):
     """Solve the board using backtracking"""
     # Optimisation - get colour regions sorted from smallest to largest
     colour_regions = get_sorted_colour_regions(board)
     queens = []
 
     def backtrack(region_index):
+        stats["nodes"] += 1
+
         # Base case: if we've placed queens in all regions, we're done
         if region_index >= len(colour_regions):
             return True
@@ -72,6 +232,7 @@ def solve_board(board):
 
                 # If placing queen here didn't work, remove it and try next position
                 queens.pop()
+                stats["backtracks"] += 1
 
         # If we've tried all positions in this region and none worked
         return False
@@ -81,3 +242,8 @@ def solve_board(board):
         return queens
     else:
         return []  # No solution found
+
+
+def solve_iterative(board, stats):
+    """Solve the board with the stack-based search of iter_solutions, taking its first solution"""
+    return next(iter_solutions(board, stats), [])
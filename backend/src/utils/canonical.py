@@ -0,0 +1,66 @@
+from functools import lru_cache
+
+from utils.board import UNCOLOURED, Board
+
+# The 8 symmetries of the square, as functions of (row, col) and n = size - 1
+SYMMETRIES = (
+    lambda row, col, n: (row, col),  # identity
+    lambda row, col, n: (col, n - row),  # rotate 90 clockwise
+    lambda row, col, n: (n - row, n - col),  # rotate 180
+    lambda row, col, n: (n - col, row),  # rotate 270 clockwise
+    lambda row, col, n: (row, n - col),  # mirror left-right
+    lambda row, col, n: (n - row, col),  # mirror top-bottom
+    lambda row, col, n: (col, row),  # transpose
+    lambda row, col, n: (n - col, n - row),  # anti-transpose
+)
+
+
+@lru_cache(maxsize=32)
+def symmetry_sources(size):
+    """
+    For each symmetry, the cell index of the original board that lands on each cell of the
+    transformed board, so a transformed board is just its cells gathered in that order
+    """
+    n = size - 1
+    sources = []
+    for symmetry in SYMMETRIES:
+        source = [0] * (size * size)
+        for index in range(size * size):
+            row, col = symmetry(*divmod(index, size), n)
+            source[row * size + col] = index
+        sources.append(tuple(source))
+    return tuple(sources)
+
+
+def relabel(cells):
+    """Renumber colours 0, 1, 2... in order of first appearance, leaving uncoloured cells alone"""
+    table = bytearray(range(256))
+    label = 0
+    for colour in dict.fromkeys(cells):
+        if colour != UNCOLOURED:
+            table[colour] = label
+            label += 1
+    return cells.translate(table)
+
+
+def canonical_form(board):
+    """
+    Map a board to a normal form shared by all of its rotations, reflections and colour
+    relabellings: of the 8 transformed boards with colours renumbered by first appearance, the one
+    with the smallest colour bytes. Returns (canonical Board, symmetry index). Solutions of the
+    canonical board map back with from_canonical.
+    """
+    board = Board.from_rows(board)
+    best, best_symmetry = None, 0
+    for symmetry, source in enumerate(symmetry_sources(board.size)):
+        cells = relabel(bytes(map(board.cells.__getitem__, source)))
+        if best is None or cells < best:
+            best, best_symmetry = cells, symmetry
+    return Board(board.size, best), best_symmetry
+
+
+def from_canonical(solution, size, symmetry):
+    """Map a solution of the canonical board back to the board it came from, in row order"""
+    source = symmetry_sources(size)[symmetry]
+    indices = sorted(source[queen["row"] * size + queen["col"]] for queen in solution)
+    return [{"row": index // size, "col": index % size} for index in indices]
@@ -0,0 +1,252 @@
+from collections import namedtuple
+
+from utils.bitmask_solver import build_adjacent_masks
+from utils.board import Board
+
+# Precomputed masks for one board. Cells are bits indexed row * size + col.
+BoardMasks = namedtuple("BoardMasks", ["size", "rows", "cols", "regions", "attacks", "cell_regions"])
+
+
+def build_board_masks(board):
+    """
+    Precompute row, column, region and per-cell attack masks for a board. Uncoloured cells
+    belong to no region and never hold a queen (used for partially coloured boards).
+    """
+    board = Board.from_rows(board)
+    size = board.size
+    adjacent_masks = build_adjacent_masks(size)
+
+    rows = [((1 << size) - 1) << (row * size) for row in range(size)]
+    first_col = sum(1 << (row * size) for row in range(size))
+    cols = [first_col << col for col in range(size)]
+
+    # Regions come ordered by colour, then are ordered smallest first like the other engines
+    regions = sorted((sum(1 << index for index in region) for region in board.regions), key=lambda m: m.bit_count())
+
+    # Position of each cell's region in the regions list
+    cell_regions = [-1] * (size * size)
+    for region_index, region in enumerate(regions):
+        for index in iter_bits(region):
+            cell_regions[index] = region_index
+
+    # Placing a queen on a cell rules out its row, column, region and neighbours (and the cell itself)
+    attacks = [
+        rows[index // size]
+        | cols[index % size]
+        | (regions[cell_regions[index]] if cell_regions[index] >= 0 else 0)
+        | adjacent_masks[index]
+        for index in range(size * size)
+    ]
+
+    return BoardMasks(size, rows, cols, regions, attacks, cell_regions)
+
+
+def iter_bits(mask):
+    """Yield the index of every set bit in mask, lowest first"""
+    while mask:
+        low = mask & -mask
+        yield low.bit_length() - 1
+        mask ^= low
+
+
+class CandidateState:
+    """
+    Remaining candidate cells and placed queens for one point in the search. The number of
+    candidates left in each region is kept up to date as cells are eliminated, so choosing the
+    most constrained region never needs a rescan of the board.
+    """
+
+    __slots__ = ("masks", "candidates", "queens", "counts", "dead", "stats")
+
+    def __init__(self, masks, stats):
+        self.masks = masks
+        self.candidates = 0
+        for region in masks.regions:
+            self.candidates |= region
+        self.queens = 0
+        self.counts = [region.bit_count() for region in masks.regions]
+        self.dead = False
+        self.stats = stats
+
+    def copy(self):
+        state = CandidateState.__new__(CandidateState)
+        state.masks = self.masks
+        state.candidates = self.candidates
+        state.queens = self.queens
+        state.counts = self.counts[:]
+        state.dead = self.dead
+        state.stats = self.stats
+        return state
+
+    def eliminate(self, mask):
+        """Remove cells from the candidates, marking the state dead if an open region runs out"""
+        removed = self.candidates & mask
+        if not removed:
+            return
+
+        self.candidates ^= removed
+        counts, cell_regions = self.counts, self.masks.cell_regions
+        for index in iter_bits(removed):
+            region_index = cell_regions[index]
+            counts[region_index] -= 1
+            if not counts[region_index] and not self.masks.regions[region_index] & self.queens:
+                self.dead = True
+
+    def place(self, index):
+        """Place a queen on a candidate cell and remove every cell it attacks"""
+        self.queens |= 1 << index
+        self.eliminate(self.masks.attacks[index])
+
+    def is_solved(self):
+        return self.queens.bit_count() == self.masks.size
+
+    def open_units(self, units):
+        """Return the units (rows, columns or regions) that don't have a queen yet"""
+        return [unit for unit in units if not unit & self.queens]
+
+    def propagate(self):
+        """Apply forced moves and eliminations until nothing changes. Returns False on contradiction."""
+        masks = self.masks
+
+        while not self.dead:
+            self.stats["propagationRounds"] += 1
+            before = self.candidates
+
+            for units in (masks.regions, masks.rows, masks.cols):
+                for unit in units:
+                    if unit & self.queens:
+                        continue
+
+                    cells = self.candidates & unit
+                    if not cells:
+                        return False
+
+                    if not cells & (cells - 1):
+                        # Only one cell left for this unit - the queen must go there
+                        self.place(cells.bit_length() - 1)
+                        continue
+
+                    # Any cell attacked by every remaining candidate of the unit can never hold a queen
+                    common = -1
+                    for index in iter_bits(cells):
+                        common &= masks.attacks[index]
+                    self.eliminate(common & ~unit)
+
+            if self.candidates != before:
+                continue
+
+            # Only once the cheap rules stall: N regions confined to N rows (or columns) own
+            # those lines, and N lines confined to N regions own those regions
+            if not (
+                self.lock(masks.regions, masks.rows, True)
+                and self.lock(masks.regions, masks.cols, True)
+                and self.lock(masks.rows, masks.regions, False)
+                and self.lock(masks.cols, masks.regions, False)
+            ):
+                return False
+
+            if self.candidates == before:
+                return True
+
+        return False
+
+    def lock(self, units, lines, contiguous):
+        """
+        Find groups of k open units whose candidates lie within k lines, and clear every other
+        candidate from those lines. Returns False if more than k units are confined to k lines.
+        """
+        open_units = self.open_units(units)
+        open_lines = [i for i, line in enumerate(lines) if not line & self.queens]
+        if len(open_units) < 2:
+            return True
+
+        # For each open unit, the set of line indices (as a bitmask) its candidates touch
+        spans = []
+        for unit in open_units:
+            cells = self.candidates & unit
+            spans.append(sum(1 << i for i in open_lines if cells & lines[i]))
+
+        line_sets = set(spans)
+        if contiguous:
+            # Confined regions usually span neighbouring lines, so try every run of open lines too
+            for start in range(len(open_lines)):
+                line_set = 0
+                for i in open_lines[start:]:
+                    line_set |= 1 << i
+                    line_sets.add(line_set)
+
+        for line_set in line_sets:
+            size = line_set.bit_count()
+            if size >= len(open_lines):
+                continue
+
+            inside = [unit for unit, span in zip(open_units, spans) if not span & ~line_set]
+            if len(inside) > size:
+                return False
+            if len(inside) == size:
+                owned = 0
+                for unit in inside:
+                    owned |= unit
+                for i in iter_bits(line_set):
+                    self.eliminate(lines[i] & ~owned)
+
+        return True
+
+    def next_region(self):
+        """Return the open region with the fewest candidates left (most constrained first)"""
+        best, best_count = 0, None
+        for region, count in zip(self.masks.regions, self.counts):
+            if region & self.queens:
+                continue
+            if best_count is None or count < best_count:
+                best, best_count = region, count
+                if count <= 1:
+                    break
+        return best
+
+    def solution(self):
+        """Return the placed queens as a list of row/col dicts"""
+        size = self.masks.size
+        return [{"row": index // size, "col": index % size} for index in iter_bits(self.queens)]
+
+
+def search(state, propagate):
+    """Depth-first search over the most constrained region, optionally propagating at each node"""
+    stats = state.stats
+    stats["nodes"] += 1
+
+    if state.dead or (propagate and not state.propagate()):
+        return None
+    if state.is_solved():
+        return state
+
+    region = state.next_region()
+    stats["branchPoints"] += 1
+
+    for index in iter_bits(state.candidates & region):
+        child = state.copy()
+        child.place(index)
+        solved = search(child, propagate)
+        if solved:
+            return solved
+        stats["backtracks"] += 1
+
+    return None
+
+
+def solve_mrv(board, stats):
+    """Solve the board by backtracking on whichever region has the fewest legal cells left"""
+    solved = search(CandidateState(build_board_masks(board), stats), propagate=False)
+    if solved:
+        return solved.solution()
+    else:
+        return []  # No solution found
+
+
+def solve_propagate(board, stats):
+    """Solve the board with constraint propagation, branching only when propagation stalls"""
+    solved = search(CandidateState(build_board_masks(board), stats), propagate=True)
+    if solved:
+        return solved.solution()
+    else:
+        return []  # No solution found
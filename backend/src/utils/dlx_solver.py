@@ -0,0 +1,150 @@
+from utils.board import Board
+
+
+def build_cover_matrix(board):
+    """
+    Turn the board into an exact-cover matrix. There is one option per cell, covering its row,
+    its column and its colour region (primary columns, each covered exactly once) plus every
+    2x2 block containing the cell (secondary columns, covered at most once, so no two queens touch).
+    Returns (column_count, primary_count, options) where options[cell_index] lists column numbers.
+    Every cell needs a colour, as its option covers its region's column.
+    """
+    board = Board.from_rows(board)
+    size = board.size
+    if -1 in board.cell_regions:
+        row, col = divmod(board.cell_regions.index(-1), size)
+        raise ValueError(f"Cell ({row}, {col}) has no colour, every cell needs one for exact cover")
+    primary_count = 2 * size + len(board.regions)
+    blocks = size - 1
+
+    options = []
+    for row in range(size):
+        for col in range(size):
+            columns = [row, size + col, 2 * size + board.cell_regions[row * size + col]]
+            for block_row in range(max(row - 1, 0), min(row, blocks - 1) + 1):
+                for block_col in range(max(col - 1, 0), min(col, blocks - 1) + 1):
+                    columns.append(primary_count + block_row * blocks + block_col)
+            options.append(columns)
+
+    return primary_count + blocks * blocks, primary_count, options
+
+
+class DancingLinks:
+    """Knuth's Algorithm X over a toroidal doubly linked list, stored in flat integer arrays"""
+
+    def __init__(self, column_count, primary_count, options):
+        # Node 0 is the root, nodes 1..column_count are column headers
+        header_count = column_count + 1
+        self.left = list(range(-1, header_count - 1))
+        self.right = list(range(1, header_count + 1))
+        self.up = list(range(header_count))
+        self.down = list(range(header_count))
+        self.column = list(range(header_count))
+        self.sizes = [0] * header_count
+        self.option_of = [-1] * header_count
+
+        # Only primary columns are linked into the root's list; secondary headers link to themselves
+        self.left[0], self.right[primary_count] = primary_count, 0
+        for header in range(primary_count + 1, header_count):
+            self.left[header] = self.right[header] = header
+
+        for option, columns in enumerate(options):
+            first = len(self.left)
+            for offset, column in enumerate(columns):
+                node = first + offset
+                header = column + 1
+                self.left.append(node - 1 if offset else first + len(columns) - 1)
+                self.right.append(node + 1 if offset < len(columns) - 1 else first)
+                self.up.append(self.up[header])
+                self.down.append(header)
+                self.down[self.up[header]] = node
+                self.up[header] = node
+                self.column.append(header)
+                self.option_of.append(option)
+                self.sizes[header] += 1
+
+    def cover(self, header):
+        left, right, up, down, column, sizes = self.left, self.right, self.up, self.down, self.column, self.sizes
+        right[left[header]] = right[header]
+        left[right[header]] = left[header]
+        i = down[header]
+        while i != header:
+            j = right[i]
+            while j != i:
+                down[up[j]] = down[j]
+                up[down[j]] = up[j]
+                sizes[column[j]] -= 1
+                j = right[j]
+            i = down[i]
+
+    def uncover(self, header):
+        left, right, up, down, column, sizes = self.left, self.right, self.up, self.down, self.column, self.sizes
+        i = up[header]
+        while i != header:
+            j = left[i]
+            while j != i:
+                sizes[column[j]] += 1
+                down[up[j]] = j
+                up[down[j]] = j
+                j = left[j]
+            i = up[i]
+        right[left[header]] = header
+        left[right[header]] = header
+
+    def search(self, chosen, stats):
+        """Yield every exact cover as a list of option numbers (the list is reused, copy it to keep it)"""
+        right, down, sizes = self.right, self.down, self.sizes
+        stats["nodes"] += 1
+
+        if right[0] == 0:
+            yield chosen
+            return
+
+        # Branch on the primary column with the fewest remaining options
+        header, best = right[0], sizes[right[0]]
+        candidate = right[header]
+        while candidate != 0 and best > 1:
+            if sizes[candidate] < best:
+                header, best = candidate, sizes[candidate]
+            candidate = right[candidate]
+        if best == 0:
+            return
+
+        stats["branchPoints"] += 1
+        self.cover(header)
+
+        node = down[header]
+        while node != header:
+            chosen.append(self.option_of[node])
+            j = right[node]
+            while j != node:
+                self.cover(self.column[j])
+                j = right[j]
+
+            yield from self.search(chosen, stats)
+
+            j = self.left[node]
+            while j != node:
+                self.uncover(self.column[j])
+                j = self.left[j]
+            chosen.pop()
+            stats["backtracks"] += 1
+            node = down[node]
+
+        self.uncover(header)
+
+
+def iter_dlx_solutions(board, stats=None):
+    """Lazily yield every solution of the board as a list of queen positions"""
+    if stats is None:
+        stats = {"nodes": 0, "backtracks": 0, "branchPoints": 0}
+    size = len(board)
+    links = DancingLinks(*build_cover_matrix(board))
+
+    for chosen in links.search([], stats):
+        yield [{"row": cell // size, "col": cell % size} for cell in sorted(chosen)]
+
+
+def solve_dlx(board, stats):
+    """Solve the board as an exact-cover problem using Dancing Links"""
+    return next(iter_dlx_solutions(board, stats), [])
@@ -0,0 +1,80 @@
+from utils.board import UNCOLOURED
+
+
+def find_infeasibility(board):
+    """
+    Cheap checks that rule a board out before any search. Returns the reason the board can't be a
+    valid puzzle, or None if it passes. Boards with uncoloured cells are only checked for Hall's
+    condition, as partially coloured boards are expected to have too few (and unfinished) regions.
+    """
+    size = board.size
+    count = len(board.regions)
+
+    # One pass over the cells builds each region's cell mask and the rows and columns it touches
+    regions, row_spans, col_spans = [0] * count, [0] * count, [0] * count
+    for index, region in enumerate(board.cell_regions):
+        if region >= 0:
+            row, col = divmod(index, size)
+            regions[region] |= 1 << index
+            row_spans[region] |= 1 << row
+            col_spans[region] |= 1 << col
+
+    if UNCOLOURED not in board.cells:
+        if count != size:
+            return f"Board has {count} colour regions, expected {size}"
+        first_col = sum(1 << (row * size) for row in range(size))
+        for region, cells in zip(regions, board.regions):
+            if not is_contiguous(region, size, first_col):
+                row, col = divmod(cells[0], size)
+                return f"Colour region {board.cells[cells[0]]} (at row {row}, col {col}) is not contiguous"
+
+    # Every region needs a queen in a row (and a column) of its own
+    for spans, name in ((row_spans, "rows"), (col_spans, "columns")):
+        stuck = unmatched_regions(spans)
+        if stuck:
+            return f"{len(stuck)} colour regions can't each have a queen in different {name}"
+
+    return None
+
+
+def is_contiguous(region, size, first_col):
+    """
+    Check every cell of the region mask can be reached from its lowest cell through edge-adjacent
+    cells. first_col is the mask of the board's first column.
+    """
+    # Shifting one cell sideways wraps into the next row, so clear the column the wrapped cells land in
+    not_first_col = ~first_col
+    not_last_col = ~(first_col << (size - 1))
+
+    reached = region & -region
+    while True:
+        grown = (
+            reached | reached << size | reached >> size | (reached << 1) & not_first_col | (reached >> 1) & not_last_col
+        ) & region
+        if grown == reached:
+            return reached == region
+        reached = grown
+
+
+def unmatched_regions(spans):
+    """
+    Match regions to distinct lines (rows or columns) they touch, given each region's lines as a
+    bitmask, returning the regions left without one. The list is empty exactly when Hall's condition
+    holds: every k regions between them touch at least k lines.
+    """
+    # Augmenting paths (Kuhn's algorithm) - boards are small enough that this is a few microseconds
+    owner = {}
+
+    def assign(region, visited):
+        free = spans[region] & ~visited[0]
+        while free:
+            low = free & -free
+            free ^= low
+            visited[0] |= low
+            line = low.bit_length() - 1
+            if line not in owner or assign(owner[line], visited):
+                owner[line] = region
+                return True
+        return False
+
+    return [region for region in range(len(spans)) if not assign(region, [0])]
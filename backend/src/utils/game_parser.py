@@ -0,0 +1,120 @@
+import json
+import re
+from collections import namedtuple
+
+from utils.board import Board
+
+# The fields we need from the GraphQL response, and nothing else
+ParsedGame = namedtuple("ParsedGame", ["puzzle_id", "grid_size", "board"])
+
+# Where today's Queens puzzle sits in a decoded response
+GAME_PATH = "data.identityDashGamesByTodaysGame.elements[0]"
+
+# In raw responses the puzzle and its id are the only object- and number-valued fields with these
+# names; the schema metadata under "extensions" reuses the names with string or object values
+PUZZLE_FIELD = re.compile(r'"queensGamePuzzle"\s*:\s*(?=\{)')
+PUZZLE_ID_FIELD = re.compile(r'"puzzleId"\s*:\s*(?=-?\d)')
+
+_decoder = json.JSONDecoder()
+
+
+class GameFormatError(ValueError):
+    """The game payload is missing fields or holds a malformed board"""
+
+
+def parse_game_payload(payload):
+    """
+    Pull the puzzle id, grid size and board out of a GraphQL game response, given as raw bytes (or
+    text) or as an already decoded dict, validating the board before it can reach a solver
+    """
+    if isinstance(payload, (bytes, bytearray, memoryview)):
+        payload = bytes(payload).decode()
+
+    if isinstance(payload, str):
+        fields = scan_game_fields(payload)
+        if fields is None:
+            # Unusual layout - fall back to decoding the whole response
+            try:
+                payload = json.loads(payload)
+            except json.JSONDecodeError as e:
+                raise GameFormatError(f"Response isn't valid JSON: {e}") from None
+        else:
+            return build_game(*fields)
+
+    return build_game(*find_game_fields(payload))
+
+
+def scan_game_fields(text):
+    """
+    Decode only the puzzle object and puzzle id from the raw response text, skipping the rest.
+    Returns None unless each appears exactly once.
+    """
+    puzzles = PUZZLE_FIELD.findall(text, 0)
+    puzzle_ids = PUZZLE_ID_FIELD.findall(text, 0)
+    if len(puzzles) != 1 or len(puzzle_ids) != 1:
+        return None
+
+    try:
+        puzzle, _ = _decoder.raw_decode(text, PUZZLE_FIELD.search(text).end())
+        puzzle_id, _ = _decoder.raw_decode(text, PUZZLE_ID_FIELD.search(text).end())
+    except json.JSONDecodeError:
+        return None
+    return puzzle_id, puzzle
+
+
+def find_game_fields(response):
+    """Walk a decoded response down to today's game once, returning (puzzle id, puzzle)"""
+    try:
+        element = response["data"]["identityDashGamesByTodaysGame"]["elements"][0]
+        return element.get("puzzleId"), element["gamePuzzle"]["queensGamePuzzle"]
+    except (KeyError, IndexError, TypeError):
+        raise GameFormatError(f"Response has no Queens puzzle at {GAME_PATH}") from None
+
+
+def build_game(puzzle_id, puzzle):
+    if not isinstance(puzzle_id, int) or isinstance(puzzle_id, bool):
+        raise GameFormatError(f"'puzzleId' should be an integer, got {puzzle_id!r}")
+    if not isinstance(puzzle, dict):
+        raise GameFormatError("'queensGamePuzzle' should be an object")
+
+    grid_size = puzzle.get("gridSize")
+    return ParsedGame(puzzle_id, grid_size, build_board(puzzle.get("colorGrid"), grid_size))
+
+
+def build_board(grid, grid_size=None):
+    """
+    Copy a 'colorGrid' list of {"colors": [...]} rows straight into a compact Board, checking the
+    grid is square, every colour is in 0..size-1 and there is one colour region per row
+    """
+    if not isinstance(grid, list) or not grid:
+        raise GameFormatError("'colorGrid' list is empty or missing")
+    if grid_size is None:
+        grid_size = len(grid)
+    if not isinstance(grid_size, int) or isinstance(grid_size, bool) or not 1 <= grid_size < 255:
+        raise GameFormatError(f"'gridSize' should be an integer from 1 to 254, got {grid_size!r}")
+    if len(grid) != grid_size:
+        raise GameFormatError(f"'colorGrid' has {len(grid)} rows, expected {grid_size}")
+
+    cells = bytearray(grid_size * grid_size)
+    for i, row in enumerate(grid):
+        colors = row.get("colors") if isinstance(row, dict) else None
+        if not isinstance(colors, list):
+            raise GameFormatError(f"'colors' not found in row {i} of 'colorGrid'")
+        if len(colors) != grid_size:
+            raise GameFormatError(f"Row {i} of 'colorGrid' has {len(colors)} colours, expected {grid_size}")
+        try:
+            cells[i * grid_size : (i + 1) * grid_size] = colors
+        except (TypeError, ValueError):
+            raise GameFormatError(f"Row {i} of 'colorGrid' has colours that aren't small integers") from None
+
+    board = Board(grid_size, cells)
+    validate_board(board)
+    return board
+
+
+def validate_board(board):
+    """Check the colours run from 0 to size-1 with exactly one region per row"""
+    if max(board.cells) >= board.size:
+        raise GameFormatError(f"Colours on a {board.size}x{board.size} board should be 0 to {board.size - 1}")
+    if len(board.regions) != board.size:
+        raise GameFormatError(f"Board has {len(board.regions)} colour regions, expected {board.size}")
@@ -0,0 +1,110 @@
+from functools import lru_cache
+
+from utils.board import Board
+from utils.board_solver import new_solver_stats
+from utils.constraint_solver import CandidateState, build_board_masks, iter_bits, search
+
+# Masks for recently hinted boards, so each hint only replays the player's moves
+MASK_CACHE_SIZE = 32
+
+
+@lru_cache(maxsize=MASK_CACHE_SIZE)
+def cached_board_masks(board):
+    return build_board_masks(board)
+
+
+def cell_index(board, cell):
+    """Turn a {"row", "col"} dict into a cell index, checking it is on the board"""
+    try:
+        row, col = cell["row"], cell["col"]
+    except (KeyError, TypeError):
+        raise ValueError(f"Expected a cell like {{'row': 0, 'col': 0}}, got {cell!r}") from None
+    if not (isinstance(row, int) and isinstance(col, int) and 0 <= row < board.size and 0 <= col < board.size):
+        raise ValueError(f"Cell {cell!r} is off the {board.size}x{board.size} board")
+    return row * board.size + col
+
+
+def cells_to_dicts(board, indices):
+    return [{"row": index // board.size, "col": index % board.size} for index in sorted(indices)]
+
+
+def build_position(board, queens, marks, stats):
+    """
+    Replay the player's queens and X-marks onto a fresh candidate state.
+    Returns None if a queen lands on a cell already ruled out (by another queen or a mark).
+    """
+    state = CandidateState(cached_board_masks(board), stats)
+    state.eliminate(sum(1 << index for index in marks))
+
+    for index in queens:
+        if not state.candidates >> index & 1:
+            return None
+        state.place(index)
+
+    return None if state.dead else state
+
+
+def forced_single(state):
+    """Return (cell index, unit kind) for an open unit with a single candidate left, if there is one"""
+    masks = state.masks
+    for kind, units in (("region", masks.regions), ("row", masks.rows), ("column", masks.cols)):
+        for unit in units:
+            cells = state.candidates & unit
+            if not unit & state.queens and cells and not cells & (cells - 1):
+                return cells.bit_length() - 1, kind
+    return None
+
+
+def find_mistakes(board, queens, marks):
+    """Return the player's queens that aren't in the solution and marks that cover a solution queen"""
+    solved = search(CandidateState(cached_board_masks(board), new_solver_stats("propagate")), propagate=True)
+    if solved is None:
+        return []
+    wrong = [index for index in queens if not solved.queens >> index & 1]
+    wrong += [index for index in marks if solved.queens >> index & 1]
+    return cells_to_dicts(board, wrong)
+
+
+def get_hint(board, queens, marks=(), complete=False, stats=None):
+    """
+    Continue solving from a partially played position. Returns one of
+      {"status": "solved"}                         - the player's queens already solve the board
+      {"status": "forced", "move", "reason"}       - the next queen the position forces
+      {"status": "solution", "solution"}           - the completed solution (when asked for, or
+                                                     when no single move is forced)
+      {"status": "unsolvable", "mistakes"}         - the position can't be completed
+    """
+    board = Board.from_rows(board)
+    queens = [cell_index(board, cell) for cell in queens]
+    marks = [cell_index(board, cell) for cell in marks]
+    if stats is None:
+        stats = {}
+    stats.update(new_solver_stats("propagate"))
+
+    state = build_position(board, queens, marks, stats)
+    if state is None:
+        return {"status": "unsolvable", "mistakes": find_mistakes(board, queens, marks)}
+    if state.is_solved():
+        return {"status": "solved"}
+
+    if not complete:
+        # Prefer a move the player can see straight away: a region, row or column with one cell left
+        single = forced_single(state)
+        if single:
+            index, reason = single
+            return {"status": "forced", "move": cells_to_dicts(board, [index])[0], "reason": reason}
+
+    solved = state.copy()
+    if not solved.propagate():
+        return {"status": "unsolvable", "mistakes": find_mistakes(board, queens, marks)}
+
+    forced = solved.queens & ~state.queens
+    if forced and not complete:
+        # Of the queens propagation deduces, hint the one whose region had the fewest cells left
+        index = min(iter_bits(forced), key=lambda index: state.counts[state.masks.cell_regions[index]])
+        return {"status": "forced", "move": cells_to_dicts(board, [index])[0], "reason": "deduction"}
+
+    solved = search(solved, propagate=True)
+    if solved is None:
+        return {"status": "unsolvable", "mistakes": find_mistakes(board, queens, marks)}
+    return {"status": "solution", "solution": solved.solution()}
@@ -0,0 +1,185 @@
+from functools import lru_cache
+
+try:
+    import numpy as np
+except ImportError:  # NumPy isn't in every Lambda layer
+    np = None
+
+# Stand-in count for units that already hold a queen, so they never win the most-constrained choice
+CLOSED = np.iinfo(np.int32).max if np is not None else None
+
+
+@lru_cache(maxsize=8)
+def line_and_neighbour_attacks(size):
+    """The part of the attack matrix that only depends on the board size: rows, columns and neighbours"""
+    same = np.eye(size, dtype=bool)
+    near = np.abs(np.arange(size)[:, None] - np.arange(size)[None, :]) <= 1
+    # Indexed [row, col, other row, other col]
+    attacks = same[:, None, :, None] | same[None, :, None, :] | (near[:, None, :, None] & near[None, :, None, :])
+    attacks = attacks.reshape(size * size, size * size)
+    attacks.flags.writeable = False
+    return attacks
+
+
+def build_attack_matrix(board):
+    """
+    Return an (n*n, n*n) boolean matrix whose row for a cell marks every cell a queen there rules
+    out: its row, column, colour region and 3x3 neighbourhood (and the cell itself)
+    """
+    regions = np.array(board.cell_regions, dtype=np.int16)
+    same_region = (regions[:, None] == regions[None, :]) & (regions[:, None] >= 0)
+    return line_and_neighbour_attacks(board.size) | same_region
+
+
+def build_unit_matrix(board):
+    """
+    Return an (r + 2n, n*n) matrix with one row per unit that needs a queen - every colour region,
+    then every row, then every column - marking the unit's cells
+    """
+    size = board.size
+    units = np.zeros((len(board.regions) + 2 * size, size * size), dtype=np.int32)
+    for unit, region in enumerate(board.regions):
+        units[unit, list(region)] = 1
+    cells = units[len(board.regions) :].reshape(2, size, size, size)
+    for line in range(size):
+        cells[0, line, line, :] = 1
+        cells[1, line, :, line] = 1
+    return units
+
+
+def contiguous_runs(count):
+    """Return a (runs, count) boolean matrix with a row for every run of consecutive positions"""
+    starts, ends = np.triu_indices(count)
+    positions = np.arange(count)
+    return (positions >= starts[:, None]) & (positions <= ends[:, None])
+
+
+def lock(candidates, units, lines, contiguous):
+    """
+    Find groups of k open units (as float rows of cells) whose candidates lie within k open lines,
+    and return the other candidates in those lines, which can be cleared. Returns None if more than
+    k units are confined to k lines.
+    """
+    if len(units) < 2:
+        return np.zeros_like(candidates)
+
+    # Which lines each unit's candidates touch, and the line sets worth testing: every unit's span,
+    # plus every run of neighbouring lines when units tend to span neighbouring lines (regions)
+    spans = ((units * candidates) @ lines.T) > 0
+    line_sets = np.vstack([spans, contiguous_runs(len(lines))]) if contiguous else spans
+    line_sets = line_sets[line_sets.sum(axis=1) < len(lines)]
+    if not len(line_sets):
+        return np.zeros_like(candidates)
+
+    # inside[u, s]: unit u's candidates all lie within line set s
+    inside = (spans.astype(np.float32) @ (~line_sets).T.astype(np.float32)) == 0
+    inside_counts, set_sizes = inside.sum(axis=0), line_sets.sum(axis=1)
+    if (inside_counts > set_sizes).any():
+        return None
+
+    locked = inside_counts == set_sizes
+    if not locked.any():
+        return np.zeros_like(candidates)
+    owned = (inside[:, locked].T.astype(np.float32) @ units) > 0
+    covered = (line_sets[locked].astype(np.float32) @ lines) > 0
+    return (covered & ~owned).any(axis=0) & candidates
+
+
+def solve_numpy(board, stats):
+    """
+    Solve the board with NumPy: the candidates are a boolean mask over the cells and placing a queen
+    clears everything it attacks in one vectorised step. Each node applies forced moves and clears
+    cells attacked by every candidate of some region, row or column, then branches on the unit with
+    the fewest candidates left. Falls back to the propagation engine without NumPy.
+    """
+    if np is None:
+        from utils.constraint_solver import solve_propagate
+
+        stats["engine"] = "propagate"
+        return solve_propagate(board, stats)
+
+    attacks = build_attack_matrix(board)
+    units = build_unit_matrix(board)
+    unit_cells = units.astype(bool)
+    region_count = len(board.regions)
+    kinds = np.repeat([0, 1, 2], [region_count, board.size, board.size])
+    # float32 so the products below run through BLAS; every count is far below float32's exact range
+    attacks_f = attacks.astype(np.float32)
+    units_f = units.astype(np.float32)
+
+    def place(state, index):
+        candidates, open_units, queens = state
+        return candidates & ~attacks[index], open_units & ~unit_cells[:, index], queens + [index]
+
+    def propagate(state):
+        """Apply forced moves and eliminations until nothing changes. Returns None on contradiction."""
+        while True:
+            stats["propagationRounds"] += 1
+            candidates, open_units, queens = state
+            if not open_units.any():
+                return state
+
+            counts = units_f[open_units] @ candidates
+            if not counts.all():
+                # An open region, row or column has no cells left
+                return None
+
+            singles = np.flatnonzero(counts == 1)
+            if len(singles):
+                unit = np.flatnonzero(open_units)[singles[0]]
+                state = place(state, np.flatnonzero(candidates & unit_cells[unit])[0])
+                continue
+
+            # A cell attacked by every candidate of an open unit (outside that unit) can never hold a queen
+            attacked = (units_f[open_units] * candidates) @ attacks_f
+            common = (attacked == counts[:, None]) & ~unit_cells[open_units]
+            eliminated = common.any(axis=0) & candidates
+
+            if not eliminated.any():
+                # Only once the cheap rules stall: N regions confined to N rows (or columns) own
+                # those lines, and N lines confined to N regions own those regions
+                regions, rows, cols = (units_f[open_units & (kinds == kind)] for kind in range(3))
+                for group, lines, contiguous in (
+                    (regions, rows, True),
+                    (regions, cols, True),
+                    (rows, regions, False),
+                    (cols, regions, False),
+                ):
+                    locked = lock(candidates, group, lines, contiguous)
+                    if locked is None:
+                        return None
+                    eliminated |= locked
+                if not eliminated.any():
+                    return state
+
+            state = (candidates & ~eliminated, open_units, queens)
+
+    def search(state):
+        stats["nodes"] += 1
+        state = propagate(state)
+        if state is None:
+            return None
+
+        candidates, open_units, queens = state
+        if not open_units.any():
+            return state
+
+        counts = np.where(open_units, units @ candidates, CLOSED)
+        unit = np.argmin(counts)
+        stats["branchPoints"] += 1
+
+        for index in np.flatnonzero(candidates & unit_cells[unit]):
+            # States are never changed in place, so undoing a placement is just returning to the parent's
+            solved = search(place(state, index))
+            if solved:
+                return solved
+            stats["backtracks"] += 1
+
+        return None
+
+    solved = search((np.array(board.cell_regions) >= 0, np.ones(len(units), dtype=bool), []))
+    if solved:
+        size = board.size
+        return [{"row": int(index) // size, "col": int(index) % size} for index in sorted(solved[2])]
+    else:
+        return []  # No solution found
@@ -0,0 +1,112 @@
+import multiprocessing
+import time
+from multiprocessing.connection import wait
+
+from utils.board_solver import SOLVER_ENGINES, SolveBudgetExceeded, solve_board
+
+# Engines raced against each other: a fixed-order search, two dynamic orderings and exact cover
+PORTFOLIO_ENGINES = ("propagate", "dlx", "bitmask", "mrv")
+
+# Racers are forked from a fork server: a single-threaded process started on first use with the
+# engines already imported. Forking the server itself could deadlock a child on a lock held by one
+# of its other threads. Spawn (a fresh interpreter per racer) is the fallback where there is none
+START_METHOD = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+
+_context = None
+
+
+def get_context():
+    """Return the multiprocessing context racers start in, preloading the engines into the fork server"""
+    global _context
+    if _context is None:
+        context = multiprocessing.get_context(START_METHOD)
+        if START_METHOD == "forkserver":
+            modules = {SOLVER_ENGINES[engine].split(":")[0] for engine in PORTFOLIO_ENGINES}
+            context.set_forkserver_preload([__name__, *sorted(modules)])
+        _context = context
+    return _context
+
+
+def race_engine(connection, board, engine, spec, max_nodes, max_seconds):
+    """Child process: solve with one engine and send back (status, solution, stats)"""
+    stats = {}
+    try:
+        # The child starts from the registry as imported, so engines registered at runtime are passed on
+        if spec is not None:
+            SOLVER_ENGINES[engine] = spec
+
+        solution = solve_board(board, engine=engine, stats=stats, max_nodes=max_nodes, max_seconds=max_seconds)
+        connection.send((stats["status"], solution, stats))
+    except SolveBudgetExceeded:
+        connection.send(("budgetExceeded", None, stats))
+    except Exception as e:
+        connection.send(("error", str(e), stats))
+    finally:
+        connection.close()
+
+
+def solve_portfolio(board, stats, engines=None):
+    """
+    Race several engines on the board, one process each, and return the first answer. The others
+    are terminated as soon as one finishes. Each engine gets the solve's whole node and time budget;
+    the race only gives up once every engine has. stats["engine"] names the winning engine and
+    stats["portfolio"] the engines raced.
+
+    Racing only pays off with a CPU per engine; on a fraction of a CPU the engines just share it.
+    The wait for the racers blocks, so call it from a worker thread, not the event loop.
+    """
+    engines = tuple(engines or PORTFOLIO_ENGINES)
+    max_nodes = getattr(stats, "max_nodes", None)
+    deadline = getattr(stats, "deadline", None)
+    max_seconds = None if deadline is None else max(0.0, deadline - time.perf_counter())
+
+    context = get_context()
+    racers = {}
+    try:
+        for engine in engines:
+            receiver, sender = context.Pipe(duplex=False)
+            process = context.Process(
+                target=race_engine,
+                args=(sender, board, engine, SOLVER_ENGINES.get(engine), max_nodes, max_seconds),
+                daemon=True,
+            )
+            process.start()
+            # The child holds its own copy of the sending end
+            sender.close()
+            racers[receiver] = (engine, process)
+
+        failures = []
+        while racers:
+            timeout = None if deadline is None else max(0.0, deadline - time.perf_counter())
+            ready = wait(list(racers), timeout)
+            if not ready:
+                raise SolveBudgetExceeded(f"Portfolio of {len(engines)} engines gave up, out of time")
+
+            for receiver in ready:
+                engine, process = racers.pop(receiver)
+                try:
+                    status, solution, engine_stats = receiver.recv()
+                except EOFError:
+                    # The child died without answering (e.g. killed for memory)
+                    status, solution, engine_stats = "error", "process exited", {}
+                receiver.close()
+                process.join()
+
+                if status in ("solved", "unsolvable"):
+                    stats.update(engine_stats, portfolio=list(engines))
+                    return solution
+                failures.append((engine, status, solution))
+
+        if all(status == "budgetExceeded" for _, status, _ in failures):
+            raise SolveBudgetExceeded(f"All {len(engines)} portfolio engines ran out of budget")
+        raise RuntimeError(
+            "Portfolio solve failed: "
+            + ", ".join(f"{engine} {detail if status == 'error' else status}" for engine, status, detail in failures)
+        )
+    finally:
+        # Cancel the engines still running; each only holds its own search state, so killing it is safe
+        for receiver, (_, process) in racers.items():
+            process.terminate()
+            receiver.close()
+        for _, process in racers.values():
+            process.join()
@@ -0,0 +1,7 @@
+import os
+import sys
+
+# Make the Lambda source tree (src/) importable the same way it is when deployed
+SRC_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src")
+if SRC_DIR not in sys.path:
+    sys.path.append(SRC_DIR)
@@ -0,0 +1,8 @@
+class FakeClock:
+    """A clock for tests that only moves when told to: set or advance now (epoch seconds)"""
+
+    def __init__(self, now=1_000_000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
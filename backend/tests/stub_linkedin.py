@@ -0,0 +1,107 @@
+import json
+import random
+import threading
+import time
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+GAME_PAGE_PATH = "/games/view/queens/desktop/"
+GRAPHQL_PATH = "/voyager/api/graphql"
+
+
+class QuietServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def handle_error(self, request, client_address):
+        # Clients hanging up mid-response (e.g. timeout tests) are expected
+        pass
+
+
+class StubLinkedIn:
+    """
+    Local HTTP server standing in for LinkedIn's Queens game page (which sets the JSESSIONID
+    cookie) and the GraphQL API (which requires it as the csrf-token header).
+    """
+
+    def __init__(self, game_response, latency=0.0, error_rate=0.0, seed=None):
+        self.game_response = game_response
+        self.latency = latency
+        # Share of requests answered with a 503 at random, on top of any scripted failures
+        self.error_rate = error_rate
+        self._random = random.Random(seed)
+        self.token_version = 1
+        # Statuses to answer with, in order, before behaving normally again
+        self.failures = {GAME_PAGE_PATH: [], GRAPHQL_PATH: []}
+        self.requests = Counter()
+        self._lock = threading.Lock()
+        self._server = None
+
+    @property
+    def token(self):
+        return f"ajax-stub-{self.token_version}"
+
+    @property
+    def base_url(self):
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def rotate_token(self):
+        """Invalidate the current token, as LinkedIn does when a session expires"""
+        self.token_version += 1
+
+    def start(self):
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            # Keep connections alive like the real upstream
+            protocol_version = "HTTP/1.1"
+            # Headers and body go out as separate writes; with Nagle on, the body waits on a delayed ACK
+            disable_nagle_algorithm = True
+
+            def do_GET(self):
+                stub.handle(self)
+
+            def log_message(self, format, *args):
+                pass
+
+        self._server = QuietServer(("127.0.0.1", 0), Handler)
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def handle(self, request):
+        path = request.path.split("?")[0]
+        with self._lock:
+            self.requests[path] += 1
+            failures = self.failures.get(path)
+            failure = failures.pop(0) if failures else None
+            if failure is None and self.error_rate and self._random.random() < self.error_rate:
+                failure = 503
+
+        if self.latency:
+            time.sleep(self.latency)
+
+        if failure:
+            self.respond(request, failure, b"stub failure")
+        elif path == GAME_PAGE_PATH:
+            self.respond(request, 200, b"<html>Queens</html>", {"Set-Cookie": f"JSESSIONID={self.token}; Path=/"})
+        elif path == GRAPHQL_PATH:
+            if request.headers.get("csrf-token") != self.token:
+                self.respond(request, 403, b"CSRF check failed")
+            else:
+                self.respond(
+                    request, 200, json.dumps(self.game_response).encode(), {"Content-Type": "application/json"}
+                )
+        else:
+            self.respond(request, 404, b"not found")
+
+    def respond(self, request, status, body, headers=None):
+        request.send_response(status)
+        for name, value in (headers or {}).items():
+            request.send_header(name, value)
+        request.send_header("Content-Length", str(len(body)))
+        request.end_headers()
+        request.wfile.write(body)
@@ -0,0 +1,106 @@
+import asyncio
+import json
+import os
+import unittest
+from unittest.mock import patch
+
+import httpx
+
+from services import api_service
+from services.timing_service import request_timings
+from tests.stub_linkedin import GAME_PAGE_PATH, GRAPHQL_PATH, StubLinkedIn
+
+EXAMPLE_RESPONSE = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "..", "..", "misc", "examples", "linkedin-graphql-response.json"
+)
+
+
+class TestApiService(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        with open(EXAMPLE_RESPONSE) as f:
+            self.game_response = json.load(f)
+
+        self.stub = StubLinkedIn(self.game_response).start()
+        self.addCleanup(self.stub.stop)
+
+        for name, value in (
+            ("GAME_BASE_URL", self.stub.base_url + GAME_PAGE_PATH),
+            ("API_BASE_URL", self.stub.base_url + GRAPHQL_PATH),
+            ("UPSTREAM_RETRY_BASE_DELAY", 0.01),
+        ):
+            patcher = patch.object(api_service, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+        api_service.csrf_token_state.invalidate()
+
+    async def asyncTearDown(self):
+        await api_service.close_client()
+
+    async def test_fetch_game_data_reuses_token(self):
+        """The CSRF token is fetched once and reused for later requests"""
+        first = await api_service.fetch_game_data()
+        second = await api_service.fetch_game_data()
+
+        self.assertEqual(json.loads(first), self.game_response)
+        self.assertEqual(json.loads(second), self.game_response)
+        self.assertEqual(self.stub.requests[GAME_PAGE_PATH], 1)
+        self.assertEqual(self.stub.requests[GRAPHQL_PATH], 2)
+
+    async def test_upstream_calls_are_timed(self):
+        """Both upstream calls show up in the request's timings (the body is parsed later, by the game parser)"""
+        with request_timings() as timings:
+            await api_service.fetch_game_data()
+
+        self.assertEqual(set(timings.stages), {"csrf", "graphql"})
+
+    async def test_rejected_token_is_refreshed(self):
+        """A token LinkedIn rejects is replaced and the request retried"""
+        await api_service.fetch_game_data()
+        self.stub.rotate_token()
+
+        self.assertEqual(json.loads(await api_service.fetch_game_data()), self.game_response)
+        self.assertEqual(self.stub.requests[GAME_PAGE_PATH], 2)
+
+    async def test_retries_server_errors(self):
+        """Transient upstream failures are retried"""
+        self.stub.failures[GRAPHQL_PATH] = [503, 502]
+
+        self.assertEqual(json.loads(await api_service.fetch_game_data()), self.game_response)
+        self.assertEqual(self.stub.requests[GRAPHQL_PATH], 3)
+
+    async def test_retries_are_bounded(self):
+        """Persistent failures give up after the configured number of retries"""
+        self.stub.failures[GRAPHQL_PATH] = [503] * 10
+
+        with self.assertRaises(httpx.HTTPStatusError):
+            await api_service.fetch_game_data()
+        self.assertEqual(self.stub.requests[GRAPHQL_PATH], api_service.UPSTREAM_MAX_RETRIES + 1)
+
+    async def test_timeout(self):
+        """A slow upstream fails with a transport error instead of hanging"""
+        self.stub.latency = 0.5
+
+        with patch.object(api_service, "UPSTREAM_TIMEOUT_SECONDS", 0.05):
+            with self.assertRaises(httpx.TransportError):
+                await api_service.fetch_game_data()
+
+    async def test_each_event_loop_has_its_own_client(self):
+        """A client from another event loop is neither reused nor replaced, and its loop closes it"""
+        client = api_service.get_client()
+
+        async def use_other_loop():
+            other = api_service.get_client()
+            await api_service.close_client()
+            return other
+
+        other = await asyncio.to_thread(asyncio.run, use_other_loop())
+
+        self.assertIsNot(other, client)
+        self.assertTrue(other.is_closed)
+        self.assertFalse(client.is_closed)
+        self.assertIs(api_service.get_client(), client)
+
+
+if __name__ == "__main__":
+    unittest.main()
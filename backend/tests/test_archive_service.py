@@ -0,0 +1,47 @@
+import os
+import tempfile
+import unittest
+
+from services.archive_service import PuzzleArchive, parse_date
+
+GAME = {
+    "puzzleId": 273,
+    "gridSize": 4,
+    "board": [[0, 0, 1, 1], [0, 2, 1, 1], [3, 2, 2, 1], [3, 3, 3, 3]],
+    "solution": [{"row": 0, "col": 1}, {"row": 1, "col": 3}, {"row": 2, "col": 0}, {"row": 3, "col": 2}],
+    "solverStats": {"engine": "propagate", "nodes": 1},
+}
+
+
+class TestArchiveService(unittest.TestCase):
+    def test_round_trip(self):
+        """An archived game comes back whole by id and by date, and survives reopening the file"""
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "archive.sqlite3")
+            PuzzleArchive(path).add(GAME, "2025-03-01")
+
+            archive = PuzzleArchive(path)
+            self.assertEqual(archive.get(273), {**GAME, "date": "2025-03-01"})
+            self.assertEqual(archive.get_by_date("2025-03-01"), archive.get(273))
+            self.assertIsNone(archive.get(274))
+            self.assertIsNone(archive.get_by_date("2025-03-02"))
+
+    def test_first_copy_is_kept(self):
+        """Refetching a puzzle doesn't move it to a later date"""
+        archive = PuzzleArchive(":memory:")
+        archive.add(GAME, "2025-03-01")
+        archive.add(GAME, "2025-03-02")
+
+        self.assertEqual(archive.get(273)["date"], "2025-03-01")
+        self.assertIsNone(archive.get_by_date("2025-03-02"))
+
+    def test_parse_date(self):
+        """Dates must be YYYY-MM-DD"""
+        self.assertEqual(parse_date("2025-03-01"), "2025-03-01")
+        for value in ("2025-13-01", "yesterday", None):
+            with self.assertRaises(ValueError):
+                parse_date(value)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,57 @@
+import json
+import unittest
+
+from batch_solve import solve_lines
+from utils.board_generator import generate_board
+from utils.board_solver import solve_board
+
+
+class TestBatchSolve(unittest.TestCase):
+    def setUp(self):
+        self.boards = [generate_board(6 + index % 3, seed=index) for index in range(12)]
+        self.lines = [
+            json.dumps({"puzzleId": index, "colorGrid": [{"colors": row} for row in board]}) + "\n"
+            for index, (board, _) in enumerate(self.boards)
+        ]
+        self.lines += ["\n", "not json\n"]
+
+    def test_ordered_results_follow_input(self):
+        """Pooled results come back in input order, matching the in-process run"""
+        in_process = list(solve_lines(self.lines, workers=1))
+        pooled = list(solve_lines(self.lines, workers=2, chunksize=3))
+
+        self.assertEqual(pooled, in_process)
+        results = [json.loads(result) for result, _ in pooled]
+        self.assertEqual([result["line"] for result in results], list(range(1, 13)) + [14])
+        for (board, solution), result in zip(self.boards, results):
+            self.assertEqual(result["solution"], solution)
+
+    def test_unordered_results(self):
+        """Unordered streaming returns every result, tagged with its line number"""
+        results = [json.loads(result) for result, _ in solve_lines(self.lines, workers=2, ordered=False)]
+
+        self.assertEqual(sorted(result["line"] for result in results), list(range(1, 13)) + [14])
+
+    def test_equivalent_boards_are_solved_once(self):
+        """Mirrored copies of a board reuse the worker's cached solution, mapped onto each copy"""
+        board, solution = self.boards[0]
+        mirrored = [row[::-1] for row in board]
+        line = json.dumps({"colorGrid": [{"colors": row} for row in mirrored]}) + "\n"
+
+        results = [json.loads(result) for result, _ in solve_lines([self.lines[0], line, line], workers=1)]
+
+        self.assertEqual(results[0]["solution"], solution)
+        self.assertEqual(results[1]["solution"], solve_board(mirrored))
+        self.assertEqual(results[2], {**results[1], "line": 3})
+        self.assertEqual(results[1]["solverStats"], results[0]["solverStats"])
+
+    def test_errors_are_reported_per_line(self):
+        """A bad line is reported without stopping the batch"""
+        result, failed = list(solve_lines(self.lines, workers=1))[-1]
+
+        self.assertTrue(failed)
+        self.assertIn("Invalid JSON", json.loads(result)["error"])
+
+
+if __name__ == "__main__":
+    unittest.main()
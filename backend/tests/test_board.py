@@ -0,0 +1,54 @@
+import pickle
+import unittest
+
+from utils.board import UNCOLOURED, Board
+
+ROWS = [
+    [0, 0, 1],
+    [2, 0, 1],
+    [2, 2, 1],
+]
+
+
+class TestBoard(unittest.TestCase):
+    def test_region_tables(self):
+        """Regions list cell indices by colour and every cell knows its region"""
+        board = Board.from_rows(ROWS)
+
+        self.assertEqual(board.size, 3)
+        self.assertEqual(board.cells, bytes([0, 0, 1, 2, 0, 1, 2, 2, 1]))
+        self.assertEqual(board.regions, ((0, 1, 4), (2, 5, 8), (3, 6, 7)))
+        self.assertEqual(list(board.cell_regions), [0, 0, 1, 2, 0, 1, 2, 2, 1])
+        self.assertEqual(board.colour(1, 0), 2)
+        self.assertEqual(board[2][1], 2)
+
+    def test_round_trip(self):
+        """Boards convert back to rows, compare by content and pickle compactly"""
+        board = Board.from_rows(ROWS)
+
+        self.assertEqual(board.rows(), ROWS)
+        self.assertIs(Board.from_rows(board), board)
+        self.assertEqual(board, Board.from_rows([row[:] for row in ROWS]))
+        self.assertEqual(hash(board), hash(Board.from_rows(ROWS)))
+        self.assertEqual(pickle.loads(pickle.dumps(board)).regions, board.regions)
+
+    def test_uncoloured_cells(self):
+        """None cells belong to no region"""
+        board = Board.from_rows([[0, None], [None, 1]])
+
+        self.assertEqual(board.cells[1], UNCOLOURED)
+        self.assertEqual(board.regions, ((0,), (3,)))
+        self.assertEqual(list(board.cell_regions), [0, -1, -1, 1])
+
+    def test_invalid_rows(self):
+        """Ragged boards and colours that don't fit in a byte are rejected"""
+        with self.assertRaises(ValueError):
+            Board.from_rows([[0, 1], [0]])
+        with self.assertRaises(ValueError):
+            Board.from_rows([[0, 1], [0, 300]])
+        with self.assertRaises(ValueError):
+            Board.from_rows([[0, 1], [0, "red"]])
+
+
+if __name__ == "__main__":
+    unittest.main()
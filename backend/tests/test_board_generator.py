@@ -0,0 +1,36 @@
+import unittest
+
+from utils.board_generator import generate_board, is_connected
+from utils.board_solver import count_solutions, solve_board
+
+
+class TestBoardGenerator(unittest.TestCase):
+    def test_generated_boards_are_valid(self):
+        """Generated boards have one contiguous region per row and exactly one solution"""
+        for size in (6, 8, 10):
+            for difficulty in (0.0, 1.0):
+                with self.subTest(size=size, difficulty=difficulty):
+                    board, solution = generate_board(size, difficulty, seed=size)
+                    colours = {colour for row in board for colour in row}
+
+                    self.assertEqual(len(colours), size)
+                    for colour in colours:
+                        self.assertTrue(is_connected(board, colour))
+                    self.assertEqual(count_solutions(board), 1)
+                    self.assertEqual(solve_board(board), solution)
+
+    def test_same_seed_same_board(self):
+        """Boards are reproducible from their seed"""
+        self.assertEqual(generate_board(9, seed=42), generate_board(9, seed=42))
+        self.assertNotEqual(generate_board(9, seed=42)[0], generate_board(9, seed=43)[0])
+
+    def test_invalid_arguments(self):
+        """Out of range sizes and difficulties are rejected"""
+        with self.assertRaises(ValueError):
+            generate_board(3)
+        with self.assertRaises(ValueError):
+            generate_board(8, difficulty=1.5)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,214 @@
+import multiprocessing
+import time
+import unittest
+from unittest.mock import patch
+
+from utils.board import Board
+from utils.board_solver import SOLVER_ENGINES, SolveBudgetExceeded, iter_solutions, solve_board
+from utils.dlx_solver import iter_dlx_solutions
+from utils.portfolio_solver import PORTFOLIO_ENGINES
+
+
+def build_board(queen_cols):
+    """Build a board whose regions grow around the given queen positions (one per row)"""
+    size = len(queen_cols)
+    board = []
+    for row in range(size):
+        # Assign every cell to the nearest queen, breaking ties by queen index
+        board.append(
+            [min(range(size), key=lambda q: (abs(row - q) + abs(col - queen_cols[q]), q)) for col in range(size)]
+        )
+    return board
+
+
+def solve_never(board, stats):
+    """An engine stuck on a pathological board"""
+    time.sleep(60)
+
+
+class TestSolverEngines(unittest.TestCase):
+    def setUp(self):
+        self.boards = [
+            [
+                [2, 2, 2, 2, 2, 2, 2, 2],
+                [2, 1, 2, 1, 2, 2, 2, 0],
+                [3, 1, 2, 1, 2, 1, 2, 0],
+                [3, 1, 1, 1, 1, 1, 1, 0],
+                [3, 4, 1, 1, 1, 1, 1, 0],
+                [3, 4, 4, 1, 1, 1, 5, 0],
+                [3, 4, 4, 6, 6, 7, 5, 0],
+                [3, 4, 4, 6, 6, 7, 5, 0],
+            ],
+            build_board([0, 2, 4, 6, 8, 10, 1, 3, 5, 7, 9]),
+            build_board([1, 3, 5, 7, 9, 11, 0, 2, 4, 6, 8, 10]),
+        ]
+
+    def assert_valid_solution(self, board, solution):
+        size = len(board)
+        self.assertEqual(len(solution), size)
+        self.assertEqual(len({queen["row"] for queen in solution}), size)
+        self.assertEqual(len({queen["col"] for queen in solution}), size)
+        self.assertEqual(len({board[queen["row"]][queen["col"]] for queen in solution}), size)
+
+        for i, first in enumerate(solution):
+            for second in solution[i + 1 :]:
+                self.assertFalse(abs(first["row"] - second["row"]) <= 1 and abs(first["col"] - second["col"]) <= 1)
+
+    def test_engines_find_valid_solutions(self):
+        """Every registered engine should solve every board"""
+        for engine in SOLVER_ENGINES:
+            for board in self.boards:
+                with self.subTest(engine=engine, size=len(board)):
+                    self.assert_valid_solution(board, solve_board(board, engine=engine))
+
+    def test_engines_accept_boards(self):
+        """A compact Board solves the same as the equivalent list of rows"""
+        # The portfolio returns whichever engine's solution comes first, so it can differ between runs
+        for engine in set(SOLVER_ENGINES) - {"portfolio"}:
+            for board in self.boards:
+                with self.subTest(engine=engine, size=len(board)):
+                    self.assertEqual(
+                        solve_board(Board.from_rows(board), engine=engine), solve_board(board, engine=engine)
+                    )
+
+    def test_bitmask_matches_backtrack(self):
+        """The bitmask engine explores in the same order as the list-scan engine"""
+        for board in self.boards:
+            self.assertEqual(solve_board(board, engine="bitmask"), solve_board(board, engine="backtrack"))
+
+    def test_propagation_solves_daily_board_without_branching(self):
+        """A real daily puzzle should be solved by propagation alone"""
+        board = [
+            [7, 7, 7, 7, 7, 7, 7, 7],
+            [7, 1, 1, 2, 7, 7, 7, 7],
+            [1, 1, 2, 2, 3, 4, 4, 7],
+            [5, 5, 2, 3, 3, 4, 7, 7],
+            [5, 5, 5, 5, 3, 6, 6, 7],
+            [5, 5, 5, 5, 5, 5, 6, 0],
+            [5, 5, 5, 5, 5, 5, 0, 0],
+            [5, 5, 5, 5, 5, 5, 5, 0],
+        ]
+        stats = {}
+        solution = solve_board(board, engine="propagate", stats=stats)
+
+        self.assert_valid_solution(board, solution)
+        self.assertEqual(stats["branchPoints"], 0)
+        self.assertGreater(stats["propagationRounds"], 0)
+
+    def test_mrv_ordering_expands_fewer_nodes(self):
+        """Picking the most constrained region avoids the static order's blow-up"""
+        board = build_board([1, 3, 5, 7, 9, 11, 13, 0, 2, 4, 6, 8, 10, 12])
+        static_stats, mrv_stats = {}, {}
+
+        solve_board(board, engine="bitmask", stats=static_stats)
+        solution = solve_board(board, engine="mrv", stats=mrv_stats)
+
+        self.assert_valid_solution(board, solution)
+        self.assertLess(mrv_stats["nodes"] * 10, static_stats["nodes"])
+
+    def test_unsolvable_status(self):
+        """Infeasible boards are rejected before search; feasible ones without a solution are searched"""
+        for engine in SOLVER_ENGINES:
+            with self.subTest(engine=engine):
+                stats = {}
+                self.assertEqual(solve_board([[0, 1, 2], [2, 2, 2], [2, 2, 2]], engine=engine, stats=stats), [])
+                self.assertEqual(stats["status"], "unsolvable")
+                self.assertEqual(stats["nodes"], 0)
+                self.assertIn("different rows", stats["reason"])
+
+                # Queens in each region would touch diagonally
+                stats = {}
+                self.assertEqual(solve_board([[0, 0], [1, 1]], engine=engine, stats=stats), [])
+                self.assertEqual(stats["status"], "unsolvable")
+                self.assertNotIn("reason", stats)
+
+    def test_search_budget(self):
+        """Solves past their node or time budget stop with a budget status"""
+        board = build_board([1, 3, 5, 7, 9, 11, 13, 0, 2, 4, 6, 8, 10, 12])
+        for limits in ({"max_nodes": 50}, {"max_seconds": 0}):
+            with self.subTest(**limits):
+                stats = {}
+                with self.assertRaises(SolveBudgetExceeded):
+                    solve_board(board, engine="bitmask", stats=stats, **limits)
+                self.assertEqual(stats["status"], "budgetExceeded")
+                self.assertLessEqual(stats["nodes"], 64)
+
+        stats = {}
+        self.assert_valid_solution(board, solve_board(board, stats=stats, max_nodes=10_000, max_seconds=10))
+        self.assertEqual(stats["status"], "solved")
+
+    def test_numpy_engine_falls_back_without_numpy(self):
+        """Without NumPy installed the numpy engine solves with the propagation engine instead"""
+        stats = {}
+        with patch("utils.numpy_solver.np", None):
+            solution = solve_board(self.boards[1], engine="numpy", stats=stats)
+
+        self.assertEqual(solution, solve_board(self.boards[1], engine="propagate"))
+        self.assertEqual(stats["engine"], "propagate")
+
+    def test_iter_solutions(self):
+        """Solutions are enumerated lazily, one at a time, the first being the list-scan backtracking engine's"""
+        board = [list(range(6)) for _ in range(6)]
+        solutions = iter_solutions(board)
+        first, second = next(solutions), next(solutions)
+        self.assertEqual(first, solve_board(board, engine="backtrack"))
+        self.assertNotEqual(first, second)
+
+        # Resuming carries on where it stopped, and every solution is found exactly once
+        found = [first, second, *solutions]
+        expected = list(iter_dlx_solutions(Board.from_rows(board)))
+        self.assertEqual(len(found), len(expected))
+        self.assertEqual(
+            {tuple(queen["col"] for queen in sorted(solution, key=lambda queen: queen["row"])) for solution in found},
+            {tuple(queen["col"] for queen in solution) for solution in expected},
+        )
+        self.assertEqual(list(iter_solutions([[0, 1, 2], [2, 2, 2], [2, 2, 2]])), [])
+
+    def test_iterative_matches_backtrack(self):
+        """The stack-based engine expands the same nodes as the recursive engines"""
+        for board in self.boards:
+            with self.subTest(size=len(board)):
+                stats, backtrack_stats, bitmask_stats = {}, {}, {}
+                solution = solve_board(board, engine="iterative", stats=stats)
+                self.assertEqual(solution, solve_board(board, engine="backtrack", stats=backtrack_stats))
+                self.assertEqual(solution, solve_board(board, engine="bitmask", stats=bitmask_stats))
+                for counter in ("nodes", "backtracks"):
+                    self.assertEqual(stats[counter], backtrack_stats[counter])
+                    self.assertEqual(stats[counter], bitmask_stats[counter])
+
+    def test_portfolio_records_winner(self):
+        """A portfolio solve reports which engine won the race, and gives up only once every engine has"""
+        stats = {}
+        self.assert_valid_solution(self.boards[2], solve_board(self.boards[2], engine="portfolio", stats=stats))
+        self.assertIn(stats["engine"], PORTFOLIO_ENGINES)
+        self.assertEqual(stats["portfolio"], list(PORTFOLIO_ENGINES))
+        self.assertEqual(stats["status"], "solved")
+
+        stats = {}
+        with self.assertRaises(SolveBudgetExceeded):
+            solve_board(build_board([1, 3, 5, 7, 9, 11, 13, 0, 2, 4, 6, 8, 10, 12]), "portfolio", stats, max_nodes=5)
+        self.assertEqual(stats["status"], "budgetExceeded")
+
+    def test_portfolio_cancels_losing_engines(self):
+        """The first engine to finish wins and the ones still searching are stopped"""
+        stats = {}
+        with (
+            patch.dict(SOLVER_ENGINES, stall=f"{__name__}:solve_never"),
+            patch("utils.portfolio_solver.PORTFOLIO_ENGINES", ("stall", "propagate")),
+        ):
+            started = time.perf_counter()
+            solution = solve_board(self.boards[1], engine="portfolio", stats=stats)
+
+        self.assertLess(time.perf_counter() - started, 30)
+        self.assertEqual(solution, solve_board(self.boards[1], engine="propagate"))
+        self.assertEqual(stats["engine"], "propagate")
+        self.assertEqual(multiprocessing.active_children(), [])
+
+    def test_unknown_engine(self):
+        """Unknown engine names are rejected"""
+        with self.assertRaises(ValueError):
+            solve_board(self.boards[0], engine="missing")
+
+
+if __name__ == "__main__":
+    unittest.main()
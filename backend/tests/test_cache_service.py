@@ -0,0 +1,76 @@
+import os
+import tempfile
+import unittest
+from datetime import datetime
+from zoneinfo import ZoneInfo
+
+from services.cache_service import MemoryCache, SQLiteCache, board_hash, last_rollover, next_rollover, puzzle_date
+from tests.fake_clock import FakeClock
+
+
+class TestCacheService(unittest.TestCase):
+    def test_memory_cache_expiry(self):
+        """Entries disappear once their expiry time passes"""
+        clock = FakeClock()
+        cache = MemoryCache(clock=clock)
+
+        cache.set("a", {"value": 1}, expires_at=clock.now + 10)
+        self.assertEqual(cache.get("a"), {"value": 1})
+
+        clock.now += 10
+        self.assertIsNone(cache.get("a"))
+
+    def test_memory_cache_lru_eviction(self):
+        """The least recently used entry is evicted when the cache is full"""
+        cache = MemoryCache(max_entries=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+
+        self.assertEqual(cache.get("a"), 1)
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(cache.get("c"), 3)
+
+    def test_sqlite_cache_persists(self):
+        """A new SQLite cache on the same file sees earlier entries until they expire"""
+        clock = FakeClock()
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "cache.sqlite3")
+            SQLiteCache(path, clock=clock).set("a", {"solution": []}, expires_at=clock.now + 5)
+
+            cache = SQLiteCache(path, clock=clock)
+            self.assertEqual(cache.get("a"), {"solution": []})
+            clock.now += 5
+            self.assertIsNone(cache.get("a"))
+
+    def test_next_rollover(self):
+        """The rollover is the next midnight in the puzzle's timezone"""
+        tz = ZoneInfo("America/Los_Angeles")
+        now = datetime(2025, 3, 1, 23, 59, 30, tzinfo=tz).timestamp()
+
+        self.assertEqual(next_rollover(now), datetime(2025, 3, 2, tzinfo=tz).timestamp())
+
+    def test_last_rollover(self):
+        """The latest rollover is today's midnight in the puzzle's timezone, or now if it is midnight"""
+        tz = ZoneInfo("America/Los_Angeles")
+        midnight = datetime(2025, 3, 1, tzinfo=tz).timestamp()
+
+        self.assertEqual(last_rollover(midnight + 86399), midnight)
+        self.assertEqual(last_rollover(midnight), midnight)
+        self.assertEqual(last_rollover(midnight - 1), datetime(2025, 2, 28, tzinfo=tz).timestamp())
+
+    def test_puzzle_date(self):
+        """The puzzle date is the calendar date in the puzzle's timezone, not UTC"""
+        now = datetime(2025, 3, 1, 23, 59, 30, tzinfo=ZoneInfo("America/Los_Angeles")).timestamp()
+
+        self.assertEqual(puzzle_date(now), "2025-03-01")
+
+    def test_board_hash(self):
+        """Equal boards hash equally and different boards differently"""
+        self.assertEqual(board_hash([[0, 1], [1, 0]]), board_hash([[0, 1], [1, 0]]))
+        self.assertNotEqual(board_hash([[0, 1], [1, 0]]), board_hash([[1, 0], [0, 1]]))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,49 @@
+import unittest
+
+from utils.board import UNCOLOURED, Board
+from utils.board_generator import generate_board
+from utils.board_solver import solve_board
+from utils.canonical import canonical_form, from_canonical
+
+
+def rotate(rows):
+    """Rotate a board a quarter turn clockwise"""
+    return [list(row) for row in zip(*rows[::-1])]
+
+
+class TestCanonical(unittest.TestCase):
+    def setUp(self):
+        self.rows = generate_board(8, seed=3)[0]
+
+    def variants(self):
+        """Every rotation and reflection of the board, with the colours renumbered"""
+        rows = self.rows
+        for _ in range(4):
+            rows = rotate(rows)
+            for variant in (rows, [row[::-1] for row in rows]):
+                yield [[(colour * 3 + 1) % 8 for colour in row] for row in variant]
+
+    def test_equivalent_boards_share_a_canonical_form(self):
+        """Rotations, reflections and recolourings all map to the same canonical board"""
+        canonical = canonical_form(self.rows)[0]
+
+        for variant in self.variants():
+            self.assertEqual(canonical_form(variant)[0], canonical)
+        self.assertNotEqual(canonical_form(generate_board(8, seed=4)[0])[0], canonical)
+
+    def test_solutions_map_back(self):
+        """The canonical board's solution, mapped back, solves the board it came from"""
+        for variant in self.variants():
+            canonical, symmetry = canonical_form(variant)
+            solution = from_canonical(solve_board(canonical), canonical.size, symmetry)
+            self.assertEqual(solution, solve_board(variant))
+
+    def test_uncoloured_cells_are_kept(self):
+        """Uncoloured cells stay uncoloured and colours are numbered from 0"""
+        canonical = canonical_form(Board.from_rows([[None, 5], [5, 7]]))[0]
+
+        self.assertEqual(sorted(canonical.cells), [0, 1, 1, UNCOLOURED])
+
+
+if __name__ == "__main__":
+    unittest.main()
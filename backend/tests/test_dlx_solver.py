@@ -0,0 +1,65 @@
+import unittest
+
+from utils.board_solver import count_solutions, solve_board
+from utils.dlx_solver import build_cover_matrix, iter_dlx_solutions, solve_dlx
+
+# One region per column: every placement of non-touching queens in distinct rows and columns solves it
+COLUMN_REGIONS = [list(range(6)) for _ in range(6)]
+
+# Permutations of 6 with no two neighbouring rows' queens in adjacent columns
+COLUMN_REGIONS_SOLUTIONS = 90
+
+
+class TestDlxSolver(unittest.TestCase):
+    def test_cover_matrix(self):
+        """Each cell covers its row, column and region, plus the 2x2 blocks around it"""
+        column_count, primary_count, options = build_cover_matrix([[0, 0, 1], [0, 2, 1], [2, 2, 1]])
+
+        self.assertEqual((column_count, primary_count, len(options)), (13, 9, 9))
+        self.assertEqual(options[0], [0, 3, 6, 9])
+        self.assertEqual(options[4], [1, 4, 8, 9, 10, 11, 12])
+
+    def test_uncoloured_cells_are_rejected(self):
+        """A cell without a colour has no region column to cover, so the board is refused"""
+        board = [[0, 0, 1, 1], [0, 2, 1, 3], [2, 2, None, 3], [2, 3, 3, 3]]
+
+        with self.assertRaisesRegex(ValueError, r"Cell \(2, 2\) has no colour"):
+            build_cover_matrix(board)
+        with self.assertRaises(ValueError):
+            solve_dlx(board, {"nodes": 0, "backtracks": 0, "branchPoints": 0})
+
+    def test_every_solution_is_found_once(self):
+        solutions = [tuple(queen["col"] for queen in solution) for solution in iter_dlx_solutions(COLUMN_REGIONS)]
+
+        self.assertEqual(len(solutions), COLUMN_REGIONS_SOLUTIONS)
+        self.assertEqual(len(set(solutions)), COLUMN_REGIONS_SOLUTIONS)
+
+    def test_count_solutions_limit(self):
+        """Counting stops at the limit, and a limit above the total counts every solution"""
+        self.assertEqual(count_solutions(COLUMN_REGIONS), 2)
+        self.assertEqual(count_solutions(COLUMN_REGIONS, limit=1), 1)
+        self.assertEqual(count_solutions(COLUMN_REGIONS, limit=10), 10)
+        self.assertEqual(count_solutions(COLUMN_REGIONS, limit=1000), COLUMN_REGIONS_SOLUTIONS)
+        self.assertEqual(count_solutions(COLUMN_REGIONS, limit=0), 0)
+
+    def test_count_solutions_unique_and_unsolvable(self):
+        """A daily-style board has one solution, however high the limit, and an unsolvable one has none"""
+        board = [
+            [2, 2, 2, 2, 2, 2, 2, 2],
+            [2, 1, 2, 1, 2, 2, 2, 0],
+            [3, 1, 2, 1, 2, 1, 2, 0],
+            [3, 1, 1, 1, 1, 1, 1, 0],
+            [3, 4, 1, 1, 1, 1, 1, 0],
+            [3, 4, 4, 1, 1, 1, 5, 0],
+            [3, 4, 4, 6, 6, 7, 5, 0],
+            [3, 4, 4, 6, 6, 7, 5, 0],
+        ]
+        self.assertEqual(count_solutions(board, limit=100), 1)
+        by_row = sorted(solve_board(board, engine="backtrack"), key=lambda queen: queen["row"])
+        self.assertEqual(next(iter_dlx_solutions(board)), by_row)
+
+        self.assertEqual(count_solutions([[0, 1, 2, 3]] + [[3] * 4] * 3, limit=100), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
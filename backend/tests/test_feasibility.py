@@ -0,0 +1,38 @@
+import unittest
+
+from utils.board import Board
+from utils.board_generator import generate_board
+from utils.feasibility import find_infeasibility, unmatched_regions
+
+
+class TestFeasibility(unittest.TestCase):
+    def test_generated_boards_pass(self):
+        """Boards with a unique solution pass every check"""
+        for size in (5, 8, 10):
+            with self.subTest(size=size):
+                self.assertIsNone(find_infeasibility(Board.from_rows(generate_board(size, seed=size)[0])))
+
+    def test_rejects_malformed_boards(self):
+        """Wrong region counts, split regions and regions crowded into too few lines are caught"""
+        for rows, message in (
+            ([[0, 0], [0, 0]], "1 colour regions, expected 2"),
+            ([[0, 1, 0], [1, 1, 1], [2, 2, 2]], "region 0 .* not contiguous"),
+            # Regions 0 and 1 only have cells in the first row
+            ([[0, 1, 2, 2], [3, 3, 3, 3], [3, 3, 3, 3], [3, 3, 3, 3]], "different rows"),
+            ([[0, 2, 2], [1, 2, 2], [1, 2, 2]], "different columns"),
+        ):
+            with self.subTest(rows=rows):
+                self.assertRegex(find_infeasibility(Board.from_rows(rows)), message)
+
+    def test_hall_condition(self):
+        """Matching finds a line for every region exactly when every k regions touch k lines"""
+        self.assertEqual(unmatched_regions([0b011, 0b001, 0b110]), [])
+        self.assertEqual(len(unmatched_regions([0b001, 0b001, 0b110])), 1)
+
+    def test_partially_coloured_boards(self):
+        """Uncoloured cells skip the region count and contiguity checks"""
+        self.assertIsNone(find_infeasibility(Board.from_rows([[0, None, None], [None, None, None], [None, 1, None]])))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,69 @@
+import copy
+import json
+import os
+import unittest
+
+from utils.game_parser import GameFormatError, build_board, parse_game_payload
+
+EXAMPLE_RESPONSE = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "..", "..", "misc", "examples", "linkedin-graphql-response.json"
+)
+
+
+class TestGameParser(unittest.TestCase):
+    def setUp(self):
+        with open(EXAMPLE_RESPONSE, "rb") as f:
+            self.raw_response = f.read()
+        self.api_response = json.loads(self.raw_response)
+
+    def puzzle(self, response):
+        return response["data"]["identityDashGamesByTodaysGame"]["elements"][0]["gamePuzzle"]["queensGamePuzzle"]
+
+    def test_bytes_and_dict_agree(self):
+        """Raw bytes, text and a decoded dict of the recorded response parse to the same game"""
+        game = parse_game_payload(self.api_response)
+
+        self.assertEqual(game.puzzle_id, 273)
+        self.assertEqual(game.grid_size, 8)
+        self.assertEqual(game.board.rows(), [row["colors"] for row in self.puzzle(self.api_response)["colorGrid"]])
+        self.assertEqual(parse_game_payload(self.raw_response), game)
+        self.assertEqual(parse_game_payload(self.raw_response.decode()), game)
+
+    def test_unusual_layout_falls_back_to_full_decode(self):
+        """A response with the puzzle repeated elsewhere is still read from today's game"""
+        response = copy.deepcopy(self.api_response)
+        response["included"] = [{"puzzleId": 1, "queensGamePuzzle": {"gridSize": 2, "colorGrid": []}}]
+
+        game = parse_game_payload(json.dumps(response).encode())
+
+        self.assertEqual((game.puzzle_id, game.grid_size), (273, 8))
+
+    def test_rejects_missing_fields(self):
+        """Responses without today's puzzle or with a bad id fail with a format error"""
+        response = copy.deepcopy(self.api_response)
+        response["data"]["identityDashGamesByTodaysGame"]["elements"][0]["puzzleId"] = "273"
+
+        for payload in ({"data": {}}, b"{}", b"not json", response):
+            with self.assertRaises(GameFormatError):
+                parse_game_payload(payload)
+
+    def test_rejects_malformed_boards(self):
+        """Boards that aren't square, use colours out of range or have the wrong region count are rejected"""
+        for grid, grid_size, message in (
+            ([], None, "empty"),
+            ([{"colors": [0, 1]}, {"colors": [1, 0]}], 3, "rows"),
+            ([{"colors": [0, 1]}, {"colors": [1]}], 2, "colours, expected"),
+            ([{"colors": [0, 1]}, {"colors": [1, "0"]}], 2, "small integers"),
+            ([{"colors": [0, 1]}, {"colors": [1, 2]}], 2, "0 to 1"),
+            ([{"colors": [0, 0]}, {"colors": [0, 0]}], 2, "1 colour regions"),
+            ([{"colours": [0, 1]}, {"colors": [1, 0]}], 2, "'colors' not found"),
+        ):
+            with self.assertRaisesRegex(GameFormatError, message):
+                build_board(grid, grid_size)
+
+        # GameFormatError is a ValueError, so existing callers keep reporting it as {"error": ...}
+        self.assertTrue(issubclass(GameFormatError, ValueError))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,263 @@
+import asyncio
+import json
+import os
+import time
+import unittest
+from unittest.mock import AsyncMock, patch
+
+from services.archive_service import PuzzleArchive, get_archive, set_archive
+from services.cache_service import LATEST_GAME_KEY, MemoryCache, get_cache, set_cache
+from services.game_service import (
+    archive_game,
+    get_archived_game,
+    get_latest_game,
+    hint_payload,
+    latest_game,
+    load_game,
+    parse_game,
+    puzzle_freshness,
+    solve_payloads,
+    store_latest_game,
+)
+from tests.fake_clock import FakeClock
+from utils.board_solver import SolveBudgetExceeded, solve_board
+
+EXAMPLE_RESPONSE = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "..", "..", "misc", "examples", "linkedin-graphql-response.json"
+)
+
+MIDNIGHT = 1_740_816_000  # 2025-03-01 00:00 in LinkedIn's timezone (America/Los_Angeles)
+
+
+class TestGameService(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        with open(EXAMPLE_RESPONSE) as f:
+            self.api_response = json.load(f)
+        set_cache(MemoryCache())
+        set_archive(PuzzleArchive(":memory:"))
+        latest_game.invalidate()
+
+    def test_parse_game(self):
+        """The recorded LinkedIn response parses and solves"""
+        game = parse_game(self.api_response)
+
+        self.assertEqual(game["puzzleId"], 273)
+        self.assertEqual(game["gridSize"], 8)
+        self.assertEqual(len(game["solution"]), 8)
+        self.assertNotIn("verification", game)
+
+    def test_parse_game_verify(self):
+        """Verification reports a well-formed daily puzzle as unique"""
+        game = parse_game(self.api_response, verify=True)
+
+        self.assertEqual(game["verification"], {"solutionCount": 1, "unique": True})
+
+    def test_parse_game_verify_ambiguous_board(self):
+        """Verification stops counting at two solutions"""
+        puzzle = self.api_response["data"]["identityDashGamesByTodaysGame"]["elements"][0]["gamePuzzle"]
+        # One region per column has many solutions - every non-touching column permutation
+        puzzle["queensGamePuzzle"]["gridSize"] = 6
+        puzzle["queensGamePuzzle"]["colorGrid"] = [{"colors": list(range(6))} for _ in range(6)]
+
+        game = parse_game(self.api_response, verify=True)
+
+        self.assertEqual(game["verification"]["unique"], False)
+        self.assertEqual(game["verification"]["solutionCount"], 2)
+
+    @patch("services.game_service.fetch_game_data", new_callable=AsyncMock)
+    async def test_get_latest_game_verify(self, mock_fetch_game_data):
+        """The verify flag is passed through from the endpoint to the parser"""
+        mock_fetch_game_data.return_value = self.api_response
+
+        game = await get_latest_game(verify=True)
+
+        mock_fetch_game_data.assert_awaited_once()
+        self.assertTrue(game["verification"]["unique"])
+
+    @patch("services.game_service.solve_board")
+    @patch("services.game_service.fetch_game_data", new_callable=AsyncMock)
+    async def test_get_latest_game_cached(self, mock_fetch_game_data, mock_solve_board):
+        """A warm request skips both LinkedIn and the solver"""
+        mock_fetch_game_data.return_value = self.api_response
+        mock_solve_board.return_value = [{"row": r, "col": 0} for r in range(8)]
+
+        first = await get_latest_game()
+        second = await get_latest_game()
+
+        self.assertEqual(first, second)
+        mock_fetch_game_data.assert_awaited_once()
+        mock_solve_board.assert_called_once()
+
+    @patch("services.game_service.fetch_game_data", new_callable=AsyncMock)
+    async def test_concurrent_requests_share_one_fetch(self, mock_fetch_game_data):
+        """A burst of cold requests makes a single upstream fetch"""
+
+        async def slow_fetch():
+            await asyncio.sleep(0.01)
+            return self.api_response
+
+        mock_fetch_game_data.side_effect = slow_fetch
+
+        games = await asyncio.gather(*(get_latest_game() for _ in range(20)))
+
+        mock_fetch_game_data.assert_awaited_once()
+        self.assertTrue(all(game["puzzleId"] == 273 for game in games))
+
+    @patch("services.game_service.fetch_game_data", new_callable=AsyncMock)
+    async def test_solving_does_not_block_the_event_loop(self, mock_fetch_game_data):
+        """Other requests keep being served while a cold request parses and solves"""
+        mock_fetch_game_data.return_value = self.api_response
+        ticks = []
+
+        def slow_load_game(api_response, verify=False):
+            time.sleep(0.2)
+            return load_game(api_response, verify)
+
+        async def ticker():
+            for _ in range(5):
+                ticks.append(time.perf_counter())
+                await asyncio.sleep(0.01)
+
+        with patch("services.game_service.load_game", side_effect=slow_load_game):
+            started = time.perf_counter()
+            game, _ = await asyncio.gather(get_latest_game(), ticker())
+
+        self.assertEqual(game["puzzleId"], 273)
+        self.assertLess(ticks[-1] - started, 0.15)
+
+    @patch("services.game_service.puzzle_freshness", return_value=True)
+    @patch("services.game_service.puzzle_date", return_value="2025-03-01")
+    @patch("services.game_service.fetch_game_data", new_callable=AsyncMock)
+    async def test_fetched_games_are_archived(self, mock_fetch_game_data, mock_puzzle_date, mock_puzzle_freshness):
+        """Each fetched puzzle is archived and served from the archive by id or date"""
+        mock_fetch_game_data.return_value = self.api_response
+        game = await get_latest_game()
+
+        archived = get_archived_game(puzzle_id=273)
+        self.assertEqual(archived, {**game, "date": "2025-03-01"})
+        self.assertEqual(get_archived_game(date="2025-03-01"), archived)
+        self.assertEqual(get_archived_game(puzzle_id=1)["status"], "notFound")
+        self.assertNotIn("status", get_archived_game(date="March 1st"))
+
+    def test_puzzle_freshness(self):
+        """Yesterday's puzzle is told apart from today's; an unknown one is only trusted after the grace period"""
+        get_archive().add(parse_game(self.api_response), "2025-02-28")
+
+        self.assertIs(puzzle_freshness(273, MIDNIGHT + 60), False)
+        self.assertIs(puzzle_freshness(274, MIDNIGHT + 60), True)
+        self.assertIs(puzzle_freshness(273, MIDNIGHT + 60, previous_id=272), True)
+
+        set_archive(PuzzleArchive(":memory:"))
+        self.assertIsNone(puzzle_freshness(273, MIDNIGHT + 60))
+        self.assertIs(puzzle_freshness(273, MIDNIGHT + 3600), True)
+
+    def test_unconfirmed_latest_game_is_not_pinned(self):
+        """A puzzle fetched just after the rollover is cached briefly and not archived until it is known to be new"""
+        clock = FakeClock(MIDNIGHT + 60)
+        set_cache(MemoryCache(clock=clock))
+        game = parse_game(self.api_response)
+
+        archive_game(game, now=clock.now)
+        store_latest_game(game, now=clock.now)
+        self.assertEqual(get_archived_game(puzzle_id=273)["status"], "notFound")
+        self.assertEqual(get_cache().get(LATEST_GAME_KEY), game)
+        clock.now += 60
+        self.assertIsNone(get_cache().get(LATEST_GAME_KEY))
+
+        # Once confirmed as today's puzzle it is kept until the next rollover
+        archive_game(game, now=clock.now, fresh=True)
+        store_latest_game(game, now=clock.now)
+        self.assertEqual(get_archived_game(puzzle_id=273)["date"], "2025-03-01")
+        clock.now = MIDNIGHT + 86399
+        self.assertEqual(get_cache().get(LATEST_GAME_KEY), game)
+
+    def test_unconfirmed_held_game_is_not_pinned(self):
+        """The held latest game expires like the cached one: soon while it may be yesterday's, else at the rollover"""
+        clock = FakeClock(MIDNIGHT + 60)
+        game = parse_game(self.api_response)
+
+        with patch.object(latest_game, "clock", clock):
+            latest_game.set(game)
+            clock.now += 59
+            self.assertTrue(latest_game.is_fresh())
+            clock.now += 1
+            self.assertFalse(latest_game.is_fresh())
+
+            get_archive().add(game, "2025-03-01")
+            latest_game.set(game)
+            clock.now = MIDNIGHT + 86399
+            self.assertTrue(latest_game.is_fresh())
+            clock.now += 1
+            self.assertFalse(latest_game.is_fresh())
+
+    def test_solve_payloads(self):
+        """Posted colorGrid payloads are solved in order, with errors reported per board"""
+        puzzle = self.api_response["data"]["identityDashGamesByTodaysGame"]["elements"][0]["gamePuzzle"]
+        payload = {"puzzleId": 273, "colorGrid": puzzle["queensGamePuzzle"]["colorGrid"]}
+
+        single = solve_payloads(payload)
+        batch = solve_payloads([payload, {"colorGrid": [{"colors": [0, 1]}]}, self.api_response])
+
+        self.assertEqual(single["solution"], parse_game(self.api_response)["solution"])
+        self.assertEqual(batch[0], single)
+        self.assertIn("error", batch[1])
+        self.assertEqual(batch[2]["puzzleId"], 273)
+
+    @patch("services.game_service.fetch_game_data", new_callable=AsyncMock)
+    async def test_unsolvable_upstream_board(self, mock_fetch_game_data):
+        """A bad upstream board is reported as unsolvable rather than served with an empty solution"""
+        puzzle = self.api_response["data"]["identityDashGamesByTodaysGame"]["elements"][0]["gamePuzzle"]
+        # Seven of the eight regions are squeezed into the first row
+        grid = [{"colors": [0, 1, 2, 3, 4, 5, 6, 6]}] + [{"colors": [7] * 8} for _ in range(7)]
+        puzzle["queensGamePuzzle"]["colorGrid"] = grid
+        mock_fetch_game_data.return_value = self.api_response
+
+        game = await get_latest_game()
+
+        self.assertEqual(game["status"], "unsolvable")
+        self.assertIn("different rows", game["error"])
+        self.assertFalse(latest_game.is_fresh())
+
+    @patch("services.game_service.SOLVER_MAX_NODES", 0)
+    def test_solve_budget_exceeded(self):
+        """Solves that run past the search budget are reported with their own status"""
+        self.assertEqual(parse_game(self.api_response)["status"], "budgetExceeded")
+
+    @patch("services.game_service.solve_board", wraps=solve_board)
+    def test_equivalent_boards_share_cached_solution(self, mock_solve_board):
+        """A rotated, recoloured copy of a solved board reuses its solution, mapped onto the copy"""
+        rows = parse_game(self.api_response)["board"]
+        rotated = [[(colour + 1) % 8 for colour in row] for row in zip(*rows[::-1])]
+
+        solved = solve_payloads({"colorGrid": [{"colors": row} for row in rotated]})
+
+        mock_solve_board.assert_called_once()
+        self.assertEqual(solved["solution"], solve_board(rotated))
+
+    def test_hint_payload(self):
+        """Hints accept the board as rows or as a colorGrid, and report bad input as errors"""
+        game = parse_game(self.api_response)
+        puzzle = self.api_response["data"]["identityDashGamesByTodaysGame"]["elements"][0]["gamePuzzle"]
+
+        from_rows = hint_payload({"board": game["board"], "queens": game["solution"][:7]})
+        from_grid = hint_payload({"colorGrid": puzzle["queensGamePuzzle"]["colorGrid"], "queens": game["solution"][:7]})
+
+        self.assertEqual(from_rows, {"status": "forced", "move": game["solution"][7], "reason": "region"})
+        self.assertEqual(from_grid, from_rows)
+        self.assertIn("error", hint_payload({"board": game["board"], "queens": "a1"}))
+
+        # A solver giving up is reported with its status, as for solves
+        with patch("services.game_service.get_hint", side_effect=SolveBudgetExceeded("out of time")):
+            self.assertEqual(
+                hint_payload({"board": game["board"], "queens": []}),
+                {"error": "out of time", "status": "budgetExceeded"},
+            )
+
+    @patch("services.game_service.MAX_BATCH_BOARDS", 2)
+    def test_solve_payloads_limit(self):
+        """Oversized batches are rejected outright"""
+        self.assertIn("error", solve_payloads([{}, {}, {}]))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,68 @@
+import unittest
+
+from utils.board_solver import solve_board
+from utils.hint_solver import get_hint
+
+DAILY_BOARD = [
+    [7, 7, 7, 7, 7, 7, 7, 7],
+    [7, 1, 1, 2, 7, 7, 7, 7],
+    [1, 1, 2, 2, 3, 4, 4, 7],
+    [5, 5, 2, 3, 3, 4, 7, 7],
+    [5, 5, 5, 5, 3, 6, 6, 7],
+    [5, 5, 5, 5, 5, 5, 6, 0],
+    [5, 5, 5, 5, 5, 5, 0, 0],
+    [5, 5, 5, 5, 5, 5, 5, 0],
+]
+
+
+class TestHintSolver(unittest.TestCase):
+    def setUp(self):
+        self.solution = solve_board(DAILY_BOARD)
+
+    def test_forced_moves_lead_to_the_solution(self):
+        """Following hints one at a time plays out the solution"""
+        queens = []
+        while True:
+            hint = get_hint(DAILY_BOARD, queens)
+            if hint["status"] == "solved":
+                break
+            self.assertEqual(hint["status"], "forced")
+            self.assertIn(hint["move"], self.solution)
+            queens.append(hint["move"])
+
+        self.assertEqual(sorted(queens, key=lambda q: q["row"]), self.solution)
+
+    def test_single_cell_unit_is_hinted_first(self):
+        """A region, row or column with one cell left is the preferred hint"""
+        # With every other cell of region 0 marked, its last cell is forced
+        marks = [{"row": 5, "col": 7}, {"row": 6, "col": 6}, {"row": 6, "col": 7}]
+        hint = get_hint(DAILY_BOARD, [], marks)
+
+        self.assertEqual(hint, {"status": "forced", "move": {"row": 7, "col": 7}, "reason": "region"})
+
+    def test_complete(self):
+        """complete=True returns the rest of the solution"""
+        hint = get_hint(DAILY_BOARD, self.solution[:2], complete=True)
+
+        self.assertEqual(hint, {"status": "solution", "solution": self.solution})
+
+    def test_mistakes(self):
+        """A position that can't be completed reports the offending queens and marks"""
+        wrong_queen = {"row": 0, "col": 0}
+        wrong_mark = self.solution[4]
+
+        self.assertEqual(get_hint(DAILY_BOARD, [wrong_queen]), {"status": "unsolvable", "mistakes": [wrong_queen]})
+        self.assertEqual(get_hint(DAILY_BOARD, [], [wrong_mark]), {"status": "unsolvable", "mistakes": [wrong_mark]})
+        # Two queens attacking each other can never both stand
+        self.assertEqual(get_hint(DAILY_BOARD, [self.solution[0], {"row": 0, "col": 0}])["status"], "unsolvable")
+
+    def test_invalid_cells(self):
+        """Cells off the board are rejected"""
+        with self.assertRaises(ValueError):
+            get_hint(DAILY_BOARD, [{"row": 8, "col": 0}])
+        with self.assertRaises(ValueError):
+            get_hint(DAILY_BOARD, [[0, 0]])
+
+
+if __name__ == "__main__":
+    unittest.main()
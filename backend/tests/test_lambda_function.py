@@ -0,0 +1,176 @@
+import base64
+import gzip
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+
+from services.archive_service import PuzzleArchive
+from services.cache_service import LATEST_GAME_KEY, SQLiteCache
+from tests import SRC_DIR
+from tests.stub_linkedin import StubLinkedIn
+from tests.test_archive_service import GAME
+from tests.test_warmup_service import EXAMPLE_RESPONSE
+
+HEALTH_CHECK_EVENT = {
+    "version": "2.0",
+    "routeKey": "GET /",
+    "rawPath": "/",
+    "rawQueryString": "",
+    "headers": {},
+    "requestContext": {
+        "http": {"method": "GET", "path": "/", "protocol": "HTTP/1.1", "sourceIp": "127.0.0.1", "userAgent": "test"},
+        "stage": "$default",
+    },
+    "isBase64Encoded": False,
+}
+
+
+def get_event(path, query=""):
+    """An API Gateway HTTP API event for a GET request"""
+    event = json.loads(json.dumps(HEALTH_CHECK_EVENT))
+    event.update(routeKey=f"GET {path}", rawPath=path, rawQueryString=query)
+    event["requestContext"]["http"]["path"] = path
+    return event
+
+
+class TestLambdaFunction(unittest.TestCase):
+    def test_import_is_lightweight(self):
+        """Importing the handler module doesn't pull in FastAPI, Mangum or the HTTP client"""
+        code = (
+            "import sys, lambda_function; "
+            "print([m for m in ('fastapi', 'mangum', 'httpx', 'main') if m in sys.modules])"
+        )
+        result = subprocess.run([sys.executable, "-c", code], cwd=SRC_DIR, capture_output=True, text=True, check=True)
+
+        self.assertEqual(result.stdout.strip(), "[]")
+        self.assertEqual(result.stderr, "")
+
+    def test_handler_is_built_on_first_invocation(self):
+        """The first invocation builds the handler, later ones reuse it"""
+        code = (
+            "import json, sys, lambda_function; "
+            "event = json.loads(sys.argv[1]); "
+            "first = lambda_function.lambda_handler(event, None); "
+            "handler = lambda_function.get_handler(); "
+            "lambda_function.lambda_handler(event, None); "
+            "print(json.dumps({'response': first, 'reused': lambda_function.get_handler() is handler}))"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code, json.dumps(HEALTH_CHECK_EVENT)],
+            cwd=SRC_DIR,
+            capture_output=True,
+            text=True,
+            check=True,
+            env={**os.environ, "LOG_LEVEL": "WARNING"},
+        )
+        output = json.loads(result.stdout.strip().splitlines()[-1])
+
+        self.assertEqual(output["response"]["statusCode"], 200)
+        self.assertEqual(json.loads(output["response"]["body"])["status"], "healthy")
+        self.assertIn("total;dur=", output["response"]["headers"]["server-timing"])
+        self.assertTrue(output["reused"])
+
+    def test_archive_routes(self):
+        """Archived puzzles are served by id and by date, with a 404 for puzzles not in the archive"""
+        code = (
+            "import json, sys, lambda_function; "
+            "events = json.loads(sys.argv[1]); "
+            "print(json.dumps([lambda_function.lambda_handler(event, None) for event in events]))"
+        )
+        events = [get_event("/boards/273"), get_event("/boards", "date=2025-03-01"), get_event("/boards/274")]
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "archive.sqlite3")
+            PuzzleArchive(path).add(GAME, "2025-03-01")
+            result = subprocess.run(
+                [sys.executable, "-c", code, json.dumps(events)],
+                cwd=SRC_DIR,
+                capture_output=True,
+                text=True,
+                check=True,
+                env={**os.environ, "LOG_LEVEL": "WARNING", "ARCHIVE_PATH": path},
+            )
+        by_id, by_date, missing = json.loads(result.stdout.strip().splitlines()[-1])
+
+        self.assertEqual(by_id["statusCode"], 200)
+        self.assertEqual(json.loads(by_id["body"]), {**GAME, "date": "2025-03-01"})
+        self.assertEqual(json.loads(by_date["body"]), json.loads(by_id["body"]))
+        self.assertEqual(missing["statusCode"], 404)
+
+    def test_latest_game_revalidation(self):
+        """The latest game comes gzipped with an ETag, and sending the ETag back gets a 304"""
+        code = (
+            "import json, sys, lambda_function; "
+            "event = json.loads(sys.argv[1]); "
+            "first = lambda_function.lambda_handler(event, None); "
+            "event['headers']['if-none-match'] = first['headers']['etag']; "
+            "print(json.dumps([first, lambda_function.lambda_handler(event, None)]))"
+        )
+        event = get_event("/boards/latest")
+        event["headers"]["accept-encoding"] = "gzip"
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "cache.sqlite3")
+            SQLiteCache(path).set(LATEST_GAME_KEY, GAME)
+            result = subprocess.run(
+                [sys.executable, "-c", code, json.dumps(event)],
+                cwd=SRC_DIR,
+                capture_output=True,
+                text=True,
+                check=True,
+                env={**os.environ, "LOG_LEVEL": "WARNING", "CACHE_BACKEND": "sqlite", "CACHE_PATH": path},
+            )
+        first, second = json.loads(result.stdout.strip().splitlines()[-1])
+
+        self.assertEqual(first["statusCode"], 200)
+        self.assertTrue(first["isBase64Encoded"])
+        self.assertEqual(json.loads(gzip.decompress(base64.b64decode(first["body"]))), GAME)
+        self.assertEqual(first["headers"]["content-encoding"], "gzip")
+        self.assertIn("public, max-age=", first["headers"]["cache-control"])
+        self.assertEqual(second["statusCode"], 304)
+        self.assertEqual(second["body"], "")
+        self.assertEqual(second["headers"]["etag"], first["headers"]["etag"])
+
+    def test_requests_are_served_after_a_warm_up(self):
+        """A scheduled warm-up leaves the container able to serve HTTP events, with no client left open"""
+        code = (
+            "import json, sys, lambda_function; "
+            "from services import api_service; "
+            "warmup = lambda_function.lambda_handler({'warmup': True}, None); "
+            "response = lambda_function.lambda_handler(json.loads(sys.argv[1]), None); "
+            "print(json.dumps({'warmup': warmup, 'response': response, 'clients': len(api_service._clients)}))"
+        )
+        with open(EXAMPLE_RESPONSE) as f:
+            stub = StubLinkedIn(json.load(f)).start()
+        try:
+            result = subprocess.run(
+                [sys.executable, "-W", "always", "-c", code, json.dumps(HEALTH_CHECK_EVENT)],
+                cwd=SRC_DIR,
+                capture_output=True,
+                text=True,
+                check=True,
+                env={
+                    **os.environ,
+                    "LOG_LEVEL": "WARNING",
+                    "LINKEDIN_BASE_URL": stub.base_url,
+                    "ARCHIVE_PATH": "",
+                    "WARMUP_MAX_SECONDS": "0",
+                },
+            )
+        finally:
+            stub.stop()
+        output = json.loads(result.stdout.strip().splitlines()[-1])
+
+        # Whether the one poll's puzzle counts as new depends on how long ago the rollover was
+        self.assertIn(output["warmup"]["status"], ("warmed", "unchanged"))
+        self.assertEqual(output["response"]["statusCode"], 200)
+        self.assertEqual(output["clients"], 0)
+        self.assertNotIn("never awaited", result.stderr)
+        self.assertNotIn("Unclosed", result.stderr)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,66 @@
+import gzip
+import json
+import unittest
+
+from services.cache_service import next_rollover
+from services.response_service import choose_encoding, encode_game, game_response
+from tests.test_archive_service import GAME
+
+
+class TestResponseService(unittest.TestCase):
+    def test_game_is_encoded_once(self):
+        """Repeat requests for a puzzle reuse the same encoded bytes"""
+        encoded = encode_game(GAME)
+
+        self.assertIs(encode_game(dict(GAME)), encoded)
+        self.assertEqual(json.loads(encoded.body), GAME)
+        self.assertEqual(gzip.decompress(encoded.bodies["gzip"]), encoded.body)
+
+    def test_etag_comes_from_the_puzzle(self):
+        """The ETag is weak, as solver stats change the bytes but not the ETag; verification and a different puzzle do"""
+        etag = encode_game(GAME).etag
+
+        self.assertTrue(etag.startswith('W/"'))
+        self.assertEqual(encode_game({**GAME, "solverStats": {"nodes": 9}}).etag, etag)
+        self.assertNotEqual(encode_game({**GAME, "verification": {"unique": True}}).etag, etag)
+        self.assertNotEqual(encode_game({**GAME, "puzzleId": 274}).etag, etag)
+
+    def test_not_modified(self):
+        """A client sending back the ETag it holds gets a 304 with no body"""
+        status, headers, body = game_response(GAME, accept_encoding="gzip, deflate")
+        self.assertEqual((status, headers["Content-Encoding"]), (200, "gzip"))
+        self.assertEqual(json.loads(gzip.decompress(body)), GAME)
+
+        status, revalidated, body = game_response(GAME, if_none_match=headers["ETag"], accept_encoding="gzip")
+        self.assertEqual((status, body), (304, b""))
+        self.assertEqual(revalidated["ETag"], headers["ETag"])
+
+        # The ETag is the same in every encoding, and matches with or without the weak prefix
+        self.assertEqual(game_response(GAME)[1]["ETag"], headers["ETag"])
+        status, _, _ = game_response(GAME, if_none_match=f'"other", {headers["ETag"].removeprefix("W/")}')
+        self.assertEqual(status, 304)
+        status, _, _ = game_response({**GAME, "puzzleId": 274}, if_none_match=headers["ETag"])
+        self.assertEqual(status, 200)
+
+    def test_cache_control_expires_at_rollover(self):
+        """max-age runs out at the next daily rollover"""
+        now = 1_740_880_800  # 2025-03-01 18:00 in LinkedIn's timezone
+        _, headers, _ = game_response(GAME, now=now)
+
+        self.assertEqual(headers["Cache-Control"], f"public, max-age={int(next_rollover(now) - now)}")
+        self.assertEqual(headers["Cache-Control"], "public, max-age=21600")
+        self.assertEqual(headers["Vary"], "Accept-Encoding")
+
+        # A game the server holds only briefly is only kept briefly by clients too
+        _, headers, _ = game_response(GAME, now=now, expires_at=now + 60)
+        self.assertEqual(headers["Cache-Control"], "public, max-age=60")
+
+    def test_choose_encoding(self):
+        self.assertEqual(choose_encoding(None), "identity")
+        self.assertEqual(choose_encoding("gzip;q=0, deflate"), "identity")
+        self.assertEqual(choose_encoding("deflate, GZIP;q=0.5"), "gzip")
+        self.assertEqual(choose_encoding("identity, *;q=0"), "identity")
+
+
+if __name__ == "__main__":
+    unittest.main()
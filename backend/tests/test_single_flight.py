@@ -0,0 +1,79 @@
+import asyncio
+import unittest
+
+from services.single_flight import SingleFlight
+
+
+class TestSingleFlight(unittest.IsolatedAsyncioTestCase):
+    async def test_concurrent_calls_share_one_run(self):
+        """A burst of callers for one key runs the work once and all get its result"""
+        flight = SingleFlight()
+        calls = 0
+
+        async def work():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return {"puzzleId": 1}
+
+        results = await asyncio.gather(*(flight.run("latest", work) for _ in range(50)))
+
+        self.assertEqual(calls, 1)
+        self.assertTrue(all(result is results[0] for result in results))
+        self.assertFalse(flight.in_flight("latest"))
+
+    async def test_errors_reach_every_caller_and_are_not_kept(self):
+        """A failure is raised to every waiter, and the next call starts fresh"""
+        flight = SingleFlight()
+        outcomes = iter([ValueError("upstream down"), "ok"])
+
+        async def work():
+            await asyncio.sleep(0.01)
+            outcome = next(outcomes)
+            if isinstance(outcome, Exception):
+                raise outcome
+            return outcome
+
+        results = await asyncio.gather(*(flight.run("latest", work) for _ in range(5)), return_exceptions=True)
+
+        self.assertTrue(all(isinstance(result, ValueError) for result in results))
+        self.assertEqual(await flight.run("latest", work), "ok")
+
+    async def test_cancelling_one_caller_keeps_the_work_running(self):
+        """Other waiters still get the result when one of them is cancelled"""
+        flight = SingleFlight()
+
+        async def work():
+            await asyncio.sleep(0.05)
+            return "done"
+
+        first = asyncio.create_task(flight.run("latest", work))
+        second = asyncio.create_task(flight.run("latest", work))
+        await asyncio.sleep(0.01)
+        first.cancel()
+
+        self.assertEqual(await second, "done")
+        with self.assertRaises(asyncio.CancelledError):
+            await first
+
+    async def test_cancelling_every_caller_cancels_the_work(self):
+        """The shared work stops once nobody is waiting for it"""
+        flight = SingleFlight()
+        finished = False
+
+        async def work():
+            nonlocal finished
+            await asyncio.sleep(0.05)
+            finished = True
+
+        caller = asyncio.create_task(flight.run("latest", work))
+        await asyncio.sleep(0.01)
+        caller.cancel()
+        await asyncio.sleep(0.1)
+
+        self.assertFalse(finished)
+        self.assertFalse(flight.in_flight("latest"))
+
+
+if __name__ == "__main__":
+    unittest.main()
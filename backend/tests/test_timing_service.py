@@ -0,0 +1,88 @@
+import io
+import json
+import os
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from unittest.mock import patch
+
+from services import timing_service
+from services.cache_service import MemoryCache, set_cache
+from services.game_service import solve_cached
+from services.timing_service import emit_metrics, request_timings, timed
+
+BOARD = [
+    [0, 0, 1, 1, 1],
+    [0, 2, 2, 1, 1],
+    [3, 2, 2, 4, 1],
+    [3, 3, 3, 4, 4],
+    [3, 3, 3, 3, 4],
+]
+
+
+class TestTimingService(unittest.TestCase):
+    def setUp(self):
+        set_cache(MemoryCache())
+
+    def test_stages_add_up(self):
+        """Repeated stages accumulate and appear in the Server-Timing header"""
+        with request_timings() as timings:
+            with timed("graphql"):
+                pass
+            with timed("graphql"):
+                pass
+            with timed("solve"):
+                pass
+
+        self.assertEqual(list(timings.stages), ["graphql", "solve"])
+        header = timings.server_timing()
+        self.assertRegex(header, r"^graphql;dur=[\d.]+, solve;dur=[\d.]+, total;dur=[\d.]+$")
+
+    def test_timed_outside_a_request(self):
+        """Timing code outside a request is a no-op"""
+        with timed("solve"):
+            pass
+        self.assertIsNone(timing_service.current_timings())
+
+    def test_solve_records_solver_counters(self):
+        """A fresh solve reports its time and search counters, a cache hit doesn't"""
+        with request_timings() as cold:
+            solve_cached(BOARD)
+        with request_timings() as warm:
+            solve_cached(BOARD)
+
+        self.assertIn("solve", cold.stages)
+        self.assertEqual(set(cold.counters), {"nodes", "backtracks", "branchPoints"})
+        self.assertIn('solver;desc="nodes=', cold.server_timing())
+        self.assertNotIn("solve", warm.stages)
+
+    def test_profile_dumps_one_solve(self):
+        """A profiled request bypasses the cache and dumps the first solve's cProfile stats"""
+        solve_cached(BOARD)
+        with tempfile.TemporaryDirectory() as profile_dir:
+            with patch.object(timing_service, "PROFILE_DIR", profile_dir):
+                with request_timings(profile=True) as timings:
+                    solve_cached(BOARD)
+                    solve_cached(BOARD)
+
+            self.assertEqual(os.listdir(profile_dir), [os.path.basename(timings.profile_path)])
+            self.assertIn("profile;desc=", timings.server_timing())
+
+    @patch.object(timing_service, "METRICS_ENABLED", True)
+    def test_emit_metrics(self):
+        """Metrics are printed as a CloudWatch Embedded Metric Format record"""
+        with request_timings() as timings:
+            solve_cached(BOARD)
+
+        output = io.StringIO()
+        with redirect_stdout(output):
+            emit_metrics(timings, "/boards/solve", 200)
+        record = json.loads(output.getvalue())
+
+        metrics = {metric["Name"] for metric in record["_aws"]["CloudWatchMetrics"][0]["Metrics"]}
+        self.assertTrue({"totalMs", "solveMs", "solverNodes"} <= metrics)
+        self.assertEqual(record["Route"], "/boards/solve")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,55 @@
+import unittest
+from unittest.mock import MagicMock
+
+from services.warm_state import WarmValue
+from tests.fake_clock import FakeClock
+
+
+class TestWarmValue(unittest.TestCase):
+    def test_reuses_value_until_expiry(self):
+        """The loader runs once per ttl window"""
+        clock = FakeClock()
+        loader = MagicMock(side_effect=["first", "second"])
+        value = WarmValue(loader, ttl=60, clock=clock)
+
+        self.assertEqual(value.get(), "first")
+        clock.now += 59
+        self.assertEqual(value.get(), "first")
+        clock.now += 1
+        self.assertEqual(value.get(), "second")
+        self.assertEqual(loader.call_count, 2)
+
+    def test_expires_at_callback(self):
+        """An absolute expiry, e.g. the daily rollover, is computed from the load time and the value"""
+        clock = FakeClock(100.0)
+        loader = MagicMock(side_effect=["today", "tomorrow"])
+        value = WarmValue(loader, expires_at=lambda now, value: now - now % 1000 + 1000, clock=clock)
+
+        self.assertEqual(value.get(), "today")
+        clock.now = 999.0
+        self.assertEqual(value.get(), "today")
+        clock.now = 1000.0
+        self.assertEqual(value.get(), "tomorrow")
+
+    def test_reloads_invalid_value(self):
+        """A held value that no longer passes validation is reloaded on next use"""
+        loader = MagicMock(side_effect=["", "token"])
+        value = WarmValue(loader, ttl=60, validate=bool)
+
+        self.assertEqual(value.get(), "")
+        self.assertEqual(value.get(), "token")
+        self.assertEqual(value.get(), "token")
+        self.assertEqual(loader.call_count, 2)
+
+    def test_invalidate(self):
+        """Invalidating forces a reload on next use"""
+        loader = MagicMock(side_effect=["old", "new"])
+        value = WarmValue(loader, ttl=60)
+
+        value.get()
+        value.invalidate()
+        self.assertEqual(value.get(), "new")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,134 @@
+import copy
+import json
+import os
+import unittest
+from unittest.mock import patch
+
+from services import api_service
+from services.archive_service import PuzzleArchive, get_archive, set_archive
+from services.cache_service import LATEST_GAME_KEY, MemoryCache, get_cache, set_cache
+from services.game_service import get_archived_game, get_latest_game, latest_game, load_game
+from services.warmup_service import warm_up
+from tests.stub_linkedin import GAME_PAGE_PATH, GRAPHQL_PATH, StubLinkedIn
+from tests.fake_clock import FakeClock
+
+EXAMPLE_RESPONSE = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "..", "..", "misc", "examples", "linkedin-graphql-response.json"
+)
+
+
+def with_puzzle_id(response, puzzle_id):
+    response = copy.deepcopy(response)
+    response["data"]["identityDashGamesByTodaysGame"]["elements"][0]["puzzleId"] = puzzle_id
+    return response
+
+
+class TestWarmupService(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        with open(EXAMPLE_RESPONSE) as f:
+            self.game_response = json.load(f)
+
+        # LinkedIn still serves yesterday's puzzle (273) for a while after the rollover
+        self.stub = StubLinkedIn(self.game_response).start()
+        self.addCleanup(self.stub.stop)
+        for name, value in (
+            ("GAME_BASE_URL", self.stub.base_url + GAME_PAGE_PATH),
+            ("API_BASE_URL", self.stub.base_url + GRAPHQL_PATH),
+        ):
+            patcher = patch.object(api_service, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+        self.clock = FakeClock(1_740_816_000)  # 2025-03-01 00:00 in LinkedIn's timezone (America/Los_Angeles)
+        patcher = patch.object(latest_game, "clock", self.clock)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        api_service.csrf_token_state.invalidate()
+        set_cache(MemoryCache(clock=self.clock))
+        set_archive(PuzzleArchive(":memory:"))
+        latest_game.invalidate()
+        self.sleeps = []
+        self.publish_after = None
+
+    async def asyncTearDown(self):
+        await api_service.close_client()
+
+    async def sleep(self, seconds):
+        """Advance the fake clock, publishing the new puzzle once enough time has passed"""
+        self.sleeps.append(seconds)
+        self.clock.now += seconds
+        if self.publish_after is not None and sum(self.sleeps) >= self.publish_after:
+            self.stub.game_response = with_puzzle_id(self.game_response, 274)
+
+    async def test_polls_until_the_new_puzzle_is_published(self):
+        """Yesterday's puzzle is polled with backoff until the id changes, then solved and served warm"""
+        self.publish_after = 5
+
+        result = await warm_up(previous_id=273, clock=self.clock, sleep=self.sleep, max_seconds=20)
+
+        self.assertEqual(result, {"status": "warmed", "puzzleId": 274, "attempts": 4})
+        self.assertEqual(self.sleeps, [1, 2, 4])
+        self.assertEqual(self.stub.requests[GRAPHQL_PATH], 4)
+
+        # Traffic after the warm-up is served without going upstream
+        game = await get_latest_game(verify=True)
+        self.assertEqual(game["puzzleId"], 274)
+        self.assertEqual(game["verification"], {"solutionCount": 1, "unique": True})
+        self.assertEqual(self.stub.requests[GRAPHQL_PATH], 4)
+
+    async def test_gives_up_when_the_puzzle_never_changes(self):
+        """Polling stops within the time limit, leaving the cache untouched"""
+        result = await warm_up(previous_id=273, clock=self.clock, sleep=self.sleep, max_seconds=20)
+
+        self.assertEqual(result["status"], "unchanged")
+        self.assertEqual(self.sleeps, [1, 2, 4, 8])
+        self.assertLessEqual(sum(self.sleeps), 20)
+        self.assertIsNone(latest_game.peek())
+
+    async def test_first_poll_after_rollover_is_not_trusted(self):
+        """With no previous id and nothing archived, the puzzle first polled is only taken as new once it changes"""
+        # Held from a fetch just after the rollover, so it may be yesterday's puzzle
+        latest_game.set(load_game(self.game_response))
+        self.publish_after = 5
+
+        result = await warm_up(clock=self.clock, sleep=self.sleep, max_seconds=20)
+
+        self.assertEqual(result, {"status": "warmed", "puzzleId": 274, "attempts": 4})
+        self.assertEqual(latest_game.peek()["puzzleId"], 274)
+        self.assertEqual(get_archived_game(date="2025-03-01")["puzzleId"], 274)
+        self.assertEqual(get_archived_game(puzzle_id=273)["status"], "notFound")
+
+    async def test_unverified_puzzle_is_never_warmed(self):
+        """A fresh container that only ever sees one puzzle id after the rollover caches and archives nothing"""
+        result = await warm_up(clock=self.clock, sleep=self.sleep, max_seconds=20)
+
+        self.assertEqual(result, {"status": "unchanged", "puzzleId": 273, "attempts": 5})
+        self.assertIsNone(latest_game.peek())
+        self.assertIsNone(get_cache().get(LATEST_GAME_KEY))
+        self.assertEqual(get_archived_game(date="2025-03-01")["status"], "notFound")
+
+    async def test_previous_puzzle_is_found_in_the_archive(self):
+        """Without an explicit previous id, a puzzle archived on an earlier date counts as the old one"""
+        get_archive().add(load_game(self.game_response), "2025-02-28")
+        self.publish_after = 1
+
+        result = await warm_up(clock=self.clock, sleep=self.sleep)
+
+        self.assertEqual(result["status"], "warmed")
+        self.assertEqual(result["puzzleId"], 274)
+        self.assertEqual(latest_game.peek()["puzzleId"], 274)
+
+    async def test_already_warm(self):
+        """A fresh held puzzle that isn't the previous one needs no upstream calls"""
+        latest_game.set(load_game(self.game_response))
+        requests = self.stub.requests[GRAPHQL_PATH]
+
+        result = await warm_up(previous_id=272, clock=self.clock, sleep=self.sleep)
+
+        self.assertEqual(result, {"status": "alreadyWarm", "puzzleId": 273, "attempts": 0})
+        self.assertEqual(self.stub.requests[GRAPHQL_PATH], requests)
+
+
+if __name__ == "__main__":
+    unittest.main()